@@ -0,0 +1,110 @@
+"""Runs the offline benchmark suite and stores the results as JSON.
+
+Run from the repository root::
+
+    python -m benchmarks                      # writes benchmarks/results/<version>.json
+    python -m benchmarks --quick --only item_eager_1k
+    python -m benchmarks --compare benchmarks/results/0.1.2.json
+
+The exit status is 1 when a benchmark is over its budget in
+``suite.BUDGETS`` or, with ``--compare``, regressed by more than
+``--threshold``. ``--record`` refreshes the fixtures from the live API
+(needs ``BUFF163_COOKIE``).
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+
+from benchmarks import suite
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def package_version() -> str:
+    setup_py = os.path.join(os.path.dirname(__file__), os.pardir, "setup.py")
+    with open(setup_py) as f:
+        return re.search(r'version="([^"]+)"', f.read()).group(1)
+
+
+def record_fixtures(cookie: str) -> None:
+    """Captures the fixture responses from the live API."""
+    from buff163_unofficial_api.rest_adapter import RestAdapter
+
+    with RestAdapter(session_cookie=cookie) as adapter:
+        page = adapter._session.request(
+            method="GET",
+            url=adapter.url + "/market/goods",
+            params={"game": "csgo", "page_num": 1, "page_size": 80},
+        )
+        page.raise_for_status()
+        goods_id = json.loads(page.content)["data"]["items"][0]["id"]
+        info = adapter._session.request(
+            method="GET",
+            url=adapter.url + "/market/goods/info",
+            params={"game": "csgo", "goods_id": goods_id},
+        )
+        info.raise_for_status()
+    for name, response in (("market_page", page), ("goods_info", info)):
+        with open(os.path.join(suite.FIXTURES_DIR, f"{name}.json"), "wb") as f:
+            f.write(response.content)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations")
+    parser.add_argument("--only", nargs="+", choices=sorted(suite.BENCHMARKS))
+    parser.add_argument(
+        "--output", help="results file (default: results/<version>.json)"
+    )
+    parser.add_argument("--compare", help="baseline results file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--record", action="store_true", help="re-record fixtures")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        cookie = os.environ.get("BUFF163_COOKIE")
+        if not cookie:
+            parser.error("--record needs the BUFF163_COOKIE environment variable")
+        record_fixtures(cookie)
+
+    results = suite.run(args.only, quick=args.quick)
+    for name, result in results.items():
+        print(f"{name:<28} {result['value']:12.2f} {result['unit']}")
+
+    report = {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "quick": args.quick,
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['version']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"results written to {output}")
+
+    failed = False
+    for name, value, budget in suite.over_budget(results):
+        print(f"OVER BUDGET {name}: {value:.2f} > {budget:.2f}")
+        failed = True
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        for name in suite.missing(baseline, results):
+            print(f"NOT IN BASELINE {name}: run `python -m benchmarks` to refresh it")
+        regressions = suite.compare(baseline, results, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"REGRESSION {name}: {before:.2f} -> {after:.2f} ({change:+.0%})")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Decode time of one market page per installed JSON backend.
+
+Run from the repository root: ``python -m benchmarks.bench_json``
+"""
+
+import json
+import timeit
+
+from buff163_unofficial_api.json_decoder import available_backends
+from tests.payloads import make_item, make_page
+
+
+def main(page_size: int = 80, number: int = 2000):
+    content = json.dumps(make_page([make_item(i) for i in range(page_size)])).encode()
+    print(f"page of {page_size} items, {len(content)} bytes")
+    for name, decoder in available_backends().items():
+        best = min(timeit.repeat(lambda: decoder(content), number=number, repeat=5))
+        print(f"{name:<8} {best / number * 1e6:8.1f} us / page")
+
+
+if __name__ == "__main__":
+    main()
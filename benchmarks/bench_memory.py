@@ -0,0 +1,78 @@
+"""Resident bytes per Item, plain ``__dict__`` layout vs the slotted models.
+
+Run from the repository root: ``python -m benchmarks.bench_memory``
+"""
+
+import gc
+import tracemalloc
+
+from buff163_unofficial_api.models import Item
+from tests.payloads import make_item
+
+
+class _DictExterior:
+    def __init__(self, category, id, internal_name, localized_name):
+        self.category = category
+        self.id = id
+        self.internal_name = internal_name
+        self.localized_name = localized_name
+
+
+class _DictTags:
+    def __init__(self, exterior, quality, rarity, type, weapon):
+        self.exterior = _DictExterior(**exterior)
+        self.quality = _DictExterior(**quality)
+        self.rarity = _DictExterior(**rarity)
+        self.type = _DictExterior(**type)
+        self.weapon = _DictExterior(**weapon)
+
+
+class _DictInfo:
+    def __init__(self, tags):
+        self.tags = _DictTags(**tags)
+
+
+class _DictGoodsInfo:
+    def __init__(
+        self, icon_url, info, original_icon_url, steam_price, steam_price_cny, **kwargs
+    ):
+        self.icon_url = icon_url
+        self.info = _DictInfo(**info)
+        self.original_icon_url = original_icon_url
+        self.steam_price = steam_price
+        self.steam_price_cny = steam_price_cny
+        self.__dict__.update(kwargs)
+
+
+class _DictItem:
+    """Item as laid out before the models were slotted."""
+
+    def __init__(self, goods_info, data=bytes(), **kwargs):
+        self.goods_info = _DictGoodsInfo(**goods_info)
+        self.data = data
+        self.__dict__.update(kwargs)
+
+
+def bytes_per_item(model, rows) -> float:
+    gc.collect()
+    tracemalloc.start()
+    items = [model(**row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / len(rows)
+
+
+def main(count: int = 10_000):
+    rows = [make_item(i) for i in range(count)]
+    layouts = (
+        ("dict", _DictItem),
+        ("slots", Item),
+        ("slots + lazy", lambda **row: Item(**row, lazy=True)),
+    )
+    for name, model in layouts:
+        print(f"{name:<14} {bytes_per_item(model, rows):8.0f} bytes / Item")
+
+
+if __name__ == "__main__":
+    main()
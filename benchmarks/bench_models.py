@@ -0,0 +1,43 @@
+"""Eager vs lazy Item construction, per 10k market rows.
+
+Run from the repository root: ``python -m benchmarks.bench_models``
+"""
+
+import timeit
+
+from buff163_unofficial_api.models import Item
+from tests.payloads import make_item
+
+ROWS = [make_item(i) for i in range(10_000)]
+
+
+def build_eager():
+    for row in ROWS:
+        item = Item(**row)
+        item.id, item.sell_min_price
+
+
+def build_lazy():
+    for row in ROWS:
+        item = Item(**row, lazy=True)
+        item.id, item.sell_min_price
+
+
+def build_lazy_and_read_tags():
+    for row in ROWS:
+        item = Item(**row, lazy=True)
+        item.goods_info.info.tags.weapon
+
+
+def main(repeat: int = 5):
+    for name, fn in (
+        ("eager", build_eager),
+        ("lazy", build_lazy),
+        ("lazy + tags read", build_lazy_and_read_tags),
+    ):
+        best = min(timeit.repeat(fn, number=1, repeat=repeat))
+        print(f"{name:<18} {best * 1000:8.1f} ms / 10k items")
+
+
+if __name__ == "__main__":
+    main()
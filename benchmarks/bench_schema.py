@@ -0,0 +1,34 @@
+"""Decoding a /market/goods/info response: json + SpecificItem(**data) vs
+the fastest JSON backend + schema.decode (which also types nested models).
+
+Run from the repository root: ``python -m benchmarks.bench_schema``
+"""
+
+import json
+import timeit
+
+from buff163_unofficial_api import schema
+from buff163_unofficial_api.json_decoder import get_decoder
+from buff163_unofficial_api.models import SpecificItem
+from tests.payloads import make_specific_item
+
+CONTENT = json.dumps({"code": "OK", "data": make_specific_item(900565)}).encode()
+DECODE = get_decoder()
+
+
+def two_step():
+    return SpecificItem(**json.loads(CONTENT)["data"])
+
+
+def typed():
+    return schema.decode(SpecificItem, DECODE(CONTENT)["data"])
+
+
+def main(number: int = 20_000):
+    for name, fn in (("json + **kwargs", two_step), ("schema.decode", typed)):
+        best = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{name:<16} {best / number * 1e6:8.1f} us / response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""Offline benchmarks of the client hot paths, run by ``python -m benchmarks``.
+
+Every benchmark runs against the payloads recorded in ``benchmarks/fixtures``
+with the network replaced by an in-process transport, so results only depend
+on the code under test. Each benchmark returns ``(value, unit)``; the unit
+tells whether lower or higher is better.
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import requests
+
+from buff163_unofficial_api import schema
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cookie_pool import CookiePool
+from buff163_unofficial_api.crawler import Crawler
+from buff163_unofficial_api.fake_server import FakeBuff163Server, FakeMarket, constant
+from buff163_unofficial_api.instrumentation import Metrics
+from buff163_unofficial_api.json_decoder import available_backends, get_decoder
+from buff163_unofficial_api.models import Item, SpecificItem
+from buff163_unofficial_api.rest_adapter import RestAdapter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Units where a larger value is an improvement
+HIGHER_IS_BETTER = {"items/s", "pages/s"}
+# Upper bounds checked by ``python -m benchmarks``, in each benchmark's unit
+BUDGETS = {
+    "import_time[package]": 5.0,
+    "import_time[models]": 30.0,
+    "import_time[Buff163API]": 100.0,
+}
+
+BENCHMARKS: Dict[str, Callable[[bool], Tuple[float, str]]] = {}
+
+
+def benchmark(name: str):
+    """Registers a benchmark ``fn(quick) -> (value, unit)`` under ``name``."""
+
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+
+    return register
+
+
+def load_fixture(name: str) -> bytes:
+    """Gets the raw response body recorded as ``fixtures/<name>.json``."""
+    with open(os.path.join(FIXTURES_DIR, f"{name}.json"), "rb") as f:
+        return f.read()
+
+
+def best_per_call(fn: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Best of ``repeat`` runs, in seconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def make_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = content
+    return response
+
+
+class FakeTransport:
+    def __init__(self, pages: Dict[int, bytes], latency: float = 0.0) -> None:
+        """Stands in for ``requests.Session.request``, serving canned pages.
+
+        Args:
+            pages (Dict[int, bytes]): Response body per page_num.
+            latency (float, optional): Seconds slept per request. Defaults to 0.0.
+        """
+        self.pages = pages
+        self.latency = latency
+
+    def __call__(self, method, url, params=None, **kwargs) -> requests.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return make_response(self.pages[(params or {}).get("page_num", 1)])
+
+
+def market_pages(total_page: int) -> Dict[int, bytes]:
+    """The recorded market page replayed as pages 1..total_page."""
+    body = json.loads(load_fixture("market_page"))
+    pages = {}
+    for page_num in range(1, total_page + 1):
+        body["data"]["page_num"] = page_num
+        body["data"]["total_page"] = total_page
+        pages[page_num] = json.dumps(body).encode()
+    return pages
+
+
+def _rest_adapter_do(hooks) -> Callable[[bool], Tuple[float, str]]:
+    def run(quick: bool) -> Tuple[float, str]:
+        # A minimal body, so the decode of a full page does not hide the overhead
+        adapter = RestAdapter(max_retries=0, coalesce=False, hooks=hooks)
+        adapter._session.request = FakeTransport({1: b'{"code": "OK", "data": {}}'})
+        per_call = best_per_call(
+            lambda: adapter._do("GET", "/market/goods"), 200 if quick else 2000
+        )
+        return per_call * 1e6, "us/call"
+
+    return run
+
+
+benchmark("rest_adapter_do")(_rest_adapter_do(None))
+benchmark("rest_adapter_do_metrics")(_rest_adapter_do([Metrics()]))
+
+
+def _json_decode(backend: str) -> Callable[[bool], Tuple[float, str]]:
+    def run(quick: bool) -> Tuple[float, str]:
+        decoder = available_backends()[backend]
+        content = load_fixture("market_page")
+        per_call = best_per_call(lambda: decoder(content), 200 if quick else 2000)
+        return per_call * 1e6, "us/page"
+
+    return run
+
+
+for _backend in available_backends():
+    benchmark(f"json_decode[{_backend}]")(_json_decode(_backend))
+
+
+def _market_rows(count: int) -> list:
+    rows = get_decoder()(load_fixture("market_page"))["data"]["items"]
+    return [rows[i % len(rows)] for i in range(count)]
+
+
+@benchmark("item_eager_1k")
+def bench_item_eager(quick: bool) -> Tuple[float, str]:
+    rows = _market_rows(1000)
+    per_call = best_per_call(lambda: [Item(**row) for row in rows], 3 if quick else 20)
+    return per_call * 1e3, "ms/1k"
+
+
+@benchmark("item_lazy_1k")
+def bench_item_lazy(quick: bool) -> Tuple[float, str]:
+    rows = _market_rows(1000)
+    per_call = best_per_call(
+        lambda: [Item(**row, lazy=True) for row in rows], 3 if quick else 20
+    )
+    return per_call * 1e3, "ms/1k"
+
+
+@benchmark("specific_item_schema_1k")
+def bench_specific_item(quick: bool) -> Tuple[float, str]:
+    data = get_decoder()(load_fixture("goods_info"))["data"]
+    per_call = best_per_call(
+        lambda: [schema.decode(SpecificItem, data) for _ in range(1000)],
+        1 if quick else 5,
+    )
+    return per_call * 1e3, "ms/1k"
+
+
+def _page_throughput(read_ahead: int) -> Callable[[bool], Tuple[float, str]]:
+    def run(quick: bool) -> Tuple[float, str]:
+        total_page = 4 if quick else 10
+        api = Buff163API(page_size=80, read_ahead=read_ahead, max_retries=0)
+        api._rest_adapter._session.request = FakeTransport(
+            market_pages(total_page), latency=0.02
+        )
+        start = time.perf_counter()
+        count = sum(1 for _ in api.get_featured_market_paged(total_page * 80))
+        return count / (time.perf_counter() - start), "items/s"
+
+    return run
+
+
+benchmark("page_sequential_20ms")(_page_throughput(0))
+benchmark("page_prefetch_20ms")(_page_throughput(4))
+
+
+@benchmark("page_prefetch_http_20ms")
+def bench_page_http(quick: bool) -> Tuple[float, str]:
+    # Same as page_prefetch_20ms, through real sockets to the local fake server
+    rows = get_decoder()(load_fixture("market_page"))["data"]["items"]
+    total_page = 4 if quick else 10
+    market = FakeMarket.from_rows(
+        dict(rows[i % len(rows)], id=i) for i in range(total_page * 80)
+    )
+    with FakeBuff163Server(market, latency=constant(0.02)) as server:
+        with Buff163API(hostname=server.hostname, page_size=80) as api:
+            start = time.perf_counter()
+            count = sum(1 for _ in api.get_featured_market_paged(total_page * 80))
+            return count / (time.perf_counter() - start), "items/s"
+
+
+def _crawl_cookies(accounts: int) -> Callable[[bool], Tuple[float, str]]:
+    def run(quick: bool) -> Tuple[float, str]:
+        # Every account may send 25 requests/s, enforced on both sides; kept well
+        # under what one client reaches unthrottled so the pool is the bottleneck
+        pages = 50 if quick else 200
+        cookies = [f"session=account-{i}" for i in range(accounts)]
+        market = FakeMarket(items_per_category=pages // 2, categories=["a", "b"])
+        with FakeBuff163Server(market, max_rps_per_cookie=25) as server:
+            pool = CookiePool(cookies, rate=25, burst=1)
+            with Buff163API(
+                hostname=server.hostname, page_size=1, session_cookies=pool
+            ) as api, tempfile.TemporaryDirectory() as tmp:
+                crawler = api.crawl(
+                    os.path.join(tmp, "crawl.jsonl"), ["a", "b"], concurrency=8
+                )
+                sum(1 for _ in crawler)
+                return crawler.stats()["pages_per_second"], "pages/s"
+
+    return run
+
+
+benchmark("crawl_cookies[1]")(_crawl_cookies(1))
+benchmark("crawl_cookies[4]")(_crawl_cookies(4))
+
+
+def _top_level_imports(code: str) -> Dict[str, int]:
+    """Cumulative microseconds per top-level import of a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT_DIR,
+    )
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented below their parent
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def import_time(code: str, repeat: int = 5) -> float:
+    """Milliseconds spent importing modules for ``code``, best of ``repeat``.
+
+    Parsed from ``python -X importtime``; imports done by interpreter
+    startup (site, encodings) are left out.
+    """
+    startup = _top_level_imports("pass")
+    best = None
+    for _ in range(repeat):
+        imports = _top_level_imports(code)
+        total = sum(us for name, us in imports.items() if name not in startup)
+        best = total if best is None else min(best, total)
+    return best / 1e3
+
+
+def _import_time(code: str) -> Callable[[bool], Tuple[float, str]]:
+    def run(quick: bool) -> Tuple[float, str]:
+        return import_time(code, 3 if quick else 7), "ms"
+
+    return run
+
+
+benchmark("import_time[package]")(_import_time("import buff163_unofficial_api"))
+benchmark("import_time[models]")(
+    _import_time("from buff163_unofficial_api.models import Item")
+)
+benchmark("import_time[Buff163API]")(
+    _import_time("from buff163_unofficial_api import Buff163API")
+)
+
+
+@benchmark("crawl_peak_memory_100k")
+def bench_crawl_memory(quick: bool) -> Tuple[float, str]:
+    items = 10_000 if quick else 100_000
+    decoder = get_decoder()
+    content = load_fixture("market_page")
+    per_page = len(decoder(content)["data"]["items"])
+    total_page = -(-items // per_page)
+
+    def fetch_page(category: str, page: int) -> dict:
+        data = decoder(content)["data"]
+        for i, row in enumerate(data["items"]):
+            row["id"] = page * per_page + i
+        data["page_num"] = page
+        data["total_page"] = total_page
+        return data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        crawler = Crawler(
+            fetch_page, os.path.join(tmp, "crawl.jsonl"), categories=["bench"]
+        )
+        gc.collect()
+        tracemalloc.start()
+        kept = [Item(**row, lazy=True) for row in crawler]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    del kept
+    return peak / 2**20, "MiB"
+
+
+def run(names=None, quick: bool = False) -> Dict[str, Dict]:
+    """Runs the selected benchmarks (all by default).
+
+    Returns:
+        Dict[str, Dict]: ``{"value", "unit"}`` per benchmark name.
+    """
+    results = {}
+    for name, fn in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        value, unit = fn(quick)
+        results[name] = {"value": value, "unit": unit}
+    return results
+
+
+def over_budget(results: Dict[str, Dict]):
+    """Lists benchmarks above their entry in BUDGETS.
+
+    Returns:
+        list: ``(name, value, budget)``.
+    """
+    return [
+        (name, result["value"], BUDGETS[name])
+        for name, result in results.items()
+        if name in BUDGETS and result["value"] > BUDGETS[name]
+    ]
+
+
+def compare(baseline: Dict[str, Dict], current: Dict[str, Dict], threshold: float):
+    """Lists benchmarks that got worse than ``baseline`` by more than ``threshold``.
+
+    Returns:
+        list: ``(name, baseline value, current value, change)``, change as a fraction.
+    """
+    regressions = []
+    for name, result in current.items():
+        before = baseline.get(name)
+        if before is None or before["unit"] != result["unit"] or not before["value"]:
+            continue
+        change = result["value"] / before["value"] - 1
+        worse = -change if result["unit"] in HIGHER_IS_BETTER else change
+        if worse > threshold:
+            regressions.append((name, before["value"], result["value"], change))
+    return regressions
+
+
+def missing(baseline: Dict[str, Dict], current: Dict[str, Dict]) -> List[str]:
+    """Lists benchmarks ``compare`` cannot check: absent from ``baseline`` or in another unit."""
+    return [
+        name
+        for name, result in current.items()
+        if name not in baseline or baseline[name]["unit"] != result["unit"]
+    ]
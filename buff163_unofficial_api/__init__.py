@@ -1 +1,48 @@
-from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+"""Unofficial API wrapper for Buff163.
+
+The clients are imported on first access, so ``import buff163_unofficial_api``
+does not load requests, aiohttp or the models until they are used.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+    from buff163_unofficial_api.async_buff163_api import AsyncBuff163API
+
+# Public name: module defining it
+_LAZY = {
+    "Buff163API": "buff163_unofficial_api.buff163_unofficial_api",
+    "AsyncBuff163API": "buff163_unofficial_api.async_buff163_api",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    import importlib
+
+    module = _LAZY.get(name)
+    if module is None:
+        # Submodules, e.g. buff163_unofficial_api.cs_enums after a plain import
+        if not _is_submodule(name):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        return importlib.import_module(f"{__name__}.{name}")
+
+    value = getattr(importlib.import_module(module), name)
+    # Cached, so __getattr__ runs once per name
+    globals()[name] = value
+    return value
+
+
+def _is_submodule(name: str) -> bool:
+    import importlib.util
+
+    return (
+        not name.startswith("_")
+        and importlib.util.find_spec(f"{__name__}.{name}") is not None
+    )
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+from json.decoder import JSONDecodeError
+from typing import Dict, Union
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.json_decoder import JSONDecoder, get_decoder
+from buff163_unofficial_api.models import Result
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class AsyncRestAdapter:
+    def __init__(
+        self,
+        hostname: str = "buff.163.com/api",
+        session_cookie: str = "",
+        ssl_verify: bool = True,
+        logger: logging.Logger = None,
+        max_concurrency: int = 10,
+        pool_maxsize: int = 100,
+        headers: Dict = None,
+        json_decoder: Union[str, JSONDecoder] = None,
+    ) -> None:
+        """Constructor for AsyncRestAdapter
+
+        The aiohttp session is created lazily inside the running event loop and
+        reused for every request. A semaphore bounds how many requests are in
+        flight at once.
+
+        Args:
+            hostname (str): Api url, https unless a scheme is given. Defaults to "buff.163.com/api".
+            session_cookie (str, optional): Used for authentication. Defaults to "".
+            ssl_verify (bool, optional): Set to false if having SSL/TLS cert validation issues. Defaults to True.
+            logger (logging.Logger, optional): App logger. Defaults to None.
+            max_concurrency (int, optional): Max requests in flight at once. Defaults to 10.
+            pool_maxsize (int, optional): Max open connections in the pool. Defaults to 100.
+            headers (Dict, optional): Extra default headers sent with every request. Defaults to None.
+            json_decoder (Union[str, JSONDecoder], optional): JSON backend name or bytes decoder. Defaults to the fastest installed.
+
+        Raises:
+            ImportError: aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncRestAdapter requires aiohttp, "
+                "install it with `pip install buff163-unofficial-api[async]`"
+            )
+        self._logger = logger or logging.getLogger(__name__)
+        # A scheme may be given to target plain HTTP, e.g. a local fake server
+        self.url = hostname if "://" in hostname else f"https://{hostname}"
+        self._session_cookie = session_cookie
+        self._ssl_verify = ssl_verify
+        self._max_concurrency = max_concurrency
+        self._pool_maxsize = pool_maxsize
+        self._headers = dict(headers or {})
+        self._auth_headers = {"Cookie": session_cookie}
+        self._json_decoder = get_decoder(json_decoder)
+        self._session = None
+        self._semaphore = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_maxsize, ssl=None if self._ssl_verify else False
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers=self._headers
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the session and every pooled connection."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncRestAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _do(
+        self, http_method: str, endpoint: str, ep_params: Dict = None, data: Dict = None
+    ) -> Result:
+        """Private coroutine for api requests (GET, POST, DELETE, etc.)
+
+        Args:
+            http_method (str): GET, POST, DELETE, etc.
+            endpoint (str): URL endpoint
+            ep_params (Dict, optional): Endpoint parameters. Defaults to None.
+            data (Dict, optional): Data to pass to Buff163API. Defaults to None.
+
+        Raises:
+            Buff163Exception: Requests fail
+            Buff163Exception: Bad JSON
+            Buff163Exception: Error response code
+
+        Returns:
+            Result: status_code, message, data
+        """
+        full_url = self.url + endpoint
+        session = self._get_session()
+
+        log_line_pre = f"method={http_method}, url={full_url}, params={ep_params}"
+        # Braces in the params dict must not end up in the format string
+        log_line_post = "{}, success={}, status_code={}, message={}"
+        try:
+            self._logger.debug(msg=log_line_pre)
+            async with self._semaphore:
+                async with session.request(
+                    method=http_method,
+                    url=full_url,
+                    headers=self._auth_headers,
+                    params=ep_params,
+                    json=data,
+                ) as response:
+                    status_code, reason = response.status, response.reason
+                    body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._logger.error(msg=(str(e)))
+            raise Buff163Exception("Request failed") from e
+
+        try:
+            data_out = self._json_decoder(body)
+        except (ValueError, JSONDecodeError) as e:
+            self._logger.error(msg=log_line_post.format(log_line_pre, False, None, e))
+            raise Buff163Exception("Bad JSON in response") from e
+
+        if data_out["code"] != "OK":
+            self._logger.error(
+                msg=log_line_post.format(log_line_pre, False, 401, "Login Required")
+            )
+            raise Buff163Exception("Login is required")
+
+        log_line = log_line_post.format(
+            log_line_pre, 299 >= status_code >= 200, status_code, reason
+        )
+        if 299 >= status_code >= 200:
+            self._logger.debug(msg=log_line)
+            return Result(status_code, message=reason, data=data_out)
+        self._logger.error(msg=log_line)
+        raise Buff163Exception(f"{status_code}: {reason}")
+
+    async def get(self, endpoint: str, ep_params: Dict = None) -> Result:
+        """Sends a GET request to a specified API endpoint.
+
+        Args:
+            endpoint (str): The endpoint for the GET request.
+            ep_params (Dict, optional): Parameters to include in request. Defaults to None.
+
+        Returns:
+            Result: status_code, message, data
+        """
+        return await self._do(http_method="GET", endpoint=endpoint, ep_params=ep_params)
+
+    async def post(
+        self, endpoint: str, ep_params: Dict = None, data: Dict = None
+    ) -> Result:
+        """Sends a POST request to a specified API endpoint.
+
+        Args:
+            endpoint (str): The endpoint for the POST request.
+            ep_params (Dict, optional): Parameters to include in the request. Defaults to None.
+            data (Dict, optional): Data passed in the request. Defaults to None.
+
+        Returns:
+            Result: status_code, message, data
+        """
+        return await self._do(
+            http_method="POST", endpoint=endpoint, ep_params=ep_params, data=data
+        )
+
+    async def delete(
+        self, endpoint: str, ep_params: Dict = None, data: Dict = None
+    ) -> Result:
+        """Sends a DELETE request to a specified API endpoint.
+
+        Args:
+            endpoint (str): The endpoint for the DELETE request.
+            ep_params (Dict, optional): Parameters to include in the request. Defaults to None.
+            data (Dict, optional): Data passed in the request. Defaults to None.
+
+        Returns:
+            Result: status_code, message, data
+        """
+        return await self._do(
+            http_method="DELETE", endpoint=endpoint, ep_params=ep_params, data=data
+        )
+
+    async def fetch_data(self, url: str) -> bytes:
+        """Fetches raw data from url.
+
+        Args:
+            url (str): Url of fetch request.
+
+        Raises:
+            Buff163Exception: Request failure.
+            Buff163Exception: Status code not valid.
+
+        Returns:
+            bytes: Data in bytes (mainly for images).
+        """
+        session = self._get_session()
+        try:
+            self._logger.debug(msg=f"method=GET, url={url}")
+            async with self._semaphore:
+                # The session cookie is only attached to API calls, never to the icon CDN
+                async with session.get(url) as response:
+                    status_code, reason = response.status, response.reason
+                    content = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._logger.error(msg=(str(e)))
+            raise Buff163Exception(str(e)) from e
+
+        is_success = 299 >= status_code >= 200
+        log_line = f"success={is_success}, status_code={status_code}, message={reason}"
+        self._logger.debug(msg=log_line)
+        if not is_success:
+            raise Buff163Exception(reason)
+        return content
@@ -1,9 +1,26 @@
 import logging
-from typing import Iterator, Callable, Union
+import time
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Callable, Union
 from buff163_unofficial_api.rest_adapter import RestAdapter
+from buff163_unofficial_api import schema
 from buff163_unofficial_api.models import *
 from buff163_unofficial_api.cs_enums import *
 
+# Features beyond plain requests are imported by the methods using them
+if TYPE_CHECKING:
+    from buff163_unofficial_api.bulk import ItemBatch
+    from buff163_unofficial_api.cache import ResponseCache
+    from buff163_unofficial_api.cookie_pool import CookiePool
+    from buff163_unofficial_api.crawler import Crawler
+    from buff163_unofficial_api.icon_store import IconStore
+    from buff163_unofficial_api.instrumentation import Hook
+    from buff163_unofficial_api.market_frame import MarketFrame
+    from buff163_unofficial_api.rate_limiter import RateLimiter
+    from buff163_unofficial_api.watcher import MarketWatcher
+
 
 class Buff163API:
     def __init__(
@@ -13,18 +30,103 @@ class Buff163API:
         ssl_verify: bool = True,
         logger: logging.Logger = None,
         page_size: int = 20,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_workers: int = 4,
+        read_ahead: int = 4,
+        rate_limiter: "RateLimiter" = None,
+        max_retries: int = 3,
+        cache: "ResponseCache" = None,
+        lazy_models: bool = False,
+        json_decoder: str = None,
+        hooks: Iterable["Hook"] = None,
+        session_cookies: Union["CookiePool", Iterable[str]] = None,
     ):
         """Buff163API default constructor.
 
         Args:
-            hostname (str, optional): API url. Defaults to "buff.163.com/api".
+            hostname (str, optional): API url, https unless a scheme is given (e.g. "http://127.0.0.1:8163/api"). Defaults to "buff.163.com/api".
             session_cookie (str, optional): Personal session cookie (like an api token). Defaults to "".
             ssl_verify (bool, optional): Set to false if having SSL/TLS cert validation issues. Defaults to True.
             logger (logging.Logger, optional): App logger. Defaults to None.
             page_size (int, optional): Items per page. Defaults to 20.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Max connections kept alive per host. Defaults to 10.
+            max_workers (int, optional): Threads used to prefetch pages while paging, one still overlaps fetching with the consumer. Defaults to 4.
+            read_ahead (int, optional): Pages fetched ahead of the consumer, 0 pages sequentially. Defaults to 4.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter for every request. Defaults to None.
+            max_retries (int, optional): Retries for throttled/failed requests. Defaults to 3.
+            cache (ResponseCache, optional): Response cache for GET requests. Defaults to None.
+            lazy_models (bool, optional): Build nested Item fields only on first access. Defaults to False.
+            json_decoder (str, optional): JSON backend ("orjson", "msgspec", "ujson", "json"). Defaults to the fastest installed.
+            hooks (Iterable[Hook], optional): Called with a RequestEvent per request, model build time included (e.g. a Metrics). Defaults to None.
+            session_cookies (Union[CookiePool, Iterable[str]], optional): Several accounts to rotate between instead of session_cookie, e.g. a CookiePool with a per-cookie rate. Defaults to None.
         """
-        self._rest_adapter = RestAdapter(hostname, session_cookie, ssl_verify, logger)
+        self._rest_adapter = RestAdapter(
+            hostname,
+            session_cookie,
+            ssl_verify,
+            logger,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
+            cache=cache,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            session_cookies=session_cookies,
+        )
+        # Shared with the adapter, so hooks appended later are seen by both
+        self.hooks = self._rest_adapter.hooks
         self._page_size = page_size
+        self._item_model = partial(Item, lazy=True) if lazy_models else Item
+        self._max_workers = max_workers
+        self._read_ahead = read_ahead
+        self._logger = logger or logging.getLogger(__name__)
+
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self._rest_adapter.close()
+
+    def __enter__(self) -> "Buff163API":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get(
+        self, endpoint: str, build: Callable[[dict], Model], ep_params: Dict = None
+    ) -> Model:
+        """GETs an endpoint and builds models from its "data" payload.
+
+        With hooks registered, the build time is added to the request's event
+        before the hooks see it.
+
+        Args:
+            endpoint (str): API endpoint requested.
+            build (Callable[[dict], Model]): Turns the payload into models.
+            ep_params (Dict, optional): Endpoint parameters. Defaults to None.
+
+        Returns:
+            Model: Whatever ``build`` returns.
+        """
+        kwargs = {"endpoint": endpoint}
+        if ep_params is not None:
+            kwargs["ep_params"] = ep_params
+        if not self.hooks:
+            return build(self._rest_adapter.get(**kwargs).data["data"])
+
+        with self._rest_adapter.deferred_events() as events:
+            result = self._rest_adapter.get(**kwargs)
+            start = time.perf_counter()
+            built = build(result.data["data"])
+            # Nothing to time when the response came from the cache
+            if events:
+                events[-1].build = time.perf_counter() - start
+        return built
+
+    def _build_items(self, data: dict) -> List[Item]:
+        return [self._item_model(**item) for item in data["items"]]
 
     def get_featured_market_item(self) -> Item:
         """Get first featured market item (random).
@@ -43,11 +145,9 @@ class Buff163API:
         Returns:
             List[Item]: List of overview of items.
         """
-        result = self._rest_adapter.get(
-            endpoint=f"/market/goods?game=csgo&page_num={pageNum}"
+        return self._get(
+            f"/market/goods?game=csgo&page_num={pageNum}", self._build_items
         )
-        market = [Item(**item) for item in result.data["data"]["items"]]
-        return market
 
     def get_item_market(
         self,
@@ -66,13 +166,11 @@ class Buff163API:
         if not isinstance(category, Enum):
             raise TypeError("Category must be an instance of an Enum.")
 
-        result = self._rest_adapter.get(
-            endpoint=f"/market/goods?game=csgo&page_num={pageNum}&category={category.value}"
+        return self._get(
+            f"/market/goods?game=csgo&page_num={pageNum}&category={category.value}",
+            self._build_items,
         )
 
-        market = [Item(**item) for item in result.data["data"]["items"]]
-        return market
-
     def fetch_image_data(self, item: Item):
         """Fetches Item icon.
 
@@ -81,41 +179,153 @@ class Buff163API:
         """
         item.data = self._rest_adapter.fetch_data(url=item.goods_info.icon_url)
 
+    def fetch_images(
+        self,
+        items: Iterable[Item],
+        dest_dir: Union[str, "IconStore"] = "./icons",
+        concurrency: int = 8,
+    ) -> Dict[str, int]:
+        """Downloads Item icons to disk, setting ``item.icon_path`` instead of ``item.data``.
+
+        Each unique ``icon_url`` is fetched once and streamed to disk in
+        chunks. Icons are stored by content hash in an IconStore, and urls
+        already in the store are not downloaded again.
+
+        Args:
+            items (Iterable[Item]): Items from market.
+            dest_dir (Union[str, IconStore], optional): Store directory or IconStore. Defaults to "./icons".
+            concurrency (int, optional): Downloads in flight at once. Defaults to 8.
+
+        Returns:
+            Dict[str, int]: Counts of urls downloaded, cached (already on disk) and failed.
+        """
+        from buff163_unofficial_api.icon_store import IconStore
+
+        store = dest_dir if isinstance(dest_dir, IconStore) else IconStore(dest_dir)
+        by_url = {}
+        for item in items:
+            by_url.setdefault(item.goods_info.icon_url, []).append(item)
+
+        paths = {}
+        to_fetch = []
+        for url in by_url:
+            path = store.path_for(url)
+            if path is None:
+                to_fetch.append(url)
+            else:
+                paths[url] = path
+        cached = len(paths)
+
+        def download(url):
+            return url, store.put(url, self._rest_adapter.stream_data(url))
+
+        failed = 0
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(download, url) for url in to_fetch]
+                for future in as_completed(futures):
+                    try:
+                        url, path = future.result()
+                    except Exception as e:
+                        self._logger.warning(msg=f"icon download failed: {e}")
+                        failed += 1
+                        continue
+                    paths[url] = path
+
+        for url, path in paths.items():
+            for item in by_url[url]:
+                item.icon_path = path
+        return {
+            "downloaded": len(paths) - cached,
+            "cached": cached,
+            "failed": failed,
+        }
+
     def _page(
-        self, endpoint: str, model: Callable[..., Model], max_amt: int = 80
+        self,
+        endpoint: str,
+        model: Callable[..., Model],
+        max_amt: int = 80,
+        ep_params: Dict = None,
     ) -> Iterator[Model]:
         """Pages through set number of pages.
 
+        Once the first page reports ``total_page``, the following pages are
+        prefetched on a worker pool, keeping up to ``read_ahead`` requests in
+        flight. Models are still yielded in page order and outstanding fetches
+        are cancelled when the consumer stops iterating.
+
         Args:
             endpoint (str): API endpoint requested.
             model (Callable[..., Model]): Specific model that will be paged.
             max_amt (int, optional): Max items to get from pages. Defaults to 80.
+            ep_params (Dict, optional): Extra endpoint parameters (e.g. category). Defaults to None.
 
         Yields:
             Iterator[Model]: List of specific model.
         """
-        amt_yielded = 0
-        curr_page = last_page = 1
-        ep_params = {
+        base_params = {
             "game": "csgo",
             "page_size": self._page_size,
+            **(ep_params or {}),
         }
 
-        # Keep fetching pages until the last page
-        while curr_page <= last_page:
-            ep_params["page_num"] = curr_page
-            result = self._rest_adapter.get(endpoint=endpoint, ep_params=ep_params)
-            data = result.data["data"]
-
-            # Increment curr_page by 1 and update the last_page based on header info returned
-            last_page = data["total_page"]
-            curr_page = data["page_num"] + 1
-            for datam in data["items"]:
-                yield model(**datam)
-                amt_yielded += 1
-                if amt_yielded >= max_amt:
-                    last_page = 0
-                    break
+        def fetch_page(page_num: int) -> dict:
+            # Models are built on the fetching thread, so prefetched pages come ready
+            params = dict(base_params, page_num=page_num)
+            return self._get(endpoint, build_page, params)
+
+        def build_page(data: dict) -> dict:
+            return dict(data, items=[model(**datam) for datam in data["items"]])
+
+        data = fetch_page(1)
+        last_page = min(data["total_page"], -(-max_amt // self._page_size))
+        if self._read_ahead < 1 or self._max_workers < 1:
+            pages = self._sequential_pages(data, fetch_page, last_page)
+        else:
+            pages = self._prefetched_pages(data, fetch_page, last_page)
+
+        amt_yielded = 0
+        try:
+            for data in pages:
+                for built in data["items"]:
+                    yield built
+                    amt_yielded += 1
+                    if amt_yielded >= max_amt:
+                        return
+        finally:
+            pages.close()
+
+    @staticmethod
+    def _sequential_pages(
+        first: dict, fetch_page: Callable[[int], dict], last_page: int
+    ) -> Iterator[dict]:
+        """Yields page payloads one round-trip after another."""
+        data = first
+        yield data
+        while data["page_num"] < last_page:
+            data = fetch_page(data["page_num"] + 1)
+            yield data
+
+    def _prefetched_pages(
+        self, first: dict, fetch_page: Callable[[int], dict], last_page: int
+    ) -> Iterator[dict]:
+        """Yields page payloads in order while fetching the next ones in parallel."""
+        yield first
+        next_page = first["page_num"] + 1
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            while pending or next_page <= last_page:
+                # Keep the read-ahead window full
+                while next_page <= last_page and len(pending) < self._read_ahead:
+                    pending.append(executor.submit(fetch_page, next_page))
+                    next_page += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def get_featured_market_paged(self, max_amt: int = 80) -> Iterator[Item]:
         """Page the featured market
@@ -129,7 +339,149 @@ class Buff163API:
         Yields:
             Iterator[Item]: List of Items
         """
-        return self._page(endpoint="/market/goods", model=Item, max_amt=max_amt)
+        return self._page(
+            endpoint="/market/goods", model=self._item_model, max_amt=max_amt
+        )
+
+    def get_item_market_paged(
+        self,
+        category: Union[Knife, Gun, Glove, Agent, Sticker, OtherItem],
+        max_amt: int = 80,
+    ) -> Iterator[Item]:
+        """Page a specific item's market.
+
+        Args:
+            category (enum): the specific category of cs items.
+            max_amt (int, optional): Amount of Items to get. Defaults to 80.
+
+        Returns:
+            Iterator[Item]: Items in page order.
+        """
+        if not isinstance(category, Enum):
+            raise TypeError("Category must be an instance of an Enum.")
+
+        return self._page(
+            endpoint="/market/goods",
+            model=self._item_model,
+            max_amt=max_amt,
+            ep_params={"category": category.value},
+        )
+
+    def fetch_market_page(self, category: str, page_num: int) -> dict:
+        """Gets the raw "data" payload of one market page of a category.
+
+        Args:
+            category (str): Category value, e.g. Knife.KARAMBIT.value.
+            page_num (int): Page number, from 1.
+
+        Returns:
+            dict: Payload with "items", "page_num" and "total_page".
+        """
+        params = {
+            "game": "csgo",
+            "page_num": page_num,
+            "page_size": self._page_size,
+            "category": category,
+        }
+        result = self._rest_adapter.get(endpoint="/market/goods", ep_params=params)
+        return result.data["data"]
+
+    def crawl(
+        self,
+        checkpoint: str = "buff163_crawl.jsonl",
+        categories: Iterable[Enum] = None,
+        concurrency: int = 4,
+    ) -> "Crawler":
+        """Crawls the market of every category, resuming from a checkpoint.
+
+        Args:
+            checkpoint (str, optional): Checkpoint file of finished (category, page) units. Defaults to "buff163_crawl.jsonl".
+            categories (Iterable[Enum], optional): Categories to crawl. Defaults to every cs_enums member.
+            concurrency (int, optional): Pages in flight at once. Defaults to 4.
+
+        Returns:
+            Crawler: Iterator of raw market rows (each goods id once), with stats().
+        """
+        from buff163_unofficial_api.crawler import Crawler
+
+        return Crawler(
+            self.fetch_market_page,
+            checkpoint,
+            categories=categories,
+            concurrency=concurrency,
+            logger=self._logger,
+        )
+
+    def watch_market(
+        self,
+        categories: Iterable[Enum] = None,
+        max_amt: int = 80,
+        fields: Iterable[str] = None,
+        on_change: Callable[[MarketChange], None] = None,
+    ) -> "MarketWatcher":
+        """Watches market pages for new, changed and removed items.
+
+        Args:
+            categories (Iterable[Enum], optional): Categories to poll, the featured market when None. Defaults to None.
+            max_amt (int, optional): Max items polled per category. Defaults to 80.
+            fields (Iterable[str], optional): Row fields whose changes are reported. Defaults to watcher.WATCHED_FIELDS.
+            on_change (Callable[[MarketChange], None], optional): Called with every change. Defaults to None.
+
+        Returns:
+            MarketWatcher: Use poll() for one round or watch() for a feed.
+        """
+        categories = list(categories) if categories is not None else [None]
+
+        def fetch_rows() -> Iterator[dict]:
+            for category in categories:
+                ep_params = {"category": category.value} if category else None
+                yield from self._page(
+                    endpoint="/market/goods",
+                    model=dict,
+                    max_amt=max_amt,
+                    ep_params=ep_params,
+                )
+
+        from buff163_unofficial_api.watcher import WATCHED_FIELDS, MarketWatcher
+
+        return MarketWatcher(
+            fetch_rows,
+            model=self._item_model,
+            fields=fields if fields is not None else WATCHED_FIELDS,
+            on_change=on_change,
+            logger=self._logger,
+        )
+
+    def get_market_frame(
+        self,
+        category: Union[Knife, Gun, Glove, Agent, Sticker, OtherItem] = None,
+        max_amt: int = 80,
+    ) -> "MarketFrame":
+        """Pages a market into columns for vectorized filtering and sorting.
+
+        Rows go straight from the decoded pages into arrays, no Item is built.
+        Requires numpy.
+
+        Args:
+            category (enum, optional): Category to page, None for the featured market. Defaults to None.
+            max_amt (int, optional): Amount of rows to get. Defaults to 80.
+
+        Returns:
+            MarketFrame: Columnar market rows.
+        """
+        ep_params = None
+        if category is not None:
+            if not isinstance(category, Enum):
+                raise TypeError("Category must be an instance of an Enum.")
+            ep_params = {"category": category.value}
+
+        rows = self._page(
+            endpoint="/market/goods", model=dict, max_amt=max_amt, ep_params=ep_params
+        )
+        # Imported here, so numpy is only loaded by callers of this method
+        from buff163_unofficial_api.market_frame import MarketFrame
+
+        return MarketFrame.from_rows(rows)
 
     def get_item(self, item_id: int) -> SpecificItem:
         """Gets the description/details of an item.
@@ -140,8 +492,29 @@ class Buff163API:
         Returns:
             SpecificItem: Specific item.
         """
-        result = self._rest_adapter.get(
-            endpoint=f"/market/goods/info?game=csgo&goods_id={item_id}"
+        return self._get(
+            f"/market/goods/info?game=csgo&goods_id={item_id}",
+            partial(schema.decode, SpecificItem),
         )
 
-        return SpecificItem(**result.data["data"])
+    def get_items(
+        self, item_ids: Iterable[int], max_workers: int = 8, ordered: bool = False
+    ) -> "ItemBatch":
+        """Gets the details of many items concurrently over the shared pool.
+
+        Keep ``max_workers`` at or below ``pool_maxsize`` so every worker
+        reuses a pooled connection.
+
+        Args:
+            item_ids (Iterable[int]): goods_ids to fetch.
+            max_workers (int, optional): Requests in flight at once. Defaults to 8.
+            ordered (bool, optional): Yield in input order instead of as completed. Defaults to False.
+
+        Returns:
+            ItemBatch: Iterator of ItemResult (item or per-id error), with stats().
+        """
+        from buff163_unofficial_api.bulk import ItemBatch
+
+        return ItemBatch(
+            self.get_item, item_ids, max_workers=max_workers, ordered=ordered
+        )
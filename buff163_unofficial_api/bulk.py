@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator
+from buff163_unofficial_api.models import ItemResult, SpecificItem
+
+
+class ItemBatch:
+    def __init__(
+        self,
+        fetch: Callable[[int], SpecificItem],
+        ids: Iterable[int],
+        max_workers: int = 8,
+        ordered: bool = False,
+    ) -> None:
+        """Iterator over a concurrent bulk fetch of item details.
+
+        Requests start on the first ``next()``. A failed id yields an
+        ItemResult carrying the error instead of aborting the batch. Counters
+        and timing are updated as results are consumed; stopping early cancels
+        the requests not yet started.
+
+        Args:
+            fetch (Callable[[int], SpecificItem]): Fetches one goods_id.
+            ids (Iterable[int]): goods_ids to fetch.
+            max_workers (int, optional): Requests in flight at once. Defaults to 8.
+            ordered (bool, optional): Yield in input order instead of completion order. Defaults to False.
+        """
+        self._fetch = fetch
+        self._ids = list(ids)
+        self._max_workers = max_workers
+        self._ordered = ordered
+        self._results = self._run()
+        self.total = len(self._ids)
+        self.succeeded = 0
+        self.failed = 0
+        self.elapsed = 0.0
+        self.request_time = 0.0
+
+    def __iter__(self) -> "ItemBatch":
+        return self
+
+    def __next__(self) -> ItemResult:
+        return next(self._results)
+
+    def close(self) -> None:
+        """Stops the batch, cancelling requests not yet started."""
+        self._results.close()
+
+    def _fetch_one(self, goods_id: int) -> ItemResult:
+        start = time.perf_counter()
+        try:
+            item = self._fetch(goods_id)
+        except Exception as e:
+            return ItemResult(goods_id, error=e, elapsed=time.perf_counter() - start)
+        return ItemResult(goods_id, item=item, elapsed=time.perf_counter() - start)
+
+    def _run(self) -> Iterator[ItemResult]:
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        futures = [executor.submit(self._fetch_one, goods_id) for goods_id in self._ids]
+        try:
+            pending = futures if self._ordered else as_completed(futures)
+            for future in pending:
+                result = future.result()
+                if result.ok:
+                    self.succeeded += 1
+                else:
+                    self.failed += 1
+                self.request_time += result.elapsed
+                self.elapsed = time.perf_counter() - start
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, float]:
+        """Aggregate timing of the results consumed so far.
+
+        Returns:
+            Dict[str, float]: total, succeeded, failed, elapsed (wall clock seconds),
+            mean_latency (seconds per request) and items_per_second.
+        """
+        done = self.succeeded + self.failed
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed": self.elapsed,
+            "mean_latency": self.request_time / done if done else 0.0,
+            "items_per_second": done / self.elapsed if self.elapsed else 0.0,
+        }
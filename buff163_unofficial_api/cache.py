@@ -0,0 +1,250 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from buff163_unofficial_api.models import Result
+
+# Item metadata barely changes, market pages move constantly
+DEFAULT_TTLS = {
+    "/market/goods/info": 3600.0,
+    "/market/goods": 30.0,
+}
+
+
+class CacheEntry:
+    def __init__(self, result: Result, expires_at: float) -> None:
+        """Cached response.
+
+        Args:
+            result (Result): Decoded response.
+            expires_at (float): ``time.time()`` after which the entry is stale.
+        """
+        self.result = result
+        self.expires_at = expires_at
+
+
+class CacheBackend:
+    """Storage interface used by ResponseCache."""
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Thread-safe in-memory LRU backend.
+
+        Args:
+            maxsize (int, optional): Max entries kept, least recently used are evicted. Defaults to 1024.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    def __init__(self, path: str = "buff163_cache.sqlite3") -> None:
+        """Persistent backend that survives restarts.
+
+        Args:
+            path (str, optional): SQLite database file. Defaults to "buff163_cache.sqlite3".
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Imported here, so clients without a SQLiteCache never load sqlite3
+        import sqlite3
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, status_code INTEGER, message TEXT, "
+            "data TEXT, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, message, data, expires_at FROM cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, message, data, expires_at = row
+        return CacheEntry(Result(status_code, message, json.loads(data)), expires_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        result = entry.result
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    result.status_code,
+                    result.message,
+                    json.dumps(result.data),
+                    entry.expires_at,
+                ),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: CacheBackend = None,
+        ttls: Dict[str, float] = None,
+        default_ttl: float = 0.0,
+        stale_while_revalidate: float = 0.0,
+        logger: logging.Logger = None,
+    ) -> None:
+        """Response cache used by RestAdapter.get.
+
+        TTLs are looked up by the longest matching endpoint prefix; endpoints
+        whose TTL is 0 are never cached. With ``stale_while_revalidate`` an
+        expired entry is still served for that many seconds while a background
+        request refreshes it.
+
+        Args:
+            backend (CacheBackend, optional): Storage, defaults to a MemoryCache. Defaults to None.
+            ttls (Dict[str, float], optional): Seconds to live keyed by endpoint prefix. Defaults to DEFAULT_TTLS.
+            default_ttl (float, optional): TTL of endpoints matching no prefix. Defaults to 0.0.
+            stale_while_revalidate (float, optional): Seconds a stale entry may still be served. Defaults to 0.0.
+            logger (logging.Logger, optional): App logger. Defaults to None.
+        """
+        self._backend = backend if backend is not None else MemoryCache()
+        self._ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._prefixes = sorted(self._ttls, key=len, reverse=True)
+        self._default_ttl = default_ttl
+        self._stale_while_revalidate = stale_while_revalidate
+        self._logger = logger or logging.getLogger(__name__)
+        self._revalidating = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(http_method: str, endpoint: str, ep_params: Dict = None) -> str:
+        """Builds the cache key from method, endpoint and params."""
+        params = json.dumps(ep_params or {}, sort_keys=True, default=str)
+        return f"{http_method} {endpoint} {params}"
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Gets the TTL governing an endpoint (query string ignored)."""
+        path = endpoint.split("?", 1)[0]
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self._ttls[prefix]
+        return self._default_ttl
+
+    def get(self, key: str) -> Optional[Tuple[Result, bool]]:
+        """Looks up a key.
+
+        Returns:
+            Optional[Tuple[Result, bool]]: (result, is_fresh), None on a miss.
+        """
+        entry = self._backend.get(key)
+        now = time.time()
+        with self._lock:
+            if entry is not None and now < entry.expires_at:
+                self.hits += 1
+                return entry.result, True
+            if (
+                entry is not None
+                and now < entry.expires_at + self._stale_while_revalidate
+            ):
+                self.stale_hits += 1
+                return entry.result, False
+            self.misses += 1
+            return None
+
+    def set(self, key: str, endpoint: str, result: Result) -> None:
+        """Stores a result if its endpoint is cacheable."""
+        ttl = self.ttl_for(endpoint)
+        if ttl > 0:
+            self._backend.set(key, CacheEntry(result, time.time() + ttl))
+
+    def revalidate(self, key: str, endpoint: str, fetch: Callable[[], Result]) -> None:
+        """Refreshes a stale entry in a background thread (one per key)."""
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def refresh():
+            try:
+                self.set(key, endpoint, fetch())
+            except Exception as e:
+                self._logger.warning(msg=f"revalidation failed, key={key}: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def clear(self) -> None:
+        """Drops every entry and resets counters."""
+        self._backend.clear()
+        with self._lock:
+            self.hits = self.stale_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Gets hit/miss counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.rate_limiter import TokenBucket
+
+ROUND_ROBIN = "round_robin"
+LEAST_THROTTLED = "least_throttled"
+STRATEGIES = (ROUND_ROBIN, LEAST_THROTTLED)
+
+
+class SessionCookie:
+    __slots__ = (
+        "index",
+        "cookie",
+        "bucket",
+        "requests",
+        "throttles",
+        "login_errors",
+        "failures",
+        "last_throttled",
+        "quarantined_until",
+    )
+
+    def __init__(
+        self, index: int, cookie: str, rate: float = None, burst: float = None
+    ) -> None:
+        """One account of a CookiePool and its health.
+
+        Args:
+            index (int): Position in the pool, used as its label.
+            cookie (str): Session cookie sent as the Cookie header.
+            rate (float, optional): Requests per second allowed for this account. Defaults to None.
+            burst (float, optional): Bucket capacity. Defaults to the rate.
+        """
+        self.index = index
+        self.cookie = cookie
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.requests = 0
+        self.throttles = 0
+        self.login_errors = 0
+        # Consecutive throttles and login errors, reset by a success
+        self.failures = 0
+        self.last_throttled = 0.0
+        self.quarantined_until = 0.0
+
+    @property
+    def label(self) -> str:
+        """Name used in logs and stats, so the cookie itself is never printed."""
+        return f"cookie-{self.index}"
+
+    def is_quarantined(self, now: float = None) -> bool:
+        return (time.monotonic() if now is None else now) < self.quarantined_until
+
+    def __repr__(self) -> str:
+        return f"SessionCookie({self.label}, requests={self.requests})"
+
+
+class CookiePool:
+    def __init__(
+        self,
+        cookies: Iterable[str],
+        strategy: str = ROUND_ROBIN,
+        rate: float = None,
+        burst: float = None,
+        max_failures: int = 3,
+        quarantine: float = 300.0,
+        logger: logging.Logger = None,
+    ) -> None:
+        """Spreads requests over several session cookies (accounts).
+
+        Each request takes a cookie in ``round_robin`` order, or the one
+        throttled least recently with ``least_throttled``. With ``rate`` every
+        cookie has its own token bucket and a request goes to the first
+        candidate with a token ready, so throughput grows with the number of
+        accounts. A cookie with ``max_failures`` throttles or "Login Required"
+        responses in a row is quarantined for ``quarantine`` seconds and
+        requests fail over to the healthy ones.
+
+        Args:
+            cookies (Iterable[str]): Session cookies, one per account.
+            strategy (str, optional): "round_robin" or "least_throttled". Defaults to "round_robin".
+            rate (float, optional): Requests per second per cookie, None for unlimited. Defaults to None.
+            burst (float, optional): Per-cookie bucket capacity. Defaults to the rate.
+            max_failures (int, optional): Consecutive failures before quarantine. Defaults to 3.
+            quarantine (float, optional): Seconds a failing cookie is left out. Defaults to 300.0.
+            logger (logging.Logger, optional): App logger. Defaults to None.
+
+        Raises:
+            ValueError: No cookies or unknown strategy.
+        """
+        self.cookies = [
+            SessionCookie(index, cookie, rate, burst)
+            for index, cookie in enumerate(cookies)
+        ]
+        if not self.cookies:
+            raise ValueError("CookiePool needs at least one session cookie")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.quarantine = quarantine
+        self._logger = logger or logging.getLogger(__name__)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.cookies)
+
+    def healthy(self) -> List[SessionCookie]:
+        """Gets the cookies not in quarantine."""
+        now = time.monotonic()
+        return [cookie for cookie in self.cookies if not cookie.is_quarantined(now)]
+
+    def _candidates(self) -> List[SessionCookie]:
+        """Healthy cookies in the order they should be tried."""
+        now = time.monotonic()
+        with self._lock:
+            start = self._next % len(self.cookies)
+            self._next += 1
+        rotated = self.cookies[start:] + self.cookies[:start]
+        candidates = [c for c in rotated if not c.is_quarantined(now)]
+        if not candidates:
+            raise Buff163Exception("Every session cookie is quarantined")
+        if self.strategy == LEAST_THROTTLED:
+            # Stable sort: never-throttled cookies keep their round-robin order
+            candidates.sort(key=lambda cookie: cookie.last_throttled)
+        return candidates
+
+    def acquire(self) -> SessionCookie:
+        """Picks the cookie for the next request, waiting for its rate limit.
+
+        Raises:
+            Buff163Exception: Every cookie is quarantined.
+
+        Returns:
+            SessionCookie: Cookie to send.
+        """
+        candidates = self._candidates()
+        chosen = None
+        for cookie in candidates:
+            if cookie.bucket is None or cookie.bucket.try_acquire():
+                chosen = cookie
+                break
+        if chosen is None:
+            # Every bucket is empty: queue on the first candidate
+            chosen = candidates[0]
+            chosen.bucket.acquire()
+        with self._lock:
+            chosen.requests += 1
+        return chosen
+
+    def on_success(self, cookie: SessionCookie) -> None:
+        """Clears the failure streak of a cookie."""
+        cookie.failures = 0
+
+    def on_throttle(self, cookie: SessionCookie) -> None:
+        """Records a 429 answered to a cookie."""
+        with self._lock:
+            cookie.throttles += 1
+            cookie.last_throttled = time.monotonic()
+            self._fail(cookie)
+
+    def on_login_error(self, cookie: SessionCookie) -> None:
+        """Records a "Login Required" answered to a cookie."""
+        with self._lock:
+            cookie.login_errors += 1
+            self._fail(cookie)
+
+    def _fail(self, cookie: SessionCookie) -> None:
+        cookie.failures += 1
+        if cookie.failures >= self.max_failures:
+            cookie.failures = 0
+            cookie.quarantined_until = time.monotonic() + self.quarantine
+            self._logger.warning(
+                msg=f"{cookie.label} quarantined for {self.quarantine}s"
+            )
+
+    def release(self, cookie: SessionCookie) -> None:
+        """Takes a cookie out of quarantine, e.g. after refreshing its login."""
+        with self._lock:
+            cookie.failures = 0
+            cookie.quarantined_until = 0.0
+
+    def stats(self) -> Dict[str, Dict]:
+        """Gets per-cookie counters, keyed by label."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                cookie.label: {
+                    "requests": cookie.requests,
+                    "throttles": cookie.throttles,
+                    "login_errors": cookie.login_errors,
+                    "quarantined": cookie.is_quarantined(now),
+                }
+                for cookie in self.cookies
+            }
@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import Callable, Dict, Iterable, Iterator, Set, Tuple, Union
+from buff163_unofficial_api.cs_enums import Knife, Gun, Glove, Agent, Sticker, OtherItem
+
+CATEGORY_ENUMS = (Knife, Gun, Glove, Agent, Sticker, OtherItem)
+
+# (category value, page number)
+CrawlUnit = Tuple[str, int]
+
+
+def all_categories() -> list:
+    """Gets every category value in cs_enums, in declaration order."""
+    return [member.value for enum in CATEGORY_ENUMS for member in enum]
+
+
+class Crawler:
+    def __init__(
+        self,
+        fetch_page: Callable[[str, int], dict],
+        checkpoint: str = "buff163_crawl.jsonl",
+        categories: Iterable[Union[Enum, str]] = None,
+        concurrency: int = 4,
+        progress_every: int = 50,
+        logger: logging.Logger = None,
+    ) -> None:
+        """Resumable crawl of the market across categories.
+
+        The work is planned as (category, page) units: page 1 of every
+        category first, then the remaining pages once page 1 reports
+        ``total_page``. Units run on a worker pool with at most
+        ``concurrency`` in flight. Each finished unit is appended to the
+        checkpoint file (JSON lines) after its rows were yielded, so a
+        restarted crawl skips finished units and never yields their rows
+        again. Goods ids seen in an earlier unit, in this run or a
+        checkpointed one, are yielded only once.
+
+        Args:
+            fetch_page (Callable[[str, int], dict]): Fetches the ``data`` payload of (category, page).
+            checkpoint (str, optional): Checkpoint file. Defaults to "buff163_crawl.jsonl".
+            categories (Iterable[Union[Enum, str]], optional): Categories to crawl. Defaults to every cs_enums member.
+            concurrency (int, optional): Pages in flight at once. Defaults to 4.
+            progress_every (int, optional): Log throughput every this many pages, 0 never. Defaults to 50.
+            logger (logging.Logger, optional): App logger. Defaults to None.
+        """
+        self._fetch_page = fetch_page
+        self.checkpoint = checkpoint
+        self._categories = [
+            category.value if isinstance(category, Enum) else category
+            for category in (categories if categories is not None else all_categories())
+        ]
+        self._concurrency = concurrency
+        self._progress_every = progress_every
+        self._logger = logger or logging.getLogger(__name__)
+        self.pages = 0
+        self.items = 0
+        self.duplicates = 0
+        self.failed = []
+        self._start = None
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.run()
+
+    def _load(self) -> Tuple[Set[CrawlUnit], Dict[str, int], Set[int]]:
+        """Reads finished units, page counts and seen goods ids from the checkpoint."""
+        done, totals, seen = set(), {}, set()
+        if not os.path.exists(self.checkpoint):
+            return done, totals, seen
+        with open(self.checkpoint) as f:
+            for line in f:
+                try:
+                    unit = json.loads(line)
+                except ValueError:
+                    # Torn last line from an interrupted write
+                    continue
+                done.add((unit["category"], unit["page"]))
+                totals[unit["category"]] = unit["total_page"]
+                seen.update(unit["goods_ids"])
+        return done, totals, seen
+
+    def plan(self) -> list:
+        """Gets the units still to run, as far as the checkpoint knows."""
+        done, totals, _ = self._load()
+        return self._plan(done, totals)
+
+    def _plan(self, done: Set[CrawlUnit], totals: Dict[str, int]) -> list:
+        units = []
+        for category in self._categories:
+            last_page = totals.get(category, 1)
+            units.extend(
+                (category, page)
+                for page in range(1, last_page + 1)
+                if (category, page) not in done
+            )
+        return units
+
+    def run(self) -> Iterator[dict]:
+        """Runs the crawl.
+
+        Yields:
+            Iterator[dict]: Raw /market/goods rows, each goods id once.
+        """
+        done, totals, seen = self._load()
+        queue = deque(self._plan(done, totals))
+        self._start = time.perf_counter()
+        in_flight = {}
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        try:
+            with open(self.checkpoint, "a") as log:
+                while queue or in_flight:
+                    while queue and len(in_flight) < self._concurrency:
+                        unit = queue.popleft()
+                        in_flight[executor.submit(self._fetch_page, *unit)] = unit
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        category, page = in_flight.pop(future)
+                        try:
+                            data = future.result()
+                        except Exception as e:
+                            self._logger.warning(
+                                msg=f"crawl unit failed, category={category}, page={page}: {e}"
+                            )
+                            self.failed.append((category, page))
+                            continue
+
+                        if category not in totals:
+                            totals[category] = data["total_page"]
+                            queue.extend(
+                                (category, p)
+                                for p in range(2, data["total_page"] + 1)
+                                if (category, p) not in done
+                            )
+                        goods_ids = []
+                        for row in data["items"]:
+                            goods_ids.append(row["id"])
+                            if row["id"] in seen:
+                                self.duplicates += 1
+                                continue
+                            seen.add(row["id"])
+                            self.items += 1
+                            yield row
+
+                        log.write(
+                            json.dumps(
+                                {
+                                    "category": category,
+                                    "page": page,
+                                    "total_page": totals[category],
+                                    "goods_ids": goods_ids,
+                                }
+                            )
+                            + "\n"
+                        )
+                        log.flush()
+                        done.add((category, page))
+                        self.pages += 1
+                        if (
+                            self._progress_every
+                            and self.pages % self._progress_every == 0
+                        ):
+                            self._log_progress()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+        self._log_progress()
+
+    def _log_progress(self) -> None:
+        stats = self.stats()
+        self._logger.info(
+            msg=(
+                f"crawl pages={stats['pages']}, items={stats['items']}, "
+                f"pages/s={stats['pages_per_second']:.2f}, "
+                f"items/s={stats['items_per_second']:.2f}"
+            )
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """Gets progress and throughput of the current run.
+
+        Returns:
+            Dict[str, float]: pages, items, duplicates, failed, elapsed (seconds),
+            pages_per_second and items_per_second.
+        """
+        elapsed = time.perf_counter() - self._start if self._start else 0.0
+        return {
+            "pages": self.pages,
+            "items": self.items,
+            "duplicates": self.duplicates,
+            "failed": len(self.failed),
+            "elapsed": elapsed,
+            "pages_per_second": self.pages / elapsed if elapsed else 0.0,
+            "items_per_second": self.items / elapsed if elapsed else 0.0,
+        }
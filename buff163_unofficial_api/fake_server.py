@@ -0,0 +1,424 @@
+"""Local stand-in for the Buff163 API, for load and fault testing.
+
+Serves ``/api/market/goods`` (paged, optionally by category),
+``/api/market/goods/info`` and icon files from a synthetic or recorded
+catalog, with injectable latency, 429 throttling, server errors and dropped
+connections. Point a client at it through ``hostname``::
+
+    with FakeBuff163Server(latency=lognormal(0.05, 0.5), error_rate=0.01) as server:
+        api = Buff163API(hostname=server.hostname)
+
+or run it standalone: ``python -m buff163_unofficial_api.fake_server --port 8163``.
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import math
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+from buff163_unofficial_api.crawler import all_categories
+from buff163_unofficial_api.rate_limiter import TokenBucket
+
+# Latency distributions: callables returning seconds
+
+
+def constant(seconds: float) -> Callable[[], float]:
+    """Every request takes ``seconds``."""
+    return lambda: seconds
+
+
+def uniform(low: float, high: float) -> Callable[[], float]:
+    """Latency drawn uniformly from [low, high] seconds."""
+    return lambda: random.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Callable[[], float]:
+    """Long-tailed latency around ``median`` seconds."""
+    if median <= 0:
+        return constant(0.0)
+    mu = math.log(median)
+    return lambda: random.lognormvariate(mu, sigma)
+
+
+_EXTERIORS = (
+    ("wearcategory0", "Factory New"),
+    ("wearcategory1", "Minimal Wear"),
+    ("wearcategory2", "Field-Tested"),
+    ("wearcategory3", "Well-Worn"),
+    ("wearcategory4", "Battle-Scarred"),
+)
+
+
+def _tag(category: str, internal_name: str, localized_name: str) -> dict:
+    return {
+        "category": category,
+        "id": int(hashlib.md5(internal_name.encode()).hexdigest()[:6], 16),
+        "internal_name": internal_name,
+        "localized_name": localized_name,
+    }
+
+
+def synthetic_row(goods_id: int, category: str, seed: int = 0) -> dict:
+    """Builds a /market/goods row for a made-up item of ``category``."""
+    rng = random.Random(goods_id * 1_000_003 + seed)
+    exterior = _EXTERIORS[goods_id % len(_EXTERIORS)]
+    price = round(rng.lognormvariate(4, 1.5), 1)
+    name = f"{category} | Synthetic #{goods_id} ({exterior[1]})"
+    return {
+        "appid": 730,
+        "bookmarked": False,
+        "buy_max_price": str(round(price * 0.95, 1)),
+        "buy_num": rng.randint(0, 500),
+        "can_bargain": rng.random() < 0.5,
+        "can_search_by_tournament": False,
+        "description": None,
+        "game": "csgo",
+        "goods_info": {
+            "icon_url": f"/icons/{goods_id}.png",
+            "info": {
+                "tags": {
+                    "exterior": _tag("exterior", *exterior),
+                    "quality": _tag("quality", "normal", "Normal"),
+                    "rarity": _tag("rarity", "mythical_weapon", "Restricted"),
+                    "type": _tag("type", "csgo_type_rifle", "Rifle"),
+                    "weapon": _tag("weapon", category, category),
+                }
+            },
+            "item_id": None,
+            "original_icon_url": f"/icons/{goods_id}.png",
+            "steam_price": str(round(price / 7, 2)),
+            "steam_price_cny": str(round(price * 1.1, 1)),
+        },
+        "has_buff_price_history": True,
+        "id": goods_id,
+        "market_hash_name": name,
+        "market_min_price": "0",
+        "name": name,
+        "quick_price": str(round(price * 0.99, 1)),
+        "sell_min_price": str(price),
+        "sell_num": rng.randint(0, 2000),
+        "sell_reference_price": str(price),
+        "short_name": f"{category} | Synthetic #{goods_id}",
+        "steam_market_url": f"https://steamcommunity.com/market/listings/730/{goods_id}",
+        "transacted_num": rng.randint(0, 100),
+    }
+
+
+class FakeMarket:
+    def __init__(
+        self,
+        items_per_category: int = 100,
+        categories: Iterable[str] = None,
+        seed: int = 0,
+    ) -> None:
+        """Synthetic catalog served by FakeBuff163Server.
+
+        Args:
+            items_per_category (int, optional): Items generated per category. Defaults to 100.
+            categories (Iterable[str], optional): Category values. Defaults to every cs_enums member.
+            seed (int, optional): Seed of the generated prices and counts. Defaults to 0.
+        """
+        self.by_category: Dict[str, List[dict]] = {}
+        self.rows: List[dict] = []
+        goods_id = 1
+        for category in categories if categories is not None else all_categories():
+            rows = []
+            for _ in range(items_per_category):
+                rows.append(synthetic_row(goods_id, category, seed))
+                goods_id += 1
+            self.by_category[category] = rows
+            self.rows.extend(rows)
+        self._index()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "FakeMarket":
+        """Catalog of recorded rows, filed under their weapon tag as category.
+
+        The rows are copied, so binding icon urls to a server leaves the
+        caller's fixtures untouched.
+        """
+        market = cls.__new__(cls)
+        market.rows = copy.deepcopy(list(rows))
+        market.by_category = {}
+        for row in market.rows:
+            tags = row.get("goods_info", {}).get("info", {}).get("tags", {})
+            category = (tags.get("weapon") or {}).get("internal_name", "")
+            market.by_category.setdefault(category, []).append(row)
+        market._index()
+        return market
+
+    def _index(self) -> None:
+        self.by_id = {row["id"]: row for row in self.rows}
+
+    def bind(self, base_url: str) -> None:
+        """Points relative icon urls at the server serving this catalog."""
+        for row in self.rows:
+            goods_info = row.get("goods_info", {})
+            for key in ("icon_url", "original_icon_url"):
+                if str(goods_info.get(key, "")).startswith("/"):
+                    goods_info[key] = base_url + goods_info[key]
+
+    def page(self, category: Optional[str], page_num: int, page_size: int) -> dict:
+        """Gets the ``data`` payload of one market page."""
+        rows = self.rows if not category else self.by_category.get(category, [])
+        total_page = -(-len(rows) // page_size) if page_size > 0 else 0
+        start = (page_num - 1) * page_size
+        return {
+            "items": rows[start : start + page_size],
+            "page_num": page_num,
+            "page_size": page_size,
+            "total_count": len(rows),
+            "total_page": total_page,
+        }
+
+    def info(self, goods_id: int) -> Optional[dict]:
+        """Gets the ``data`` payload of /market/goods/info, None when unknown."""
+        row = self.by_id.get(goods_id)
+        if row is None:
+            return None
+        return dict(
+            row,
+            goods_info=dict(
+                row["goods_info"], normal_icon_url=row["goods_info"]["icon_url"]
+            ),
+            has_rent_order=False,
+            paintseed_filters=[],
+            recent_sold_count=row["transacted_num"],
+            relative_goods=[],
+            rent_day_choices=[],
+            rent_num=0,
+            support_charm=False,
+        )
+
+    @staticmethod
+    def icon(goods_id: int) -> bytes:
+        """Gets deterministic icon bytes for a goods id."""
+        digest = hashlib.sha256(str(goods_id).encode()).digest()
+        return b"\x89PNG\r\n\x1a\n" + digest * 64
+
+
+class FakeBuff163Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        market: FakeMarket = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Callable[[], float] = None,
+        max_rps: float = None,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        retry_after: int = None,
+        cookies: Iterable[str] = None,
+        max_rps_per_cookie: float = None,
+    ) -> None:
+        """Threaded HTTP server impersonating buff.163.com.
+
+        Faults are drawn per request, in this order: dropped connection
+        (closed without a response), 429 (above ``max_rps``, above
+        ``max_rps_per_cookie`` for the request's Cookie header or at
+        ``throttle_rate``), 500 (at ``error_rate``). With ``cookies``, API
+        requests sending any other Cookie get a "Login Required" code.
+        Latency is applied before the response is sent.
+
+        Args:
+            market (FakeMarket, optional): Catalog served. Defaults to FakeMarket().
+            host (str, optional): Bind address. Defaults to "127.0.0.1".
+            port (int, optional): Bind port, 0 picks a free one. Defaults to 0.
+            latency (Callable[[], float], optional): Seconds per request, e.g. lognormal(0.05). Defaults to None.
+            max_rps (float, optional): Requests per second before answering 429. Defaults to None.
+            throttle_rate (float, optional): Fraction of requests answered 429. Defaults to 0.0.
+            error_rate (float, optional): Fraction of requests answered 500. Defaults to 0.0.
+            drop_rate (float, optional): Fraction of connections dropped without a response. Defaults to 0.0.
+            retry_after (int, optional): Retry-After header of 429 responses. Defaults to None.
+            cookies (Iterable[str], optional): Accepted session cookies, None accepts any. Defaults to None.
+            max_rps_per_cookie (float, optional): Requests per second per Cookie header before answering 429. Defaults to None.
+        """
+        super().__init__((host, port), _Handler)
+        self.market = market if market is not None else FakeMarket()
+        self.market.bind(self.base_url)
+        self.latency = latency
+        self.bucket = TokenBucket(max_rps) if max_rps else None
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.retry_after = retry_after
+        self.cookies = None if cookies is None else frozenset(cookies)
+        self.max_rps_per_cookie = max_rps_per_cookie
+        self._cookie_buckets: Dict[str, TokenBucket] = {}
+        self._thread = None
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "throttled": 0,
+            "errors": 0,
+            "dropped": 0,
+            "login_required": 0,
+        }
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def hostname(self) -> str:
+        """Value for the ``hostname`` of RestAdapter/Buff163API."""
+        return f"{self.base_url}/api"
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def cookie_bucket(self, cookie: str) -> TokenBucket:
+        """Gets the rate limit bucket of one Cookie header."""
+        with self._lock:
+            bucket = self._cookie_buckets.get(cookie)
+            if bucket is None:
+                bucket = TokenBucket(self.max_rps_per_cookie)
+                self._cookie_buckets[cookie] = bucket
+            return bucket
+
+    def start(self) -> "FakeBuff163Server":
+        """Serves requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeBuff163Server":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeBuff163Server
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        server.count("requests")
+        if server.latency is not None:
+            time.sleep(max(0.0, server.latency()))
+
+        if random.random() < server.drop_rate:
+            server.count("dropped")
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        cookie = self.headers.get("Cookie", "")
+        throttled = server.bucket is not None and not server.bucket.try_acquire()
+        if server.max_rps_per_cookie and not throttled:
+            throttled = not server.cookie_bucket(cookie).try_acquire()
+        if throttled or random.random() < server.throttle_rate:
+            server.count("throttled")
+            headers = {}
+            if server.retry_after is not None:
+                headers["Retry-After"] = str(server.retry_after)
+            return self._send(429, b"Too Many Requests", "text/plain", headers)
+        if random.random() < server.error_rate:
+            server.count("errors")
+            return self._send(500, b"Internal Server Error", "text/plain")
+
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        is_api = url.path.startswith("/api/")
+        if is_api and server.cookies is not None and cookie not in server.cookies:
+            server.count("login_required")
+            return self._json(
+                {"code": "Login Required", "error": "Please login.", "msg": None}
+            )
+        if url.path == "/api/market/goods":
+            data = server.market.page(
+                query.get("category"),
+                int(query.get("page_num", 1)),
+                int(query.get("page_size", 20)),
+            )
+            return self._json({"code": "OK", "data": data, "msg": None})
+        if url.path == "/api/market/goods/info":
+            data = server.market.info(int(query.get("goods_id", 0)))
+            if data is None:
+                return self._json({"code": "Goods Not Found", "msg": None}, 404)
+            return self._json({"code": "OK", "data": data, "msg": None})
+        if url.path.startswith("/icons/") and url.path.endswith(".png"):
+            goods_id = url.path[len("/icons/") : -len(".png")]
+            if goods_id.isdigit():
+                return self._send(200, FakeMarket.icon(int(goods_id)), "image/png")
+        return self._send(404, b"Not Found", "text/plain")
+
+    def _json(self, body: dict, status: int = 200) -> None:
+        self._send(status, json.dumps(body).encode(), "application/json")
+
+    def _send(
+        self, status: int, body: bytes, content_type: str, headers: Dict = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m buff163_unofficial_api.fake_server"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8163)
+    parser.add_argument("--items-per-category", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="median seconds")
+    parser.add_argument("--max-rps", type=float)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--max-rps-per-cookie", type=float)
+    args = parser.parse_args(argv)
+
+    server = FakeBuff163Server(
+        FakeMarket(args.items_per_category),
+        host=args.host,
+        port=args.port,
+        latency=lognormal(args.latency) if args.latency else None,
+        max_rps=args.max_rps,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        retry_after=args.retry_after,
+        max_rps_per_cookie=args.max_rps_per_cookie,
+    )
+    print(f"serving on {server.hostname}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
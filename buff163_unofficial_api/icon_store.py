@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional
+
+
+class IconStore:
+    def __init__(self, root: str = "./icons") -> None:
+        """On-disk content-addressed store for item icons.
+
+        Files are stored once under ``objects/<sha256[:2]>/<sha256><ext>``, so
+        icons shared by many items (or urls) take one file. A small ref file
+        per url under ``urls/`` maps it to its content, which lets later runs
+        skip urls already downloaded. Writes go through a temporary file and
+        an atomic rename, so concurrent writers never see partial files.
+
+        Args:
+            root (str, optional): Store directory. Defaults to "./icons".
+        """
+        self.root = root
+        self._objects = os.path.join(root, "objects")
+        self._urls = os.path.join(root, "urls")
+        self._tmp = os.path.join(root, "tmp")
+        for directory in (self._objects, self._urls, self._tmp):
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.downloaded = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+
+    @staticmethod
+    def _extension(url: str) -> str:
+        ext = os.path.splitext(url.split("?", 1)[0])[1].lower()
+        return ext if 1 < len(ext) <= 5 else ""
+
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self._urls, hashlib.sha256(url.encode()).hexdigest())
+
+    def object_path(self, digest: str, ext: str = "") -> str:
+        """Gets the path of a stored object from its sha256 hex digest."""
+        return os.path.join(self._objects, digest[:2], digest + ext)
+
+    def path_for(self, url: str) -> Optional[str]:
+        """Gets the stored file of a url, None if it was never downloaded.
+
+        Args:
+            url (str): Icon url.
+
+        Returns:
+            Optional[str]: Path of the icon on disk.
+        """
+        try:
+            with open(self._ref_path(url)) as f:
+                path = os.path.join(self._objects, f.read().strip())
+        except FileNotFoundError:
+            return None
+        return path if os.path.exists(path) else None
+
+    def put(self, url: str, chunks: Iterable[bytes]) -> str:
+        """Writes a streamed download into the store.
+
+        Args:
+            url (str): Icon url the chunks come from.
+            chunks (Iterable[bytes]): Response body, chunk by chunk.
+
+        Returns:
+            str: Path of the stored icon.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            ext = self._extension(url)
+            path = self.object_path(digest.hexdigest(), ext)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+                duplicate = True
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+                duplicate = False
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._write_ref(url, os.path.relpath(path, self._objects))
+        with self._lock:
+            self.downloaded += 1
+            if duplicate:
+                self.deduplicated += 1
+            else:
+                self.bytes_written += size
+        return path
+
+    def _write_ref(self, url: str, relative_path: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp)
+        with os.fdopen(fd, "w") as f:
+            f.write(relative_path)
+        os.replace(tmp_path, self._ref_path(url))
+
+    def stats(self) -> Dict[str, int]:
+        """Gets download counters."""
+        with self._lock:
+            return {
+                "downloaded": self.downloaded,
+                "deduplicated": self.deduplicated,
+                "bytes_written": self.bytes_written,
+            }
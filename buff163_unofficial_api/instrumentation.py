@@ -0,0 +1,276 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Prometheus' default buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_connect = threading.local()
+
+# Called with every RequestEvent
+Hook = Callable[["RequestEvent"], None]
+
+
+class RequestEvent:
+    __slots__ = (
+        "method",
+        "endpoint",
+        "params",
+        "status_code",
+        "error",
+        "retries",
+        "connect",
+        "ttfb",
+        "total",
+        "bytes",
+        "decode",
+        "build",
+        "started",
+    )
+
+    def __init__(self, method: str, endpoint: str, params: Dict = None) -> None:
+        """Timings and outcome of one RestAdapter request, passed to hooks.
+
+        ``endpoint`` is the path template without its query string; query
+        parameters are merged into ``params``. Durations are in seconds and
+        cover every retry: ``connect`` is the time spent opening new
+        connections (DNS, TCP and TLS; None when pooled connections were
+        reused), ``ttfb`` the time to the last response's headers,
+        ``decode`` the JSON decode and ``build`` the model construction done
+        by Buff163API (None for raw adapter calls).
+
+        Args:
+            method (str): GET, POST, DELETE, etc.
+            endpoint (str): Endpoint as requested.
+            params (Dict, optional): Endpoint parameters. Defaults to None.
+        """
+        path, _, query = endpoint.partition("?")
+        self.method = method
+        self.endpoint = path
+        self.params = dict(params or {})
+        if query:
+            for pair in query.split("&"):
+                key, _, value = pair.partition("=")
+                self.params.setdefault(key, value)
+        self.status_code = None
+        self.error = None
+        self.retries = 0
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.bytes = 0
+        self.decode = None
+        self.build = None
+        self.started = time.perf_counter()
+
+    def as_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.method} {self.endpoint}, status={self.status_code}, "
+            f"retries={self.retries}, total={self.total})"
+        )
+
+
+def take_connect_time() -> float:
+    """Gets and resets the time this thread spent opening connections."""
+    elapsed = getattr(_connect, "elapsed", 0.0)
+    _connect.elapsed = 0.0
+    return elapsed
+
+
+class _TimedConnection:
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect.elapsed = getattr(_connect, "elapsed", 0.0) + (
+                time.perf_counter() - start
+            )
+
+
+class _TimedHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections record their connect time."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Cumulative histogram in the Prometheus layout.
+
+        Args:
+            buckets (Tuple[float, ...], optional): Upper bounds, ascending. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Dict[str, int]:
+        """Gets the count of observations <= each bound, "+Inf" last."""
+        cumulative = {}
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            cumulative["+Inf" if bound == float("inf") else repr(bound)] = total
+        return cumulative
+
+
+# name: (help, event attribute)
+_HISTOGRAMS = {
+    "buff163_request_duration_seconds": ("Request latency including retries.", "total"),
+    "buff163_request_connect_seconds": ("Time opening new connections.", "connect"),
+    "buff163_request_ttfb_seconds": ("Time to the response headers.", "ttfb"),
+    "buff163_response_decode_seconds": ("JSON decode time.", "decode"),
+    "buff163_model_build_seconds": ("Model construction time.", "build"),
+}
+_COUNTERS = {
+    "buff163_requests_total": "Requests, by endpoint, method and status.",
+    "buff163_request_retries_total": "Retries, by endpoint.",
+    "buff163_request_errors_total": "Failed requests, by endpoint.",
+    "buff163_response_bytes_total": "Response body bytes, by endpoint.",
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class Metrics:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Aggregated request counters and latency histograms.
+
+        A Metrics is a hook: register it with ``RestAdapter(hooks=[metrics])``
+        (or Buff163API) and read it with ``as_dict()`` or ``to_prometheus()``.
+
+        Args:
+            buckets (Tuple[float, ...], optional): Histogram bounds in seconds. Defaults to DEFAULT_BUCKETS.
+        """
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[tuple, float]] = {name: {} for name in _COUNTERS}
+        self._histograms: Dict[str, Dict[tuple, Histogram]] = {
+            name: {} for name in _HISTOGRAMS
+        }
+
+    def __call__(self, event: RequestEvent) -> None:
+        endpoint = (("endpoint", event.endpoint),)
+        status = "error" if event.status_code is None else str(event.status_code)
+        with self._lock:
+            self._add(
+                "buff163_requests_total",
+                endpoint + (("method", event.method), ("status", status)),
+                1,
+            )
+            if event.retries:
+                self._add("buff163_request_retries_total", endpoint, event.retries)
+            if event.error is not None:
+                self._add("buff163_request_errors_total", endpoint, 1)
+            if event.bytes:
+                self._add("buff163_response_bytes_total", endpoint, event.bytes)
+            for name, (_, attribute) in _HISTOGRAMS.items():
+                value = getattr(event, attribute)
+                if value is None:
+                    continue
+                histogram = self._histograms[name].get(endpoint)
+                if histogram is None:
+                    histogram = self._histograms[name][endpoint] = Histogram(
+                        self._buckets
+                    )
+                histogram.observe(value)
+
+    def _add(self, name: str, labels: tuple, value: float) -> None:
+        counter = self._counters[name]
+        counter[labels] = counter.get(labels, 0) + value
+
+    def reset(self) -> None:
+        """Drops every observation."""
+        with self._lock:
+            for series in self._counters.values():
+                series.clear()
+            for series in self._histograms.values():
+                series.clear()
+
+    def as_dict(self) -> Dict[str, list]:
+        """Gets every series as plain data.
+
+        Returns:
+            Dict[str, list]: Per metric name, ``{"labels", "value"}`` for counters and
+            ``{"labels", "buckets", "sum", "count"}`` for histograms.
+        """
+        with self._lock:
+            out = {
+                name: [
+                    {"labels": dict(labels), "value": value}
+                    for labels, value in series.items()
+                ]
+                for name, series in self._counters.items()
+            }
+            for name, series in self._histograms.items():
+                out[name] = [
+                    {
+                        "labels": dict(labels),
+                        "buckets": histogram.cumulative(),
+                        "sum": histogram.sum,
+                        "count": histogram.count,
+                    }
+                    for labels, histogram in series.items()
+                ]
+        return out
+
+    def to_prometheus(self) -> str:
+        """Renders every series in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in self._counters.items():
+                lines.append(f"# HELP {name} {_COUNTERS[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in series.items():
+                    lines.append(f"{name}{_labels(labels)} {value}")
+            for name, series in self._histograms.items():
+                lines.append(f"# HELP {name} {_HISTOGRAMS[name][0]}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in series.items():
+                    for bound, count in histogram.cumulative().items():
+                        bucket_labels = _labels(labels + (("le", bound),))
+                        lines.append(f"{name}_bucket{bucket_labels} {count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+                    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
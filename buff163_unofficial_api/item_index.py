@@ -0,0 +1,242 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import AbstractSet, Dict, Iterable, List, Optional, Set, Tuple, Union
+from buff163_unofficial_api.models import Exterior, Item, MarketChange, SpecificItem
+from buff163_unofficial_api.schema import cents
+
+TAG_FIELDS = ("exterior", "quality", "rarity", "type", "weapon")
+
+AnyItem = Union[Item, SpecificItem]
+
+_NO_IDS: AbstractSet[int] = frozenset()
+
+
+class ItemIndex:
+    def __init__(
+        self, items: Iterable[AnyItem] = (), price_field: str = "sell_min_price"
+    ) -> None:
+        """In-memory multi-key index over fetched items.
+
+        Items are found by id or market_hash_name through hash indexes, by
+        tag through one inverted index per Tags field, and by price through a
+        sorted array searched with bisect. ``find`` intersects the
+        constraints, starting from the smallest candidate set. ``upsert``
+        and ``apply`` keep the index current, e.g. from a MarketWatcher.
+
+        Args:
+            items (Iterable[AnyItem], optional): Item or SpecificItem to index. Defaults to ().
+            price_field (str, optional): Price used by range queries. Defaults to "sell_min_price".
+        """
+        self._price_field = price_field
+        self._items: Dict[int, AnyItem] = {}
+        self._by_name: Dict[str, int] = {}
+        self._tags: Dict[str, Dict[Exterior, Set[int]]] = {
+            field: {} for field in TAG_FIELDS
+        }
+        # Per field, internal and localized name -> indexed tags carrying it
+        self._tag_names: Dict[str, Dict[str, Set[Exterior]]] = {
+            field: {} for field in TAG_FIELDS
+        }
+        # Sorted (cents, goods_id); items without a price are not in it
+        self._prices: List[Tuple[int, int]] = []
+        self._price_of: Dict[int, int] = {}
+        self.upsert_many(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, goods_id: int) -> bool:
+        return goods_id in self._items
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def get(self, goods_id: int) -> Optional[AnyItem]:
+        """Gets an item by goods_id."""
+        return self._items.get(goods_id)
+
+    def by_name(self, market_hash_name: str) -> Optional[AnyItem]:
+        """Gets an item by market_hash_name."""
+        goods_id = self._by_name.get(market_hash_name)
+        return None if goods_id is None else self._items[goods_id]
+
+    @staticmethod
+    def _item_tags(item: AnyItem) -> Dict[str, Exterior]:
+        info = getattr(item.goods_info, "info", None)
+        tags = getattr(info, "tags", None)
+        if tags is None:
+            return {}
+        values = {}
+        for field in TAG_FIELDS:
+            tag = getattr(tags, field, None)
+            if tag is not None:
+                values[field] = tag
+        return values
+
+    def upsert(self, item: AnyItem) -> None:
+        """Adds an item, replacing the indexed version with the same id."""
+        goods_id = item.id
+        if goods_id in self._items:
+            self.remove(goods_id)
+        self._items[goods_id] = item
+        if item.market_hash_name is not None:
+            self._by_name[item.market_hash_name] = goods_id
+        for field, tag in self._item_tags(item).items():
+            ids = self._tags[field].get(tag)
+            if ids is None:
+                ids = self._tags[field][tag] = set()
+                for name in (tag.internal_name, tag.localized_name):
+                    self._tag_names[field].setdefault(name, set()).add(tag)
+            ids.add(goods_id)
+        price = cents(getattr(item, self._price_field, None))
+        if price is not None:
+            self._price_of[goods_id] = price
+            insort(self._prices, (price, goods_id))
+
+    def upsert_many(self, items: Iterable[AnyItem]) -> None:
+        """Adds many items, see upsert."""
+        for item in items:
+            self.upsert(item)
+
+    def remove(self, goods_id: int) -> Optional[AnyItem]:
+        """Drops an item from every index.
+
+        Returns:
+            Optional[AnyItem]: The removed item, None if it was not indexed.
+        """
+        item = self._items.pop(goods_id, None)
+        if item is None:
+            return None
+        if self._by_name.get(item.market_hash_name) == goods_id:
+            del self._by_name[item.market_hash_name]
+        for field, tag in self._item_tags(item).items():
+            ids = self._tags[field].get(tag)
+            if ids is not None:
+                ids.discard(goods_id)
+                if not ids:
+                    del self._tags[field][tag]
+                    self._forget_tag_names(field, tag)
+        price = self._price_of.pop(goods_id, None)
+        if price is not None:
+            del self._prices[bisect_left(self._prices, (price, goods_id))]
+        return item
+
+    def apply(self, change: MarketChange) -> None:
+        """Applies a MarketWatcher change."""
+        if change.kind == MarketChange.REMOVED:
+            self.remove(change.goods_id)
+        else:
+            self.upsert(change.item)
+
+    def tag_values(self, field: str) -> List[Exterior]:
+        """Gets the distinct tags indexed for a Tags field."""
+        return list(self._tags[field])
+
+    def _forget_tag_names(self, field: str, tag: Exterior) -> None:
+        names = self._tag_names[field]
+        for name in (tag.internal_name, tag.localized_name):
+            tags = names.get(name)
+            if tags is not None:
+                tags.discard(tag)
+                if not tags:
+                    del names[name]
+
+    def _tag_ids(self, field: str, value: Union[str, Exterior]) -> AbstractSet[int]:
+        """Ids carrying a tag, the indexed set itself, so callers must not change it."""
+        index = self._tags[field]
+        if isinstance(value, Exterior):
+            return index.get(value, _NO_IDS)
+        tags = self._tag_names[field].get(value)
+        if not tags:
+            return _NO_IDS
+        if len(tags) == 1:
+            return index[next(iter(tags))]
+        # Distinct tags sharing a name, e.g. same internal name, other localization
+        return set().union(*(index[tag] for tag in tags))
+
+    def _price_range(self, min_price, max_price) -> Tuple[int, int]:
+        lo = 0
+        hi = len(self._prices)
+        if min_price is not None:
+            lo = bisect_left(self._prices, (cents(min_price), -1))
+        if max_price is not None:
+            hi = bisect_right(self._prices, (cents(max_price), float("inf")))
+        return lo, max(lo, hi)
+
+    @staticmethod
+    def _in_range(price: Optional[int], low: Optional[int], high: Optional[int]):
+        return (
+            price is not None
+            and (low is None or price >= low)
+            and (high is None or price <= high)
+        )
+
+    def find(
+        self,
+        min_price: Union[str, float, None] = None,
+        max_price: Union[str, float, None] = None,
+        limit: int = None,
+        **tags: Union[str, Exterior],
+    ) -> List[AnyItem]:
+        """Finds items matching every given constraint, cheapest first.
+
+        Example: ``index.find(weapon="weapon_ak47", exterior="Factory New", max_price=200)``.
+
+        Args:
+            min_price (Union[str, float, None], optional): Lowest price, inclusive. Defaults to None.
+            max_price (Union[str, float, None], optional): Highest price, inclusive. Defaults to None.
+            limit (int, optional): Max items returned. Defaults to None.
+            **tags (Union[str, Exterior]): Tag per Tags field, as Exterior, internal or localized name.
+
+        Raises:
+            ValueError: Unknown tag field.
+
+        Returns:
+            List[AnyItem]: Matching items ordered by price (unpriced items last).
+        """
+        unknown = set(tags) - set(TAG_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown tag fields: {', '.join(sorted(unknown))}")
+
+        tag_sets = sorted(
+            (self._tag_ids(field, value) for field, value in tags.items()), key=len
+        )
+        priced = min_price is not None or max_price is not None
+        if priced:
+            lo, hi = self._price_range(min_price, max_price)
+
+        if priced and (not tag_sets or hi - lo <= len(tag_sets[0])):
+            # The price slice is the smallest candidate set, walk it in order
+            ids = [
+                goods_id
+                for _, goods_id in self._prices[lo:hi]
+                if all(goods_id in tag_ids for tag_ids in tag_sets)
+            ]
+        else:
+            # Walk the smallest tag set, testing membership in the others
+            smallest, others = (
+                (tag_sets[0], tag_sets[1:]) if tag_sets else (self._items, ())
+            )
+            candidates = [
+                goods_id
+                for goods_id in smallest
+                if all(goods_id in tag_ids for tag_ids in others)
+            ]
+            if priced:
+                low = cents(min_price) if min_price is not None else None
+                high = cents(max_price) if max_price is not None else None
+                candidates = [
+                    goods_id
+                    for goods_id in candidates
+                    if self._in_range(self._price_of.get(goods_id), low, high)
+                ]
+            ids = sorted(
+                candidates,
+                key=lambda goods_id: (
+                    goods_id not in self._price_of,
+                    self._price_of.get(goods_id, 0),
+                    goods_id,
+                ),
+            )
+        if limit is not None:
+            ids = ids[:limit]
+        return [self._items[goods_id] for goods_id in ids]
@@ -0,0 +1,71 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+JSONDecoder = Callable[[bytes], Any]
+
+# Fastest first, stdlib json is always available
+PREFERRED_BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+
+def _load_backend(name: str) -> JSONDecoder:
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "ujson":
+        import ujson
+
+        return ujson.loads
+    if name == "msgspec":
+        import msgspec
+
+        decode = msgspec.json.Decoder().decode
+
+        def msgspec_loads(content: bytes) -> Any:
+            # msgspec errors are not ValueErrors, normalise them
+            try:
+                return decode(content)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return msgspec_loads
+    raise ValueError(f"Unknown JSON backend: {name}")
+
+
+def available_backends() -> Dict[str, JSONDecoder]:
+    """Gets every installed JSON backend, fastest first.
+
+    Returns:
+        Dict[str, JSONDecoder]: Decoder taking raw bytes, keyed by backend name.
+    """
+    backends = {}
+    for name in PREFERRED_BACKENDS:
+        try:
+            backends[name] = _load_backend(name)
+        except ImportError:
+            continue
+    return backends
+
+
+def get_decoder(backend: Union[str, JSONDecoder] = None) -> JSONDecoder:
+    """Resolves a JSON decoder working on raw response bytes.
+
+    Every decoder raises ValueError on malformed input.
+
+    Args:
+        backend (Union[str, JSONDecoder], optional): "orjson", "msgspec", "ujson", "json",
+            or a callable. Defaults to None, the fastest installed backend.
+
+    Raises:
+        ImportError: The named backend is not installed.
+
+    Returns:
+        JSONDecoder: Callable decoding bytes into Python objects.
+    """
+    if callable(backend):
+        return backend
+    if backend is not None:
+        return _load_backend(backend)
+    return next(iter(available_backends().values()))
@@ -0,0 +1,268 @@
+from typing import Dict, Iterable, List, Optional, Union
+from buff163_unofficial_api.models import Exterior, Item
+from buff163_unofficial_api.schema import cents
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Price strings parsed to integer cents, missing when empty or unparsable
+PRICE_COLUMNS = (
+    "sell_min_price",
+    "buy_max_price",
+    "quick_price",
+    "sell_reference_price",
+    "steam_price_cny",
+)
+# Prices found on the row itself, steam_price_cny lives on goods_info
+_ROW_PRICE_COLUMNS = PRICE_COLUMNS[:4]
+COUNT_COLUMNS = ("sell_num", "buy_num", "transacted_num")
+TAG_COLUMNS = ("exterior", "quality", "rarity", "type", "weapon")
+# Columns that can be missing, returned as masked arrays
+NULLABLE_COLUMNS = PRICE_COLUMNS + COUNT_COLUMNS
+# Stored in place of a missing value, never compared
+MISSING = -1
+
+
+class MarketFrame:
+    def __init__(
+        self,
+        columns: Dict[str, "np.ndarray"],
+        names: "np.ndarray",
+        tag_values: Dict[str, List[Exterior]],
+    ) -> None:
+        """Columnar view of market rows for vectorized screening.
+
+        Numeric columns are NumPy arrays: ``goods_id``, the prices in
+        PRICE_COLUMNS as integer cents and the counts in COUNT_COLUMNS.
+        Prices and counts are masked arrays whose mask marks missing
+        values, so comparisons are masked there and ``filter`` drops those
+        rows; ``sort`` and ``top_k`` rank them last. Tag columns are
+        dictionary encoded: ``frame["rarity"]`` holds int32 codes into
+        ``frame.tag_values["rarity"]`` (-1 when the item has no such tag).
+
+        Args:
+            columns (Dict[str, np.ndarray]): Equal length arrays keyed by column name.
+            names (np.ndarray): market_hash_name per row (object array).
+            tag_values (Dict[str, List[Exterior]]): Distinct tags per tag column, indexed by code.
+        """
+        if np is None:
+            raise ImportError(
+                "MarketFrame requires numpy, "
+                "install it with `pip install buff163-unofficial-api[frame]`"
+            )
+        self._columns = columns
+        self.names = names
+        self.tag_values = tag_values
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "MarketFrame":
+        """Builds a frame from raw /market/goods rows without building models.
+
+        Args:
+            rows (Iterable[dict]): Decoded entries of ``data.items``.
+
+        Returns:
+            MarketFrame: Frame holding every row.
+        """
+        builder = _FrameBuilder()
+        for row in rows:
+            goods_info = row.get("goods_info") or {}
+            tags = (goods_info.get("info") or {}).get("tags") or {}
+            builder.append(
+                row["id"],
+                row.get("market_hash_name"),
+                [row.get(column) for column in _ROW_PRICE_COLUMNS]
+                + [goods_info.get("steam_price_cny")],
+                [row.get(column) for column in COUNT_COLUMNS],
+                [tags.get(column) for column in TAG_COLUMNS],
+            )
+        return builder.build()
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "MarketFrame":
+        """Builds a frame from Item models.
+
+        Args:
+            items (Iterable[Item]): Market items.
+
+        Returns:
+            MarketFrame: Frame holding every item.
+        """
+        builder = _FrameBuilder()
+        for item in items:
+            tags = item.goods_info.info.tags
+            builder.append(
+                item.id,
+                item.market_hash_name,
+                [getattr(item, column) for column in _ROW_PRICE_COLUMNS]
+                + [item.goods_info.steam_price_cny],
+                [getattr(item, column) for column in COUNT_COLUMNS],
+                [getattr(tags, column, None) for column in TAG_COLUMNS],
+            )
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, column: str) -> "np.ndarray":
+        values = self._columns[column]
+        if column in NULLABLE_COLUMNS:
+            return np.ma.masked_equal(values, MISSING, copy=False)
+        return values
+
+    def valid(self, column: str) -> "np.ndarray":
+        """Boolean mask of rows where ``column`` is not missing."""
+        return self._columns[column] != MISSING
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def _take(self, index: "np.ndarray") -> "MarketFrame":
+        columns = {name: values[index] for name, values in self._columns.items()}
+        return MarketFrame(columns, self.names[index], self.tag_values)
+
+    def filter(self, mask: "np.ndarray") -> "MarketFrame":
+        """Keeps rows where ``mask`` is True.
+
+        Masked entries, i.e. comparisons against a missing value, count as
+        False.
+
+        Args:
+            mask (np.ndarray): Boolean array, e.g. ``frame["sell_min_price"] < 20000``.
+
+        Returns:
+            MarketFrame: Filtered frame.
+        """
+        return self._take(np.asarray(np.ma.filled(mask, False), dtype=bool))
+
+    def tag_mask(self, column: str, value: Union[str, Exterior]) -> "np.ndarray":
+        """Boolean mask of rows carrying a tag.
+
+        Args:
+            column (str): One of TAG_COLUMNS.
+            value (Union[str, Exterior]): Tag, or its internal or localized name.
+
+        Returns:
+            np.ndarray: Boolean mask.
+        """
+        codes = [
+            code
+            for code, tag in enumerate(self.tag_values[column])
+            if value in (tag, tag.internal_name, tag.localized_name)
+        ]
+        return np.isin(self._columns[column], codes)
+
+    def _ranked(self, column: str) -> "np.ndarray":
+        """Indexes of the rows where ``column`` is not missing."""
+        if column in NULLABLE_COLUMNS:
+            return np.flatnonzero(self.valid(column))
+        return np.arange(len(self))
+
+    def sort(self, column: str, descending: bool = False) -> "MarketFrame":
+        """Sorts rows by a column (stable), rows missing the value last.
+
+        Args:
+            column (str): Column to sort by.
+            descending (bool, optional): Largest first. Defaults to False.
+
+        Returns:
+            MarketFrame: Sorted frame.
+        """
+        values = self._columns[column]
+        index = self._ranked(column)
+        keys = -values[index] if descending else values[index]
+        order = index[np.argsort(keys, kind="stable")]
+        if len(order) < len(values):
+            order = np.concatenate([order, np.flatnonzero(~self.valid(column))])
+        return self._take(order)
+
+    def top_k(self, column: str, k: int, largest: bool = True) -> "MarketFrame":
+        """Gets the ``k`` rows with the largest (or smallest) values, sorted.
+
+        Rows missing the value are never returned.
+
+        Args:
+            column (str): Column to rank by.
+            k (int): Number of rows.
+            largest (bool, optional): Largest values first, else smallest. Defaults to True.
+
+        Returns:
+            MarketFrame: At most ``k`` rows.
+        """
+        index = self._ranked(column)
+        k = min(k, len(index))
+        if k == 0:
+            return self._take(index[:0])
+        values = self._columns[column][index]
+        keys = -values if largest else values
+        top = np.argpartition(keys, k - 1)[:k]
+        return self._take(index[top[np.argsort(keys[top], kind="stable")]])
+
+    def row(self, i: int) -> dict:
+        """Gets one row as a dict, tags decoded, prices in cents, None when missing."""
+        row = {name: values[i].item() for name, values in self._columns.items()}
+        for column in NULLABLE_COLUMNS:
+            if row[column] == MISSING:
+                row[column] = None
+        for column in TAG_COLUMNS:
+            code = row[column]
+            row[column] = self.tag_values[column][code] if code >= 0 else None
+        row["market_hash_name"] = self.names[i]
+        return row
+
+
+class _FrameBuilder:
+    def __init__(self) -> None:
+        self.goods_ids = []
+        self.names = []
+        self.prices = [[] for _ in PRICE_COLUMNS]
+        self.counts = [[] for _ in COUNT_COLUMNS]
+        self.codes = [[] for _ in TAG_COLUMNS]
+        self.tag_codes = [{} for _ in TAG_COLUMNS]
+        self.tag_values = [[] for _ in TAG_COLUMNS]
+
+    def append(
+        self,
+        goods_id: int,
+        name: Optional[str],
+        prices: list,
+        counts: list,
+        tags: List[Union[Exterior, dict, None]],
+    ) -> None:
+        self.goods_ids.append(goods_id)
+        self.names.append(name)
+        for column, price in zip(self.prices, prices):
+            value = cents(price)
+            column.append(value if value is not None else MISSING)
+        for column, count in zip(self.counts, counts):
+            column.append(count if count is not None else MISSING)
+        for i, tag in enumerate(tags):
+            if tag is None:
+                self.codes[i].append(-1)
+                continue
+            tag = Exterior.intern(tag) if isinstance(tag, dict) else tag
+            code = self.tag_codes[i].get(tag)
+            if code is None:
+                code = self.tag_codes[i][tag] = len(self.tag_values[i])
+                self.tag_values[i].append(tag)
+            self.codes[i].append(code)
+
+    def build(self) -> MarketFrame:
+        if np is None:
+            raise ImportError(
+                "MarketFrame requires numpy, "
+                "install it with `pip install buff163-unofficial-api[frame]`"
+            )
+        columns = {"goods_id": np.array(self.goods_ids, dtype=np.int64)}
+        for name, values in zip(PRICE_COLUMNS, self.prices):
+            columns[name] = np.array(values, dtype=np.int64)
+        for name, values in zip(COUNT_COLUMNS, self.counts):
+            columns[name] = np.array(values, dtype=np.int64)
+        for name, values in zip(TAG_COLUMNS, self.codes):
+            columns[name] = np.array(values, dtype=np.int32)
+        names = np.empty(len(self.names), dtype=object)
+        names[:] = self.names
+        return MarketFrame(columns, names, dict(zip(TAG_COLUMNS, self.tag_values)))
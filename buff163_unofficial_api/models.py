@@ -1,12 +1,94 @@
 from datetime import datetime
 import os
+import shutil
 from typing import Any, List, Dict, Optional, Union, TypeVar
 from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.schema import Many, Nested, price
 
 Model = TypeVar("Model", covariant=True)
 
 
-class Result:
+class _Lazy:
+    def __init__(self, factory) -> None:
+        """Descriptor that hydrates a nested model from its raw dict on first access.
+
+        The value lives in the ``_<name>`` attribute; a dict stored there is
+        turned into a model by ``factory`` when first read, then cached.
+
+        Args:
+            factory (Callable[[dict], Any]): Builds the nested model from raw data.
+        """
+        self._factory = factory
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._attr = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self._attr)
+        if isinstance(value, dict):
+            value = self._factory(value)
+            setattr(obj, self._attr, value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        setattr(obj, self._attr, value)
+
+
+class _Slotted:
+    """Base of the slotted models.
+
+    Known fields are slots; fields the API adds that a model does not know
+    about are kept in the single ``_extra`` mapping and still read as
+    attributes. ``__schema__`` maps fields to the converters (prices, nested
+    models) applied by ``schema.decode``.
+    """
+
+    __slots__ = ("_extra",)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._slot_names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+        )
+
+    def __getattr__(self, name: str):
+        # Only reached when the regular (slot/descriptor) lookup failed
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:
+            extra = None
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __getstate__(self) -> dict:
+        state = {}
+        for name in self._slot_names:
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+def _build(model, value, lazy: bool = False):
+    """Builds ``model`` from a raw dict now, or keeps the dict for a _Lazy field."""
+    return model(**value) if isinstance(value, dict) and not lazy else value
+
+
+class Result(_Slotted):
+    __slots__ = ("status_code", "message", "data")
+
     def __init__(self, status_code: int, message: str = "", data: List[Dict] = None):
         """Result returned from low-level RestAdapter
 
@@ -20,17 +102,112 @@ class Result:
         self.data = data if data else []
 
 
-class Exterior:
+class Exterior(_Slotted):
+    __slots__ = ("category", "id", "internal_name", "localized_name", "_hash")
+
     def __init__(
         self, category: str, id: int, internal_name: str, localized_name: str
     ) -> None:
-        self.category = category
-        self.id = id
-        self.internal_name = internal_name
-        self.localized_name = localized_name
+        """Immutable tag (exterior, quality, rarity, type or weapon).
+
+        Only a few hundred distinct tags exist across the catalog, so Tags
+        shares one canonical instance per value through ``Exterior.intern``.
+        Tags compare and hash by value, which makes grouping items cheap.
+        """
+        set_field = object.__setattr__
+        set_field(self, "category", category)
+        set_field(self, "id", id)
+        set_field(self, "internal_name", internal_name)
+        set_field(self, "localized_name", localized_name)
+        set_field(self, "_hash", hash((category, id, internal_name, localized_name)))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _key(self) -> tuple:
+        return (self.category, self.id, self.internal_name, self.localized_name)
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Exterior):
+            return NotImplemented
+        return self._hash == other._hash and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return (
+            f"Exterior(category={self.category!r}, id={self.id!r}, "
+            f"internal_name={self.internal_name!r}, "
+            f"localized_name={self.localized_name!r})"
+        )
+
+    def __reduce__(self):
+        # Unpickled tags go back through the intern table
+        return (_intern_exterior, self._key())
+
+    @classmethod
+    def intern(cls, raw: dict) -> "Exterior":
+        """Gets the canonical instance for a raw tag dict.
 
+        Args:
+            raw (dict): Tag as returned by the API.
+
+        Returns:
+            Exterior: Shared instance, or a fresh one once the table is full.
+        """
+        key = (raw["category"], raw["id"], raw["internal_name"], raw["localized_name"])
+        tag = _INTERNED_TAGS.get(key)
+        if tag is None:
+            tag = cls(**raw)
+            if len(_INTERNED_TAGS) < MAX_INTERNED_TAGS:
+                tag = _INTERNED_TAGS.setdefault(key, tag)
+        return tag
+
+
+# Canonical tag instances keyed by (category, id, internal_name, localized_name)
+MAX_INTERNED_TAGS = 4096
+_INTERNED_TAGS: Dict[tuple, Exterior] = {}
+
+
+def _intern_exterior(
+    category: str, id: int, internal_name: str, localized_name: str
+) -> Exterior:
+    return Exterior.intern(
+        {
+            "category": category,
+            "id": id,
+            "internal_name": internal_name,
+            "localized_name": localized_name,
+        }
+    )
+
+
+def _tag(value: Union[Exterior, dict]) -> Exterior:
+    return Exterior.intern(value) if isinstance(value, dict) else value
+
+
+class Tags(_Slotted):
+    __slots__ = ("_exterior", "_quality", "_rarity", "_type", "_weapon")
+    __schema__ = {
+        "exterior": Exterior.intern,
+        "quality": Exterior.intern,
+        "rarity": Exterior.intern,
+        "type": Exterior.intern,
+        "weapon": Exterior.intern,
+    }
+
+    exterior = _Lazy(Exterior.intern)
+    quality = _Lazy(Exterior.intern)
+    rarity = _Lazy(Exterior.intern)
+    type = _Lazy(Exterior.intern)
+    weapon = _Lazy(Exterior.intern)
 
-class Tags:
     def __init__(
         self,
         exterior: Union[Exterior, dict],
@@ -38,20 +215,49 @@ class Tags:
         rarity: Union[Exterior, dict],
         type: Union[Exterior, dict],
         weapon: Union[Exterior, dict],
+        lazy: bool = False,
     ) -> None:
-        self.exterior = Exterior(**exterior) if isinstance(exterior, dict) else exterior
-        self.quality = Exterior(**quality) if isinstance(quality, dict) else quality
-        self.rarity = Exterior(**rarity) if isinstance(rarity, dict) else rarity
-        self.type = Exterior(**type) if isinstance(type, dict) else type
-        self.weapon = Exterior(**weapon) if isinstance(weapon, dict) else weapon
+        if lazy:
+            self._exterior = exterior
+            self._quality = quality
+            self._rarity = rarity
+            self._type = type
+            self._weapon = weapon
+        else:
+            self._exterior = _tag(exterior)
+            self._quality = _tag(quality)
+            self._rarity = _tag(rarity)
+            self._type = _tag(type)
+            self._weapon = _tag(weapon)
+
+
+class Info(_Slotted):
+    __slots__ = ("_tags",)
+    __schema__ = {"tags": Nested(Tags)}
+
+    tags = _Lazy(lambda raw: Tags(**raw, lazy=True))
+
+    def __init__(self, tags: Union[Tags, dict], lazy: bool = False) -> None:
+        self._tags = _build(Tags, tags, lazy)
+
+
+class GoodsInfo(_Slotted):
+    __slots__ = (
+        "icon_url",
+        "_info",
+        "original_icon_url",
+        "steam_price",
+        "steam_price_cny",
+        "item_id",
+    )
+    __schema__ = {
+        "info": Nested(Info),
+        "steam_price": price,
+        "steam_price_cny": price,
+    }
+
+    info = _Lazy(lambda raw: Info(**raw, lazy=True))
 
-
-class Info:
-    def __init__(self, tags: Tags) -> None:
-        self.tags = tags
-
-
-class GoodsInfo:
     def __init__(
         self,
         icon_url: str,
@@ -59,17 +265,47 @@ class GoodsInfo:
         original_icon_url: str,
         steam_price: str,
         steam_price_cny: str,
+        item_id: str = None,
+        lazy: bool = False,
         **kwargs,
     ) -> None:
         self.icon_url = icon_url
-        self.info = Info(**info) if isinstance(info, dict) else info
+        self._info = _build(Info, info, lazy)
         self.original_icon_url = original_icon_url
         self.steam_price = steam_price
         self.steam_price_cny = steam_price_cny
-        self.__dict__.update(kwargs)
-
+        self.item_id = item_id
+        self._extra = kwargs or None
+
+
+class GoodsInfoItem(_Slotted):
+    __slots__ = (
+        "can_3_d_inspect",
+        "can_display_inspect",
+        "can_inspect",
+        "can_preview",
+        "can_preview_upload",
+        "can_search_by_patch",
+        "can_search_by_sticker",
+        "can_search_by_tournament",
+        "can_specific_buy",
+        "can_specific_paintwear_buy",
+        "icon_url",
+        "info",
+        "item_id",
+        "normal_icon_url",
+        "original_icon_url",
+        "specific",
+        "specific_paintwear_buying_choices",
+        "steam_price",
+        "steam_price_cny",
+    )
+    __schema__ = {
+        "info": Nested(Info),
+        "steam_price": price,
+        "steam_price_cny": price,
+    }
 
-class GoodsInfoItem:
     def __init__(
         self,
         can_3_d_inspect: bool,
@@ -91,6 +327,7 @@ class GoodsInfoItem:
         specific_paintwear_buying_choices: List[List[str]],
         steam_price: str,
         steam_price_cny: str,
+        **kwargs,
     ) -> None:
         self.can_3_d_inspect = can_3_d_inspect
         self.can_display_inspect = can_display_inspect
@@ -111,9 +348,12 @@ class GoodsInfoItem:
         self.specific_paintwear_buying_choices = specific_paintwear_buying_choices
         self.steam_price = steam_price
         self.steam_price_cny = steam_price_cny
+        self._extra = kwargs or None
+
 
+class PaintseedFilter(_Slotted):
+    __slots__ = ("name", "placeholder", "search", "type")
 
-class PaintseedFilter:
     def __init__(self, name: str, placeholder: str, search: bool, type: str) -> None:
         self.name = name
         self.placeholder = placeholder
@@ -121,7 +361,18 @@ class PaintseedFilter:
         self.type = type
 
 
-class RelativeGood:
+class RelativeGood(_Slotted):
+    __slots__ = (
+        "goods_id",
+        "goods_name",
+        "is_change",
+        "sell_min_price",
+        "sell_num",
+        "tag",
+        "tag_name",
+    )
+    __schema__ = {"sell_min_price": price}
+
     def __init__(
         self,
         goods_id: int,
@@ -141,7 +392,9 @@ class RelativeGood:
         self.tag_name = tag_name
 
 
-class ShareData:
+class ShareData(_Slotted):
+    __slots__ = ("content", "thumbnail", "title", "url")
+
     def __init__(self, content: str, thumbnail: str, title: str, url: str) -> None:
         self.content = content
         self.thumbnail = thumbnail
@@ -149,13 +402,18 @@ class ShareData:
         self.url = url
 
 
-class ListList:
+class ListList(_Slotted):
+    __slots__ = ("title", "value")
+
     def __init__(self, title: str, value: str) -> None:
         self.title = title
         self.value = value
 
 
-class SortByFieldsList:
+class SortByFieldsList(_Slotted):
+    __slots__ = ("attribute", "default_value", "list")
+    __schema__ = {"list": Many(ListList)}
+
     def __init__(
         self, attribute: str, default_value: str, list: List[ListList]
     ) -> None:
@@ -164,13 +422,51 @@ class SortByFieldsList:
         self.list = list
 
 
-class SortByFields:
+class SortByFields(_Slotted):
+    __slots__ = ("list", "title")
+    __schema__ = {"list": Many(SortByFieldsList)}
+
     def __init__(self, list: List[SortByFieldsList], title: str) -> None:
         self.list = list
         self.title = title
 
 
-class Item:
+class Item(_Slotted):
+    __slots__ = (
+        "buy_max_price",
+        "buy_num",
+        "can_bargain",
+        "_goods_info",
+        "id",
+        "market_hash_name",
+        "market_min_price",
+        "name",
+        "quick_price",
+        "sell_min_price",
+        "sell_num",
+        "sell_reference_price",
+        "short_name",
+        "steam_market_url",
+        "transacted_num",
+        "data",
+        "appid",
+        "bookmarked",
+        "can_search_by_tournament",
+        "description",
+        "game",
+        "has_buff_price_history",
+        "icon_path",
+    )
+    __schema__ = {
+        "goods_info": Nested(GoodsInfo),
+        "buy_max_price": price,
+        "quick_price": price,
+        "sell_min_price": price,
+        "sell_reference_price": price,
+    }
+
+    goods_info = _Lazy(lambda raw: GoodsInfo(**raw, lazy=True))
+
     def __init__(
         self,
         buy_max_price: str,
@@ -189,14 +485,26 @@ class Item:
         steam_market_url: str,
         transacted_num: int,
         data: bytes = bytes(),
+        appid: int = None,
+        bookmarked: bool = None,
+        can_search_by_tournament: bool = None,
+        description: str = None,
+        game: str = None,
+        has_buff_price_history: bool = None,
+        icon_path: str = None,
+        lazy: bool = False,
         **kwargs,
     ) -> None:
+        """Market overview of an item.
+
+        With ``lazy=True`` the raw ``goods_info`` dict is kept and the nested
+        GoodsInfo/Info/Tags/Exterior objects are only built on first access.
+        ``icon_path`` is set by Buff163API.fetch_images to the icon on disk.
+        """
         self.buy_max_price = buy_max_price
         self.buy_num = buy_num
         self.can_bargain = can_bargain
-        self.goods_info = (
-            GoodsInfo(**goods_info) if isinstance(goods_info, dict) else goods_info
-        )
+        self._goods_info = _build(GoodsInfo, goods_info, lazy)
         self.id = id
         self.market_hash_name = market_hash_name
         self.market_min_price = market_min_price
@@ -209,23 +517,104 @@ class Item:
         self.steam_market_url = steam_market_url
         self.transacted_num = transacted_num
         self.data = data
-        self.__dict__.update(kwargs)
+        self.appid = appid
+        self.bookmarked = bookmarked
+        self.can_search_by_tournament = can_search_by_tournament
+        self.description = description
+        self.game = game
+        self.has_buff_price_history = has_buff_price_history
+        self.icon_path = icon_path
+        self._extra = kwargs or None
 
     def save_icon_to(self, path: str = "./", file_name: str = ""):
-        if not self.data:
+        if not self.data and not self.icon_path:
             raise Buff163Exception("No data to save")
         try:
             save_file_name = file_name if file_name else f"{self.market_hash_name}.jpg"
             save_path = os.path.join(path, save_file_name)
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            with open(save_path, "wb") as f:
-                f.write(self.data)
+            if self.data:
+                with open(save_path, "wb") as f:
+                    f.write(self.data)
+            else:
+                shutil.copyfile(self.icon_path, save_path)
 
         except Exception as e:
             raise Buff163Exception(str(e)) from e
 
 
-class SpecificItem:
+class SpecificItem(_Slotted):
+    __slots__ = (
+        "allow_bundle_inventory",
+        "appid",
+        "asset_tags",
+        "asset_tags_buy_order",
+        "asset_tags_history",
+        "bookmarked",
+        "buy_max_price",
+        "buy_min_price_limit",
+        "buy_num",
+        "can_buy",
+        "can_sort_by_heat",
+        "container_type",
+        "containers",
+        "description",
+        "fade_choices",
+        "game",
+        "goods_info",
+        "has_buff_price_history",
+        "has_bundle_inventory_order",
+        "has_fade_name",
+        "has_paintwear_rank",
+        "has_related",
+        "has_rune",
+        "id",
+        "is_container",
+        "item_id",
+        "market_hash_name",
+        "market_min_price",
+        "name",
+        "paintseed_filters",
+        "paintseed_filters_buy_order",
+        "paintseed_filters_history",
+        "paintwear_choices",
+        "paintwear_range",
+        "quick_price",
+        "rank_types",
+        "recent_sold_count",
+        "relative_goods",
+        "sell_min_price",
+        "sell_num",
+        "sell_reference_price",
+        "share_data",
+        "short_name",
+        "show_game_cms_icon",
+        "sort_by_fields",
+        "steam_market_url",
+        "super_short_name",
+        "support_name_tag",
+        "transacted_num",
+        "user_show_count",
+        "wiki_link",
+        "has_rent_order",
+        "rent_day_choices",
+        "rent_num",
+        "rent_sort_by_fields",
+        "support_charm",
+    )
+    __schema__ = {
+        "goods_info": Nested(GoodsInfoItem),
+        "paintseed_filters": Many(PaintseedFilter),
+        "relative_goods": Many(RelativeGood),
+        "share_data": Nested(ShareData),
+        "sort_by_fields": Nested(SortByFields),
+        "rent_sort_by_fields": Nested(SortByFields),
+        "buy_max_price": price,
+        "sell_min_price": price,
+        "sell_reference_price": price,
+        "quick_price": price,
+    }
+
     def __init__(
         self,
         allow_bundle_inventory: bool,
@@ -277,14 +666,21 @@ class SpecificItem:
         transacted_num: int,
         user_show_count: int,
         wiki_link: None,
-        has_rent_order: bool,
-        rent_day_choices: List[int],
-        rent_num: int,
-        rent_sort_by_fields: SortByFields,
-        support_charm: bool,
+        has_rent_order: bool = None,
+        rent_day_choices: List[int] = None,
+        rent_num: int = None,
+        rent_sort_by_fields: SortByFields = None,
+        support_charm: bool = None,
         buy_max_price: int = None,
         buy_min_price_limit: int = None,
+        **kwargs,
     ) -> None:
+        """Details of an item (/market/goods/info).
+
+        ``schema.decode(SpecificItem, data)`` builds it from the raw response
+        with typed nested models and Decimal prices; calling the constructor
+        directly stores the values as given.
+        """
         self.allow_bundle_inventory = allow_bundle_inventory
         self.appid = appid
         self.asset_tags = asset_tags
@@ -336,4 +732,131 @@ class SpecificItem:
         self.transacted_num = transacted_num
         self.user_show_count = user_show_count
         self.wiki_link = wiki_link
+        self.has_rent_order = has_rent_order
+        self.rent_day_choices = rent_day_choices
+        self.rent_num = rent_num
+        self.rent_sort_by_fields = rent_sort_by_fields
+        self.support_charm = support_charm
+        self._extra = kwargs or None
+
+
+class ItemResult(_Slotted):
+    __slots__ = ("goods_id", "item", "error", "elapsed")
+
+    def __init__(
+        self,
+        goods_id: int,
+        item: Optional[SpecificItem] = None,
+        error: Optional[Exception] = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        """Outcome of one id in a bulk fetch.
+
+        Args:
+            goods_id (int): Requested goods_id.
+            item (Optional[SpecificItem], optional): Item when the fetch succeeded. Defaults to None.
+            error (Optional[Exception], optional): Error when it failed. Defaults to None.
+            elapsed (float, optional): Seconds spent on the request. Defaults to 0.0.
+        """
+        self.goods_id = goods_id
+        self.item = item
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PriceSnapshot(_Slotted):
+    __slots__ = (
+        "goods_id",
+        "ts",
+        "sell_min_price",
+        "buy_max_price",
+        "sell_num",
+        "buy_num",
+        "transacted_num",
+    )
+
+    def __init__(
+        self,
+        goods_id: int,
+        ts: float,
+        sell_min_price: Optional[int] = None,
+        buy_max_price: Optional[int] = None,
+        sell_num: Optional[int] = None,
+        buy_num: Optional[int] = None,
+        transacted_num: Optional[int] = None,
+    ) -> None:
+        """Price and volume of an item at one point in time.
+
+        Args:
+            goods_id (int): Item's goods_id.
+            ts (float): Unix time of the observation.
+            sell_min_price (Optional[int], optional): Lowest sell price in cents. Defaults to None.
+            buy_max_price (Optional[int], optional): Highest buy order in cents. Defaults to None.
+            sell_num (Optional[int], optional): Listings on sale. Defaults to None.
+            buy_num (Optional[int], optional): Open buy orders. Defaults to None.
+            transacted_num (Optional[int], optional): Transactions. Defaults to None.
+        """
+        self.goods_id = goods_id
+        self.ts = ts
+        self.sell_min_price = sell_min_price
+        self.buy_max_price = buy_max_price
+        self.sell_num = sell_num
+        self.buy_num = buy_num
+        self.transacted_num = transacted_num
+
+
+class MarketChange(_Slotted):
+    __slots__ = ("kind", "goods_id", "item")
+
+    NEW = "new"
+    CHANGED = "changed"
+    REMOVED = "removed"
+
+    def __init__(self, kind: str, goods_id: int, item: Optional[Item] = None) -> None:
+        """Change of one market row between two polls.
+
+        Args:
+            kind (str): MarketChange.NEW, CHANGED or REMOVED.
+            goods_id (int): Item's goods_id.
+            item (Optional[Item], optional): Item as of the latest poll, None when removed. Defaults to None.
+        """
+        self.kind = kind
+        self.goods_id = goods_id
+        self.item = item
+
+    def __repr__(self) -> str:
+        return f"MarketChange({self.kind!r}, {self.goods_id!r})"
+
+
+class SearchHit(_Slotted):
+    __slots__ = ("goods_id", "market_hash_name", "category", "field", "score")
+
+    def __init__(
+        self,
+        goods_id: int,
+        market_hash_name: Optional[str],
+        category: Optional[str],
+        field: str,
+        score: float,
+    ) -> None:
+        """One result of a SearchIndex query.
+
+        Args:
+            goods_id (int): Item's goods_id.
+            market_hash_name (Optional[str]): Item's market_hash_name.
+            category (Optional[str]): Item's cs_enums category value.
+            field (str): Name field that matched ("market_hash_name", "name" or "short_name").
+            score (float): Similarity from 0 to 1, 1 for exact and prefix matches.
+        """
+        self.goods_id = goods_id
+        self.market_hash_name = market_hash_name
+        self.category = category
+        self.field = field
+        self.score = score
 
+    def __repr__(self) -> str:
+        return f"SearchHit({self.goods_id!r}, {self.market_hash_name!r}, score={self.score:.2f})"
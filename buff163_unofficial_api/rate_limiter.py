@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        """Thread-safe token bucket.
+
+        Args:
+            rate (float): Tokens added per second (requests per second).
+            capacity (float, optional): Max tokens stored (burst size). Defaults to max(rate, 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(self._rate, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = float(rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last) * self._rate
+        )
+        self._last = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Takes tokens now, possibly going into debt.
+
+        Args:
+            tokens (float, optional): Tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds the caller must wait before using the reservation.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Takes tokens only if available now, never going into debt.
+
+        Returns:
+            bool: Whether the tokens were taken.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Blocks until ``tokens`` are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        default_rate: float = None,
+        limits: Dict[str, float] = None,
+        burst: float = None,
+        adaptive: bool = False,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ) -> None:
+        """Client-side rate limiter with one token bucket per endpoint prefix.
+
+        An endpoint uses the bucket of the longest matching prefix in ``limits``,
+        falling back to ``default_rate``. In adaptive (AIMD) mode every successful
+        request raises the rate additively and every throttled response cuts it
+        multiplicatively, so the client settles just under the server's limit.
+
+        Args:
+            default_rate (float, optional): Requests per second for unmatched endpoints, None for unlimited. Defaults to None.
+            limits (Dict[str, float], optional): Requests per second keyed by endpoint prefix. Defaults to None.
+            burst (float, optional): Bucket capacity, defaults to each bucket's rate. Defaults to None.
+            adaptive (bool, optional): Enable AIMD rate adjustment. Defaults to False.
+            min_rate (float, optional): Adaptive lower bound. Defaults to 0.5.
+            max_rate (float, optional): Adaptive upper bound. Defaults to 50.0.
+            increase (float, optional): Requests per second added on each success. Defaults to 0.1.
+            decrease (float, optional): Factor applied to the rate on throttling. Defaults to 0.5.
+        """
+        self._buckets = {
+            prefix: TokenBucket(rate, burst) for prefix, rate in (limits or {}).items()
+        }
+        # Longest prefix first so "/market/goods/info" wins over "/market/goods"
+        self._prefixes = sorted(self._buckets, key=len, reverse=True)
+        self._default = TokenBucket(default_rate, burst) if default_rate else None
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+
+    def bucket_for(self, endpoint: str) -> Optional[TokenBucket]:
+        """Gets the bucket governing an endpoint (query string ignored)."""
+        path = endpoint.split("?", 1)[0]
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self._buckets[prefix]
+        return self._default
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserves one request, returns seconds to wait before sending it."""
+        bucket = self.bucket_for(endpoint)
+        return bucket.reserve() if bucket else 0.0
+
+    def acquire(self, endpoint: str) -> None:
+        """Blocks until a request to ``endpoint`` may be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self, endpoint: str) -> None:
+        """Additive increase after a successful request (adaptive mode only)."""
+        bucket = self.bucket_for(endpoint)
+        if self.adaptive and bucket:
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def on_throttle(self, endpoint: str) -> None:
+        """Multiplicative decrease after a throttled request (adaptive mode only)."""
+        bucket = self.bucket_for(endpoint)
+        if self.adaptive and bucket:
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
@@ -1,10 +1,35 @@
+import random
+import threading
+import time
 import requests
 import requests.packages
-from typing import Dict
+from urllib3.exceptions import ConnectTimeoutError
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Union
 import logging
 from json.decoder import JSONDecodeError
 from buff163_unofficial_api.exceptions import Buff163Exception
 from buff163_unofficial_api.models import Result
+from buff163_unofficial_api.cache import ResponseCache
+from buff163_unofficial_api.singleflight import SingleFlight
+from buff163_unofficial_api.json_decoder import JSONDecoder, get_decoder
+from buff163_unofficial_api.instrumentation import (
+    Hook,
+    RequestEvent,
+    TimedHTTPAdapter,
+    take_connect_time,
+)
+
+if TYPE_CHECKING:
+    from buff163_unofficial_api.rate_limiter import RateLimiter
+    from buff163_unofficial_api.cookie_pool import CookiePool
+
+# 429 Too Many Requests plus transient server errors
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+# Methods safe to send again after a 5xx or a failure mid-request
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+# Response code of requests whose session cookie was rejected
+LOGIN_REQUIRED = "Login Required"
 
 
 class RestAdapter:
@@ -14,28 +39,130 @@ class RestAdapter:
         session_cookie: str = "",
         ssl_verify: bool = True,
         logger: logging.Logger = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        headers: Dict = None,
+        rate_limiter: "RateLimiter" = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        cache: ResponseCache = None,
+        coalesce: bool = True,
+        json_decoder: Union[str, JSONDecoder] = None,
+        hooks: Iterable[Hook] = None,
+        session_cookies: Union["CookiePool", Iterable[str]] = None,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
     ) -> None:
         """Constructor for RestAdapter
 
+        Requests go through a single keep-alive ``requests.Session`` owned by the
+        adapter, so TCP/TLS connections are reused between calls. The underlying
+        urllib3 pool is thread-safe and the adapter may be shared across threads.
+
         Args:
-            hostname (str): Api url. Defaults to "buff.163.com/api".
+            hostname (str): Api url, https unless a scheme is given. Defaults to "buff.163.com/api".
             session_cookie (str, optional): Used for authentication. Defaults to "".
             ssl_verify (bool, optional): Set to false if having SSL/TLS cert validation issues. Defaults to True.
             logger (logging.Logger, optional): App logger. Defaults to None.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Max connections kept alive per host. Defaults to 10.
+            headers (Dict, optional): Extra default headers sent with every request. Defaults to None.
+            rate_limiter (RateLimiter, optional): Limiter shared by every call through this adapter. Defaults to None.
+            max_retries (int, optional): Retries for 429/5xx responses and connection errors. Defaults to 3.
+            backoff_factor (float, optional): Base of the exponential backoff in seconds. Defaults to 0.5.
+            backoff_max (float, optional): Max seconds to wait between retries. Defaults to 30.0.
+            cache (ResponseCache, optional): Cache consulted by GET requests. Defaults to None.
+            coalesce (bool, optional): Share one in-flight GET between identical concurrent calls. Defaults to True.
+            json_decoder (Union[str, JSONDecoder], optional): JSON backend name or bytes decoder. Defaults to the fastest installed.
+            hooks (Iterable[Hook], optional): Called with a RequestEvent after every request, e.g. a Metrics. Defaults to None.
+            session_cookies (Union[CookiePool, Iterable[str]], optional): Several accounts to spread requests over, instead of session_cookie. Defaults to None.
+            retry_methods (Iterable[str], optional): Methods retried on any transient failure, others only when the request was never sent or was throttled with a Retry-After. Defaults to IDEMPOTENT_METHODS.
         """
         self._logger = logger or logging.getLogger(__name__)
-        self.url = f"https://{hostname}"
+        # A scheme may be given to target plain HTTP, e.g. a local fake server
+        self.url = hostname if "://" in hostname else f"https://{hostname}"
         self._session_cookie = session_cookie
         self._ssl_verify = ssl_verify
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._backoff_max = backoff_max
+        self._retry_methods = frozenset(method.upper() for method in retry_methods)
+        self._cache = cache
+        self._single_flight = SingleFlight() if coalesce else None
+        self._json_decoder = get_decoder(json_decoder)
+        self.hooks: List[Hook] = list(hooks or [])
+        self._local = threading.local()
+        if session_cookies is not None:
+            from buff163_unofficial_api.cookie_pool import CookiePool
+
+            if not isinstance(session_cookies, CookiePool):
+                session_cookies = CookiePool(session_cookies, logger=logger)
+        self.cookie_pool = session_cookies
         if not ssl_verify:
             # noinspection PyUnresolvedReferences
             requests.packages.urllib3.disable_warnings()
 
+        # Long-lived session: default headers are built once, connections are pooled per host
+        self._session = requests.Session()
+        self._session.verify = ssl_verify
+        self._session.headers.update(headers or {})
+        self._session.headers["Cookie"] = session_cookie
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Closes the session and every pooled connection."""
+        self._session.close()
+
+    def __enter__(self) -> "RestAdapter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def deferred_events(self) -> Iterator[List[RequestEvent]]:
+        """Holds back the events of this thread's requests until the block exits.
+
+        Lets a caller fill in what happens after the request, e.g. Buff163API
+        timing the model build, before the hooks see the event.
+
+        Yields:
+            Iterator[List[RequestEvent]]: Events of the requests made in the block.
+        """
+        events = []
+        outer = getattr(self._local, "deferred", None)
+        self._local.deferred = events
+        try:
+            yield events
+        finally:
+            self._local.deferred = outer
+            for event in events:
+                self._emit(event)
+
+    def _emit(self, event: RequestEvent) -> None:
+        deferred = getattr(self._local, "deferred", None)
+        if deferred is not None:
+            deferred.append(event)
+            return
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                self._logger.exception(msg=f"hook {hook!r} failed")
+
     def _do(
         self, http_method: str, endpoint: str, ep_params: Dict = None, data: Dict = None
     ) -> Result:
         """Private method for api requests (GET, POST, DELETE, etc.)
 
+        When hooks are registered, a RequestEvent is emitted once the request
+        succeeds or fails; otherwise no timing is collected at all.
+
         Args:
             http_method (str): GET, POST, DELETE, etc.
             endpoint (str): URL endpoint
@@ -44,63 +171,229 @@ class RestAdapter:
 
         Raises:
             Buff163Exception: Requests fail
+            Buff163Exception: Throttled or server error after every retry
             Buff163Exception: Bad JSON
             Buff163Exception: Error response code
 
         Returns:
             Result: status_code, message, data
         """
-        full_url = self.url + endpoint
-        headers = {"Cookie": self._session_cookie}
+        if not self.hooks:
+            return self._request(http_method, endpoint, ep_params, data)
 
-        log_line_pre = f"method={http_method}, url={full_url}, params={ep_params}"
-        log_line_post = ", ".join(
-            (log_line_pre, "success={}, status_code={}, message={}")
-        )
-        # Performing an HTTP request and logging its details; exceptions are logged and a custom exception is raised.
+        event = RequestEvent(http_method, endpoint, ep_params)
         try:
-            self._logger.debug(msg=log_line_pre)
-            response = requests.request(
-                method=http_method,
-                url=full_url,
-                verify=self._ssl_verify,
-                headers=headers,
-                params=ep_params,
-                json=data,
-            )
+            return self._request(http_method, endpoint, ep_params, data, event)
+        except Buff163Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.total = time.perf_counter() - event.started
+            self._emit(event)
 
-        except requests.exceptions.RequestException as e:
-            self._logger.error(msg=(str(e)))
-            raise Buff163Exception("Request failed") from e
+    def _request(
+        self,
+        http_method: str,
+        endpoint: str,
+        ep_params: Dict = None,
+        data: Dict = None,
+        event: RequestEvent = None,
+        failovers: int = 0,
+    ) -> Result:
+        log_line_pre = None
+        if self._logger.isEnabledFor(logging.DEBUG):
+            log_line_pre = self._log_line_pre(http_method, endpoint, ep_params)
+            self._logger.debug(msg=log_line_pre)
+        response = self._send(http_method, endpoint, ep_params, data, event)
+        if event is not None:
+            event.status_code = response.status_code
+            event.bytes = len(response.content)
+        if response.status_code in RETRY_STATUS_CODES:
+            log_line_pre = self._log_line_pre(http_method, endpoint, ep_params)
+            self._logger.error(msg=f"{log_line_pre}, retries exhausted")
+            raise Buff163Exception(f"{response.status_code}: {response.reason}")
 
         # Convert JSON response to a Python object; raise and log a custom exception for JSON parsing errors
+        decode_start = time.perf_counter()
         try:
-            data_out = response.json()
+            data_out = self._json_decoder(response.content)
         except (ValueError, JSONDecodeError) as e:
-            self._logger.error(msg=log_line_post.format(False, None, e))
+            log_line_pre = self._log_line_pre(http_method, endpoint, ep_params)
+            self._logger.error(msg=self._log_line_post(log_line_pre, False, None, e))
             raise Buff163Exception("Bad JSON in response") from e
+        if event is not None:
+            event.decode = time.perf_counter() - decode_start
 
         # Check code is valid and data is produced
+        cookie = self._local.cookie if self.cookie_pool is not None else None
         is_login_error = data_out["code"] != "OK"
         if is_login_error:
-            log_line = log_line_post.format(False, 401, "Login Required")
+            if cookie is not None and data_out["code"] == LOGIN_REQUIRED:
+                self.cookie_pool.on_login_error(cookie)
+                # Fail over to the other accounts before giving up
+                if failovers < len(self.cookie_pool) - 1 and self.cookie_pool.healthy():
+                    if event is not None:
+                        event.retries += 1
+                    return self._request(
+                        http_method, endpoint, ep_params, data, event, failovers + 1
+                    )
+            log_line_pre = self._log_line_pre(http_method, endpoint, ep_params)
+            log_line = self._log_line_post(log_line_pre, False, 401, "Login Required")
             self._logger.error(msg=log_line)
             raise Buff163Exception("Login is required")
 
         # Check response status code for success (200-299) and log accordingly.
         is_success = 299 >= response.status_code >= 200
-        # log_line = log_line_post.format(
-        #     is_success, response.status_code, response.reason
-        # )
         if is_success:
-            self._logger.debug(msg="log_line")
+            if cookie is not None:
+                self.cookie_pool.on_success(cookie)
+            # Only formatted when DEBUG is on
+            if log_line_pre is not None:
+                log_line = self._log_line_post(
+                    log_line_pre, True, response.status_code, response.reason
+                )
+                self._logger.debug(msg=log_line)
             return Result(response.status_code, message=response.reason, data=data_out)
+        log_line_pre = self._log_line_pre(http_method, endpoint, ep_params)
+        log_line = self._log_line_post(
+            log_line_pre, False, response.status_code, response.reason
+        )
         self._logger.error(msg=log_line)
         raise Buff163Exception(f"{response.status_code}: {response.reason}")
 
+    def _log_line_pre(self, http_method: str, endpoint: str, ep_params: Dict) -> str:
+        return f"method={http_method}, url={self.url + endpoint}, params={ep_params}"
+
+    @staticmethod
+    def _log_line_post(
+        log_line_pre: str, success: bool, status_code: int, message
+    ) -> str:
+        return f"{log_line_pre}, success={success}, status_code={status_code}, message={message}"
+
+    def _send(
+        self,
+        http_method: str,
+        endpoint: str,
+        ep_params: Dict = None,
+        data: Dict = None,
+        event: RequestEvent = None,
+    ) -> requests.Response:
+        """Sends a request through the rate limiter, retrying transient failures.
+
+        429/5xx responses and connection errors are retried up to ``max_retries``
+        times with exponential backoff and full jitter; a ``Retry-After`` header
+        on a 429 takes precedence. The last response is returned as is.
+
+        Methods outside ``retry_methods`` (POST) may not be repeatable, e.g.
+        buying an item, so they are only retried when the server cannot have
+        acted on them: errors while connecting, and 429s with a Retry-After.
+
+        With a cookie pool every attempt takes a cookie from it, and a 429 is
+        retried at once on another healthy cookie instead of backing off.
+
+        Args:
+            http_method (str): GET, POST, DELETE, etc.
+            endpoint (str): URL endpoint
+            ep_params (Dict, optional): Endpoint parameters. Defaults to None.
+            data (Dict, optional): Data to pass to Buff163API. Defaults to None.
+            event (RequestEvent, optional): Receives retries and connection timings. Defaults to None.
+
+        Raises:
+            Buff163Exception: Requests fail after every retry
+
+        Returns:
+            requests.Response: Last response received.
+        """
+        attempt = 0
+        idempotent = http_method.upper() in self._retry_methods
+        while True:
+            if self._rate_limiter:
+                self._rate_limiter.acquire(endpoint)
+            cookie = None
+            if self.cookie_pool is not None:
+                cookie = self._local.cookie = self.cookie_pool.acquire()
+            if event is not None:
+                take_connect_time()
+            try:
+                response = self._session.request(
+                    method=http_method,
+                    url=self.url + endpoint,
+                    verify=self._ssl_verify,
+                    params=ep_params,
+                    json=data,
+                    headers=None if cookie is None else {"Cookie": cookie.cookie},
+                )
+            except requests.exceptions.RequestException as e:
+                self._logger.error(msg=(str(e)))
+                if event is not None:
+                    self._add_connect_time(event)
+                if attempt >= self._max_retries or not (
+                    idempotent or self._is_connect_error(e)
+                ):
+                    raise Buff163Exception("Request failed") from e
+                retry_after = None
+                throttled = False
+            else:
+                if event is not None:
+                    self._add_connect_time(event)
+                    event.ttfb = response.elapsed.total_seconds()
+                if response.status_code == 429:
+                    if self._rate_limiter:
+                        self._rate_limiter.on_throttle(endpoint)
+                    if cookie is not None:
+                        self.cookie_pool.on_throttle(cookie)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    if self._rate_limiter:
+                        self._rate_limiter.on_success(endpoint)
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                throttled = response.status_code == 429
+                if attempt >= self._max_retries or not (
+                    idempotent or (throttled and retry_after)
+                ):
+                    return response
+
+            attempt += 1
+            if event is not None:
+                event.retries += 1
+            failover = (
+                throttled and cookie is not None and len(self.cookie_pool.healthy()) > 1
+            )
+            if not failover:
+                time.sleep(self._backoff(attempt, retry_after))
+
+    @staticmethod
+    def _is_connect_error(error: requests.exceptions.RequestException) -> bool:
+        """Whether the request failed before it reached the server."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if not isinstance(error, requests.exceptions.ConnectionError):
+            return False
+        # requests wraps urllib3's MaxRetryError, whose reason is the cause
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, ConnectTimeoutError)
+
+    @staticmethod
+    def _add_connect_time(event: RequestEvent) -> None:
+        connect = take_connect_time()
+        if connect:
+            event.connect = (event.connect or 0.0) + connect
+
+    def _backoff(self, attempt: int, retry_after: str = None) -> float:
+        """Seconds to wait before retry number ``attempt``."""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self._backoff_max)
+        ceiling = min(self._backoff_max, self._backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
     def get(self, endpoint: str, ep_params: Dict = None) -> Result:
         """Sends a GET request to a specified API endpoint.
 
+        Served from the response cache when one is configured and holds a
+        fresh (or revalidating stale) entry for the endpoint and params.
+        Identical GETs issued while one is in flight wait for and share its
+        result instead of hitting the network again.
+
         Args:
             endpoint (str): The endpoint for the GET request.
             ep_params (Dict, optional): Parameters to include in request. Defaults to None.
@@ -108,7 +401,37 @@ class RestAdapter:
         Returns:
             Result: status_code, message, data
         """
-        return self._do(http_method="GET", endpoint=endpoint, ep_params=ep_params)
+        key = ResponseCache.key("GET", endpoint, ep_params)
+        if self._cache is None or self._cache.ttl_for(endpoint) <= 0:
+            return self._get_once(key, endpoint, ep_params)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            result, is_fresh = cached
+            if not is_fresh:
+                self._cache.revalidate(
+                    key, endpoint, lambda: self._get_once(key, endpoint, ep_params)
+                )
+            return result
+
+        result = self._get_once(key, endpoint, ep_params)
+        self._cache.set(key, endpoint, result)
+        return result
+
+    def _get_once(self, key: str, endpoint: str, ep_params: Dict = None) -> Result:
+        """Performs a GET, coalesced with identical in-flight GETs."""
+
+        def fetch():
+            return self._do(http_method="GET", endpoint=endpoint, ep_params=ep_params)
+
+        if self._single_flight is None:
+            return fetch()
+        return self._single_flight.do(key, fetch)
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of GET requests saved by coalescing."""
+        return self._single_flight.saved if self._single_flight else 0
 
     def post(self, endpoint: str, ep_params: Dict = None, data: Dict = None) -> Result:
         """Sends a POST request to a specified API endpoint.
@@ -159,8 +482,12 @@ class RestAdapter:
         try:
             log_line = f"method={http_method}, url={url}"
             self._logger.debug(msg=log_line)
-            response = requests.request(
-                method=http_method, url=url, verify=self._ssl_verify
+            # Icons live on a separate CDN host, so the session cookie is not sent there
+            response = self._session.request(
+                method=http_method,
+                url=url,
+                verify=self._ssl_verify,
+                headers={"Cookie": None},
             )
         except requests.exceptions.RequestException as e:
             self._logger.error(msg=(str(e)))
@@ -173,3 +500,45 @@ class RestAdapter:
         if not is_success:
             raise Buff163Exception(response.reason)
         return response.content
+
+    def stream_data(self, url: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Streams data from url in chunks instead of loading it into memory.
+
+        Args:
+            url (str): Url of fetch request.
+            chunk_size (int, optional): Bytes per chunk. Defaults to 65536.
+
+        Raises:
+            Buff163Exception: Request failure.
+            Buff163Exception: Status code not valid.
+
+        Yields:
+            Iterator[bytes]: Chunks of the response body.
+        """
+        http_method = "GET"
+        try:
+            log_line = f"method={http_method}, url={url}, stream=True"
+            self._logger.debug(msg=log_line)
+            # Icons live on a separate CDN host, so the session cookie is not sent there
+            response = self._session.request(
+                method=http_method,
+                url=url,
+                verify=self._ssl_verify,
+                headers={"Cookie": None},
+                stream=True,
+            )
+        except requests.exceptions.RequestException as e:
+            self._logger.error(msg=(str(e)))
+            raise Buff163Exception(str(e)) from e
+
+        with response:
+            is_success = 299 >= response.status_code >= 200
+            log_line = f"success={is_success}, status_code={response.status_code}, message={response.reason}"
+            self._logger.debug(msg=log_line)
+            if not is_success:
+                raise Buff163Exception(response.reason)
+            try:
+                yield from response.iter_content(chunk_size=chunk_size)
+            except requests.exceptions.RequestException as e:
+                self._logger.error(msg=(str(e)))
+                raise Buff163Exception(str(e)) from e
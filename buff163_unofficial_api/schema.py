@@ -0,0 +1,115 @@
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+Model = TypeVar("Model")
+
+# Per-class field plans, compiled on first decode
+_PLANS: Dict[type, Tuple[Dict[str, Tuple[str, Optional[Callable]]], Dict]] = {}
+
+
+def price(value: Any) -> Optional[Decimal]:
+    """Converts an API price ("12.5", 12, "") to a Decimal, None when empty."""
+    if value is None or value == "":
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+def cents(value: Any) -> Optional[int]:
+    """Converts an API price to integer cents, None when empty."""
+    value = price(value)
+    return None if value is None else int((value * 100).to_integral_value())
+
+
+class Nested:
+    def __init__(self, model: type) -> None:
+        """Schema converter decoding a dict into ``model``.
+
+        Args:
+            model (type): Model with a field plan.
+        """
+        self.model = model
+
+    def __call__(self, value: Any) -> Any:
+        return decode(self.model, value) if isinstance(value, dict) else value
+
+
+class Many(Nested):
+    """Schema converter decoding a list of dicts into a list of ``model``."""
+
+    def __call__(self, value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        return [decode(self.model, datum) for datum in value]
+
+
+def _compile(model: type) -> Tuple[Dict[str, Tuple[str, Optional[Callable]]], Dict]:
+    """Builds the field plan of a model from its slots, __schema__ and __init__."""
+    converters = {}
+    for klass in reversed(model.__mro__):
+        converters.update(klass.__dict__.get("__schema__", {}))
+
+    fields = {}
+    for slot in model._slot_names:
+        if slot in ("_extra", "_hash"):
+            continue
+        # "_info" backs the public (descriptor) field "info"
+        name = slot[1:] if slot.startswith("_") and hasattr(model, slot[1:]) else slot
+        fields[name] = (name, converters.get(name))
+
+    # Only needed once per model, so not paid at package import
+    import inspect
+
+    defaults = {name: None for name in fields}
+    for param in inspect.signature(model.__init__).parameters.values():
+        if param.name in defaults and param.default is not param.empty:
+            defaults[param.name] = param.default
+    return fields, defaults
+
+
+def decode(model: Type[Model], data: Dict) -> Model:
+    """Decodes a raw API dict straight into a model, in one pass over its keys.
+
+    Known keys are converted by the model's ``__schema__`` (prices, nested
+    models) and set on their slots; unknown keys are kept in ``_extra``;
+    fields the API left out get their ``__init__`` default or None. The
+    model's ``__init__`` is bypassed, so API drift in either direction never
+    raises.
+
+    Args:
+        model (Type[Model]): Slotted model class.
+        data (Dict): Decoded JSON object.
+
+    Returns:
+        Model: Fully typed model.
+    """
+    plan = _PLANS.get(model)
+    if plan is None:
+        plan = _PLANS[model] = _compile(model)
+    fields, defaults = plan
+
+    obj = model.__new__(model)
+    extra = None
+    for key, value in data.items():
+        field = fields.get(key)
+        if field is None:
+            if extra is None:
+                extra = {}
+            extra[key] = value
+            continue
+        name, convert = field
+        setattr(obj, name, convert(value) if convert is not None else value)
+
+    if len(data) - (len(extra) if extra else 0) < len(fields):
+        for name, default in defaults.items():
+            if name not in data:
+                setattr(obj, name, default)
+    obj._extra = extra
+    return obj
+
+
+def decode_many(model: Type[Model], data: List[Dict]) -> List[Model]:
+    """Decodes a list of raw API dicts into models."""
+    return [decode(model, datum) for datum in data]
@@ -0,0 +1,353 @@
+import json
+import os
+import re
+import tempfile
+from bisect import bisect_left
+from collections import Counter
+from enum import Enum
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Union
+from buff163_unofficial_api.json_decoder import get_decoder
+from buff163_unofficial_api.models import Item, MarketChange, SearchHit, SpecificItem
+
+SEARCH_FIELDS = ("market_hash_name", "name", "short_name")
+# Bumped when the saved layout changes
+FORMAT_VERSION = 1
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+Searchable = Union[Item, SpecificItem, dict]
+Categories = Union[Enum, str, Iterable[Union[Enum, str]], None]
+
+
+def normalize(text: str) -> str:
+    """Case-folds a name and turns punctuation runs into single spaces.
+
+    "AK-47 | Redline (Field-Tested)" becomes "ak 47 redline field tested".
+    """
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def ngrams(text: str, n: int = 3) -> Set[str]:
+    """Gets the character n-grams of a normalized name, padded with spaces."""
+    padded = f" {text} "
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+def _category_value(category: Union[Enum, str, None]) -> Optional[str]:
+    return category.value if isinstance(category, Enum) else category
+
+
+def _category_of(item: Searchable) -> Optional[str]:
+    """The weapon tag of an item, which is its cs_enums category value."""
+    if isinstance(item, dict):
+        try:
+            return item["goods_info"]["info"]["tags"]["weapon"]["internal_name"]
+        except (KeyError, TypeError):
+            return None
+    info = getattr(getattr(item, "goods_info", None), "info", None)
+    weapon = getattr(getattr(info, "tags", None), "weapon", None)
+    return getattr(weapon, "internal_name", None)
+
+
+class SearchIndex:
+    def __init__(self, items: Iterable[Searchable] = (), n: int = 3) -> None:
+        """Offline name search over market items.
+
+        Every name field (market_hash_name, name, short_name) of an item is
+        a "slot". Normalized names map to slots in a hash table for exact
+        lookups and in a sorted array searched with bisect for prefix
+        queries (the same walk as a trie, in one flat list). Fuzzy search
+        scores slots by the n-grams they share with the query (Dice
+        coefficient) through an inverted index. Queries can be limited to
+        cs_enums categories. ``save``/``load`` keep the built index on disk
+        as JSON, so loading it does not rebuild anything.
+
+        Args:
+            items (Iterable[Searchable], optional): Item, SpecificItem or raw /market/goods rows. Defaults to ().
+            n (int, optional): N-gram length of fuzzy search. Defaults to 3.
+        """
+        self._n = n
+        self._clear()
+        self.add_many(items)
+
+    def _clear(self) -> None:
+        # Per entry; an entry's id is None once removed
+        self._ids: List[Optional[int]] = []
+        self._categories: List[Optional[str]] = []
+        self._names: List[List[Optional[str]]] = []
+        self._entry_of: Dict[int, int] = {}
+        # Per slot (entry * len(SEARCH_FIELDS) + field index): n-gram count
+        self._sizes: List[int] = []
+        self._exact: Dict[str, List[int]] = {}
+        # (normalized name, slot), sorted lazily before prefix queries
+        self._keys: List[List] = []
+        self._sorted = True
+        self._grams: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entry_of)
+
+    def __contains__(self, goods_id: int) -> bool:
+        return goods_id in self._entry_of
+
+    def add(self, item: Searchable, category: Union[Enum, str] = None) -> None:
+        """Indexes the names of an item, replacing an earlier version.
+
+        Re-adding an item with the same names and category is a no-op, so
+        price updates from a MarketWatcher cost nothing.
+
+        Args:
+            item (Searchable): Item, SpecificItem or raw /market/goods row.
+            category (Union[Enum, str], optional): cs_enums category. Defaults to the item's weapon tag.
+        """
+        if isinstance(item, dict):
+            goods_id = item["id"]
+            names = [item.get(field) for field in SEARCH_FIELDS]
+        else:
+            goods_id = item.id
+            names = [getattr(item, field, None) for field in SEARCH_FIELDS]
+        category = _category_value(category) or _category_of(item)
+
+        entry = self._entry_of.get(goods_id)
+        if entry is not None:
+            if self._names[entry] == names and self._categories[entry] == category:
+                return
+            self.remove(goods_id)
+        self._append(goods_id, names, category)
+
+    def _append(
+        self, goods_id: int, names: List[Optional[str]], category: Optional[str]
+    ) -> None:
+        entry = len(self._ids)
+        self._entry_of[goods_id] = entry
+        self._ids.append(goods_id)
+        self._categories.append(category)
+        self._names.append(names)
+        for field_index, name in enumerate(names):
+            slot = entry * len(SEARCH_FIELDS) + field_index
+            text = normalize(name) if name else ""
+            if not text:
+                self._sizes.append(0)
+                continue
+            grams = ngrams(text, self._n)
+            self._sizes.append(len(grams))
+            self._exact.setdefault(text, []).append(slot)
+            self._keys.append([text, slot])
+            self._sorted = False
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(slot)
+
+    def add_many(self, items: Iterable[Searchable], category=None) -> None:
+        """Indexes many items, see add."""
+        for item in items:
+            self.add(item, category)
+
+    def remove(self, goods_id: int) -> bool:
+        """Drops an item from search results.
+
+        Returns:
+            bool: Whether the item was indexed.
+        """
+        entry = self._entry_of.pop(goods_id, None)
+        if entry is None:
+            return False
+        # Postings keep the entry until dead entries outnumber live ones
+        self._ids[entry] = None
+        if len(self._ids) - len(self._entry_of) > len(self._entry_of):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """Rebuilds the index without removed entries."""
+        live = [
+            (self._ids[entry], self._names[entry], self._categories[entry])
+            for entry in sorted(self._entry_of.values())
+        ]
+        self._clear()
+        for goods_id, names, category in live:
+            self._append(goods_id, names, category)
+
+    def apply(self, change: MarketChange) -> None:
+        """Applies a MarketWatcher change."""
+        if change.kind == MarketChange.REMOVED:
+            self.remove(change.goods_id)
+        else:
+            self.add(change.item)
+
+    @staticmethod
+    def _category_filter(category: Categories) -> Optional[Set[str]]:
+        if category is None:
+            return None
+        if isinstance(category, (Enum, str)):
+            return {_category_value(category)}
+        return {_category_value(value) for value in category}
+
+    def _live(self, slot: int, categories: Optional[Set[str]]) -> bool:
+        entry = slot // len(SEARCH_FIELDS)
+        return self._ids[entry] is not None and (
+            categories is None or self._categories[entry] in categories
+        )
+
+    def _hit(self, slot: int, score: float) -> SearchHit:
+        entry, field_index = divmod(slot, len(SEARCH_FIELDS))
+        return SearchHit(
+            self._ids[entry],
+            self._names[entry][0],
+            self._categories[entry],
+            SEARCH_FIELDS[field_index],
+            score,
+        )
+
+    def lookup(self, name: str, category: Categories = None) -> Optional[int]:
+        """Resolves a name to its goods_id.
+
+        Matches any name field, ignoring case and punctuation. A
+        market_hash_name match wins over the other fields.
+
+        Args:
+            name (str): E.g. "AK-47 | Redline (Field-Tested)".
+            category (Categories, optional): cs_enums category (or several) to match in. Defaults to None.
+
+        Returns:
+            Optional[int]: goods_id, None when nothing matches.
+        """
+        categories = self._category_filter(category)
+        best = None
+        for slot in self._exact.get(normalize(name), ()):
+            if not self._live(slot, categories):
+                continue
+            if best is None or slot % len(SEARCH_FIELDS) < best % len(SEARCH_FIELDS):
+                best = slot
+        return None if best is None else self._ids[best // len(SEARCH_FIELDS)]
+
+    def prefix(
+        self, text: str, category: Categories = None, limit: int = 10
+    ) -> List[SearchHit]:
+        """Finds items with a name starting with ``text``, in name order.
+
+        Args:
+            text (str): Start of a name, e.g. "AK-47 | Red".
+            category (Categories, optional): cs_enums category (or several) to search in. Defaults to None.
+            limit (int, optional): Max hits. Defaults to 10.
+
+        Returns:
+            List[SearchHit]: One hit per item, score 1.
+        """
+        if not self._sorted:
+            self._keys.sort()
+            self._sorted = True
+        key = normalize(text)
+        categories = self._category_filter(category)
+        hits = []
+        seen = set()
+        i = bisect_left(self._keys, [key])
+        while i < len(self._keys) and len(hits) < limit:
+            name, slot = self._keys[i]
+            if not name.startswith(key):
+                break
+            i += 1
+            entry = slot // len(SEARCH_FIELDS)
+            if entry in seen or not self._live(slot, categories):
+                continue
+            seen.add(entry)
+            hits.append(self._hit(slot, 1.0))
+        return hits
+
+    def search(
+        self,
+        text: str,
+        category: Categories = None,
+        limit: int = 10,
+        min_score: float = 0.3,
+    ) -> List[SearchHit]:
+        """Fuzzy search tolerating typos, missing words and word order.
+
+        Args:
+            text (str): Query, e.g. "redline ak47 field tested".
+            category (Categories, optional): cs_enums category (or several) to search in. Defaults to None.
+            limit (int, optional): Max hits. Defaults to 10.
+            min_score (float, optional): Lowest n-gram similarity returned, from 0 to 1. Defaults to 0.3.
+
+        Returns:
+            List[SearchHit]: One hit per item, best first.
+        """
+        grams = ngrams(normalize(text), self._n)
+        categories = self._category_filter(category)
+        # Number of query n-grams in each slot
+        shared = Counter(chain.from_iterable(self._grams.get(g, ()) for g in grams))
+
+        best: Dict[int, tuple] = {}
+        for slot, count in shared.items():
+            score = 2 * count / (len(grams) + self._sizes[slot])
+            if score < min_score or not self._live(slot, categories):
+                continue
+            entry = slot // len(SEARCH_FIELDS)
+            if entry not in best or score > best[entry][0]:
+                best[entry] = (score, slot)
+        ranked = sorted(
+            best.values(),
+            key=lambda match: (-match[0], self._sizes[match[1]], match[1]),
+        )
+        return [self._hit(slot, score) for score, slot in ranked[:limit]]
+
+    def save(self, path: str) -> None:
+        """Writes the built index to a JSON file, atomically.
+
+        Args:
+            path (str): Destination file.
+        """
+        if len(self._entry_of) != len(self._ids):
+            self._compact()
+        if not self._sorted:
+            self._keys.sort()
+            self._sorted = True
+        state = {
+            "format": FORMAT_VERSION,
+            "n": self._n,
+            "ids": self._ids,
+            "categories": self._categories,
+            "names": self._names,
+            "sizes": self._sizes,
+            "keys": self._keys,
+            "grams": self._grams,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "SearchIndex":
+        """Reads an index written by save.
+
+        Args:
+            path (str): Saved index file.
+
+        Raises:
+            ValueError: File written by an incompatible version.
+
+        Returns:
+            SearchIndex: Ready to query.
+        """
+        with open(path, "rb") as f:
+            state = get_decoder()(f.read())
+        if state.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported search index format: {state.get('format')}")
+        index = cls(n=state["n"])
+        index._ids = state["ids"]
+        index._categories = state["categories"]
+        index._names = state["names"]
+        index._sizes = state["sizes"]
+        index._keys = state["keys"]
+        index._grams = state["grams"]
+        index._entry_of = {goods_id: entry for entry, goods_id in enumerate(index._ids)}
+        exact = index._exact
+        for text, slot in index._keys:
+            exact.setdefault(text, []).append(slot)
+        return index
@@ -0,0 +1,421 @@
+"""Catalog crawl sharded over worker processes through a shared SQLite queue.
+
+Every (category, page) unit lives in one SQLite file. Workers claim units
+under a time-limited lease, fetch them through their own Buff163API and
+append the rows to their own shard file. A unit whose worker died is
+claimed again once its lease runs out. Workers may run on several machines
+as long as they share the directory on a filesystem with working locks::
+
+    crawl = ShardedCrawl("buff163_shards")
+    crawl.seed()
+    crawl.run(processes=4, session_cookie=cookie)
+    crawl.merge()
+
+or, per machine: ``python -m buff163_unofficial_api.sharded_crawl DIR work``.
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Dict, Iterable, Iterator, List, Union
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.crawler import CrawlUnit, all_categories
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, CLAIMED, DONE, FAILED)
+
+
+class WorkQueue:
+    def __init__(
+        self,
+        path: str = "buff163_queue.sqlite3",
+        lease: float = 300.0,
+        max_attempts: int = 3,
+    ) -> None:
+        """Crawl units shared by processes through one SQLite file.
+
+        ``claim()`` takes pending units, or claimed units whose lease ran out,
+        in an immediate transaction so two workers never get the same unit
+        at once. Completing page 1 of a category queues its other pages.
+        Leases use wall-clock time, so machines sharing a queue need
+        synchronized clocks.
+
+        Args:
+            path (str, optional): SQLite database file. Defaults to "buff163_queue.sqlite3".
+            lease (float, optional): Seconds a claim lasts before the unit may be claimed again. Defaults to 300.0.
+            max_attempts (int, optional): Claims of a unit before it is marked failed. Defaults to 3.
+        """
+        self.path = path
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # Transactions are explicit, see _transaction()
+        self._conn = sqlite3.connect(
+            path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            "category TEXT NOT NULL, page INTEGER NOT NULL, "
+            f"state TEXT NOT NULL DEFAULT '{PENDING}', worker TEXT, "
+            "lease_until REAL, attempts INTEGER NOT NULL DEFAULT 0, error TEXT, "
+            "PRIMARY KEY (category, page)) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS units_state ON units (state, lease_until)"
+        )
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "WorkQueue":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            # Takes the write lock up front, so concurrent claims serialize
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def seed(self, categories: Iterable[Union[Enum, str]] = None) -> int:
+        """Queues page 1 of every category not queued yet.
+
+        Args:
+            categories (Iterable[Union[Enum, str]], optional): Categories to crawl. Defaults to every cs_enums member.
+
+        Returns:
+            int: Units added.
+        """
+        values = [
+            category.value if isinstance(category, Enum) else category
+            for category in (categories if categories is not None else all_categories())
+        ]
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO units (category, page) VALUES (?, 1)",
+                [(category,) for category in values],
+            )
+            return conn.total_changes - before
+
+    def claim(self, worker: str, limit: int = 1) -> List[CrawlUnit]:
+        """Leases up to ``limit`` units to a worker, first pages first.
+
+        Args:
+            worker (str): Worker id, recorded with the claim.
+            limit (int, optional): Max units claimed. Defaults to 1.
+
+        Returns:
+            List[CrawlUnit]: Claimed (category, page) units, empty when none is available.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            # Abandoned units out of attempts are given up on
+            conn.execute(
+                f"UPDATE units SET state = '{FAILED}', error = 'lease expired' "
+                f"WHERE state = '{CLAIMED}' AND lease_until < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            units = conn.execute(
+                "SELECT category, page FROM units "
+                f"WHERE state = '{PENDING}' OR (state = '{CLAIMED}' AND lease_until < ?) "
+                "ORDER BY page, category LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            conn.executemany(
+                f"UPDATE units SET state = '{CLAIMED}', worker = ?, lease_until = ?, "
+                "attempts = attempts + 1 WHERE category = ? AND page = ?",
+                [
+                    (worker, now + self.lease, category, page)
+                    for category, page in units
+                ],
+            )
+        return units
+
+    def complete(self, category: str, page: int, total_page: int = None) -> None:
+        """Marks a unit done, queueing pages 2..total_page when given.
+
+        Args:
+            category (str): Unit category.
+            page (int): Unit page.
+            total_page (int, optional): Pages of the category, as reported by page 1. Defaults to None.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE units SET state = '{DONE}', lease_until = NULL, error = NULL "
+                "WHERE category = ? AND page = ?",
+                (category, page),
+            )
+            if total_page:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO units (category, page) VALUES (?, ?)",
+                    [(category, p) for p in range(2, total_page + 1)],
+                )
+
+    def fail(self, category: str, page: int, error: str = None) -> None:
+        """Releases a unit after an error, failing it once out of attempts.
+
+        Args:
+            category (str): Unit category.
+            page (int): Unit page.
+            error (str, optional): Error message kept with the unit. Defaults to None.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE units SET state = CASE WHEN attempts >= ? THEN '{FAILED}' "
+                f"ELSE '{PENDING}' END, lease_until = NULL, error = ? "
+                "WHERE category = ? AND page = ?",
+                (self.max_attempts, error, category, page),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        """Gets the number of units per state."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM units GROUP BY state"
+            ).fetchall()
+        return dict({state: 0 for state in STATES}, **dict(rows))
+
+    def is_finished(self) -> bool:
+        """Whether no unit is pending or claimed."""
+        counts = self.counts()
+        return not counts[PENDING] and not counts[CLAIMED]
+
+    def failed(self) -> List[tuple]:
+        """Gets the failed units as (category, page, error)."""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT category, page, error FROM units WHERE state = '{FAILED}' "
+                "ORDER BY category, page"
+            ).fetchall()
+
+
+def default_worker_id() -> str:
+    """Worker id unique across machines and processes."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class ShardedCrawl:
+    def __init__(
+        self,
+        directory: str = "buff163_shards",
+        lease: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        logger: logging.Logger = None,
+    ) -> None:
+        """Crawl split over worker processes sharing a directory.
+
+        The directory holds the work queue (``queue.sqlite3``) and one
+        ``shard-<worker>.jsonl`` file of raw market rows per worker. A unit's
+        rows are written before it is marked done, so a unit run twice
+        (after its worker died) only produces duplicate rows, which
+        ``merge()`` drops.
+
+        Args:
+            directory (str, optional): Shared crawl directory. Defaults to "buff163_shards".
+            lease (float, optional): Seconds before a claimed unit is considered abandoned. Defaults to 300.0.
+            max_attempts (int, optional): Claims of a unit before it is marked failed. Defaults to 3.
+            poll_interval (float, optional): Seconds an idle worker waits for units held by others. Defaults to 1.0.
+            logger (logging.Logger, optional): App logger. Defaults to None.
+        """
+        self.directory = directory
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._logger = logger or logging.getLogger(__name__)
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def queue_path(self) -> str:
+        return os.path.join(self.directory, "queue.sqlite3")
+
+    def queue(self) -> WorkQueue:
+        """Opens the work queue; close it when done."""
+        return WorkQueue(self.queue_path, self.lease, self.max_attempts)
+
+    def seed(self, categories: Iterable[Union[Enum, str]] = None) -> int:
+        """Queues the first page of every category, see WorkQueue.seed."""
+        with self.queue() as queue:
+            return queue.seed(categories)
+
+    def shard_paths(self) -> List[str]:
+        """Gets every shard file in the directory."""
+        return sorted(
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.startswith("shard-") and name.endswith(".jsonl")
+        )
+
+    def work(
+        self, fetch_page: Callable[[str, int], dict], worker_id: str = None
+    ) -> Dict:
+        """Claims and runs units in this process until the queue is finished.
+
+        Args:
+            fetch_page (Callable[[str, int], dict]): Fetches the ``data`` payload of (category, page), e.g. Buff163API.fetch_market_page.
+            worker_id (str, optional): Claim owner and shard name. Defaults to "<hostname>-<pid>".
+
+        Returns:
+            Dict: worker, pages, items and failed counts of this worker.
+        """
+        worker_id = worker_id or default_worker_id()
+        stats = {"worker": worker_id, "pages": 0, "items": 0, "failed": 0}
+        shard = os.path.join(self.directory, f"shard-{worker_id}.jsonl")
+        with self.queue() as queue, open(shard, "a") as out:
+            while True:
+                units = queue.claim(worker_id)
+                if not units:
+                    if queue.is_finished():
+                        return stats
+                    # Others hold the remaining units; theirs may add pages or expire
+                    time.sleep(self.poll_interval)
+                    continue
+
+                category, page = units[0]
+                try:
+                    data = fetch_page(category, page)
+                except Exception as e:
+                    self._logger.warning(
+                        msg=f"crawl unit failed, category={category}, page={page}: {e}"
+                    )
+                    queue.fail(category, page, str(e))
+                    stats["failed"] += 1
+                    continue
+                out.writelines(json.dumps(row) + "\n" for row in data["items"])
+                out.flush()
+                queue.complete(
+                    category, page, data["total_page"] if page == 1 else None
+                )
+                stats["pages"] += 1
+                stats["items"] += len(data["items"])
+
+    def run(self, processes: int = 4, **api_kwargs) -> List[Dict]:
+        """Runs ``processes`` local workers, each with its own Buff163API.
+
+        Args:
+            processes (int, optional): Worker processes. Defaults to 4.
+            **api_kwargs: Buff163API arguments, e.g. session_cookie or page_size.
+
+        Returns:
+            List[Dict]: Stats of every worker, see work().
+        """
+        options = {
+            "lease": self.lease,
+            "max_attempts": self.max_attempts,
+            "poll_interval": self.poll_interval,
+        }
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_work_process, self.directory, options, api_kwargs)
+                for _ in range(processes)
+            ]
+            return [future.result() for future in futures]
+
+    def rows(self) -> Iterator[dict]:
+        """Yields the rows of every shard, each goods id once."""
+        seen = set()
+        for path in self.shard_paths():
+            with open(path) as f:
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        # Torn last line from a killed worker
+                        continue
+                    if row["id"] in seen:
+                        continue
+                    seen.add(row["id"])
+                    yield row
+
+    def merge(self, output: str = None) -> int:
+        """Writes the deduplicated rows of every shard to one JSON-lines file.
+
+        Args:
+            output (str, optional): Merged file. Defaults to "<directory>/catalog.jsonl".
+
+        Returns:
+            int: Rows written.
+        """
+        output = output or os.path.join(self.directory, "catalog.jsonl")
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output)))
+        count = 0
+        try:
+            with os.fdopen(fd, "w") as f:
+                for row in self.rows():
+                    f.write(json.dumps(row) + "\n")
+                    count += 1
+            os.replace(tmp_path, output)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        """Gets the number of units per state."""
+        with self.queue() as queue:
+            return queue.counts()
+
+
+def _work_process(directory: str, options: Dict, api_kwargs: Dict) -> Dict:
+    with Buff163API(**api_kwargs) as api:
+        return ShardedCrawl(directory, **options).work(api.fetch_market_page)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m buff163_unofficial_api.sharded_crawl"
+    )
+    parser.add_argument("directory", help="crawl directory shared by every worker")
+    commands = parser.add_subparsers(dest="command", required=True)
+    seed = commands.add_parser("seed", help="queue the first page of each category")
+    seed.add_argument("--categories", nargs="+")
+    work = commands.add_parser("work", help="run workers on this machine")
+    work.add_argument("--processes", type=int, default=4)
+    work.add_argument("--hostname", default="buff.163.com/api")
+    work.add_argument("--page-size", type=int, default=80)
+    work.add_argument("--lease", type=float, default=300.0)
+    merge = commands.add_parser("merge", help="write the deduplicated catalog")
+    merge.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    if args.command == "seed":
+        print(f"queued {ShardedCrawl(args.directory).seed(args.categories)} units")
+    elif args.command == "work":
+        crawl = ShardedCrawl(args.directory, lease=args.lease)
+        for stats in crawl.run(
+            args.processes,
+            hostname=args.hostname,
+            session_cookie=os.environ.get("BUFF163_COOKIE", ""),
+            page_size=args.page_size,
+        ):
+            print(stats)
+        print(crawl.stats())
+    else:
+        print(f"merged {ShardedCrawl(args.directory).merge(args.output)} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import threading
+from typing import Any, Callable, Dict
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        """Coalesces concurrent calls sharing a key into one execution.
+
+        The first caller for a key runs the function; callers arriving while it
+        is in flight wait and receive the same result (or exception).
+        """
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.saved = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Runs ``fn`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key (str): Identity of the call.
+            fn (Callable[[], Any]): Work to run for the first caller.
+
+        Returns:
+            Any: Result of the single execution.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.saved += 1
+                is_leader = False
+            else:
+                call = self._calls[key] = _Call()
+                is_leader = True
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,192 @@
+import sqlite3
+import threading
+import time
+from itertools import islice
+from typing import Iterable, List, Union
+from buff163_unofficial_api.models import Item, PriceSnapshot
+from buff163_unofficial_api.schema import cents
+
+# Prices first, stored as integer cents
+SNAPSHOT_FIELDS = (
+    "sell_min_price",
+    "buy_max_price",
+    "sell_num",
+    "buy_num",
+    "transacted_num",
+)
+_COLUMNS = ("goods_id", "ts") + SNAPSHOT_FIELDS
+# Ids bound per query, under SQLite's 999 variable limit of older builds
+_IDS_PER_QUERY = 500
+
+
+class SnapshotStore:
+    def __init__(
+        self, path: str = "buff163_snapshots.sqlite3", batch_size: int = 1000
+    ) -> None:
+        """Time series of market prices and volumes in SQLite.
+
+        Rows are keyed by (goods_id, ts) in a WITHOUT ROWID table, so the
+        history of one item is a range scan of the primary key. A second
+        table keeps the latest row per item, updated in the same
+        transaction, so "latest price of everything" never scans the
+        history. Writes are batched into one transaction per ``batch_size``
+        rows on a WAL database, which lets readers query while a crawl
+        writes. Prices are stored as integer cents.
+
+        Args:
+            path (str, optional): SQLite database file. Defaults to "buff163_snapshots.sqlite3".
+            batch_size (int, optional): Rows written per transaction. Defaults to 1000.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f"{field} INTEGER" for field in SNAPSHOT_FIELDS)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            f"goods_id INTEGER NOT NULL, ts REAL NOT NULL, {columns}, "
+            "PRIMARY KEY (goods_id, ts)) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS snapshots_ts ON snapshots (ts)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS latest ("
+            f"goods_id INTEGER PRIMARY KEY, ts REAL NOT NULL, {columns})"
+        )
+        self._conn.commit()
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+        self._insert = (
+            f"INSERT OR REPLACE INTO snapshots ({', '.join(_COLUMNS)}) "
+            f"VALUES ({placeholders})"
+        )
+        self._upsert_latest = (
+            f"INSERT INTO latest ({', '.join(_COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT (goods_id) DO UPDATE SET {updates} "
+            "WHERE excluded.ts >= latest.ts"
+        )
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    @staticmethod
+    def _row(item: Union[Item, dict], ts: float) -> tuple:
+        if isinstance(item, dict):
+            values = [item.get(field) for field in SNAPSHOT_FIELDS]
+            goods_id = item["id"]
+        else:
+            values = [getattr(item, field) for field in SNAPSHOT_FIELDS]
+            goods_id = item.id
+        values[0] = cents(values[0])
+        values[1] = cents(values[1])
+        return (goods_id, ts, *values)
+
+    def record(self, items: Iterable[Union[Item, dict]], ts: float = None) -> int:
+        """Records the current price and volume of items.
+
+        Args:
+            items (Iterable[Union[Item, dict]]): Items, or raw /market/goods rows (e.g. from Crawler).
+            ts (float, optional): Unix time of the observation. Defaults to now.
+
+        Returns:
+            int: Rows written.
+        """
+        ts = time.time() if ts is None else ts
+        rows = (self._row(item, ts) for item in items)
+        written = 0
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return written
+            with self._lock:
+                with self._conn:
+                    self._conn.executemany(self._insert, batch)
+                    self._conn.executemany(self._upsert_latest, batch)
+            written += len(batch)
+
+    def history(
+        self, goods_id: int, start: float = None, end: float = None
+    ) -> List[PriceSnapshot]:
+        """Gets the snapshots of one item, oldest first.
+
+        Args:
+            goods_id (int): Item's goods_id.
+            start (float, optional): Earliest unix time, inclusive. Defaults to None.
+            end (float, optional): Latest unix time, exclusive. Defaults to None.
+
+        Returns:
+            List[PriceSnapshot]: Snapshots in time order.
+        """
+        query = f"SELECT {', '.join(_COLUMNS)} FROM snapshots WHERE goods_id = ?"
+        params = [goods_id]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND ts < ?"
+            params.append(end)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY ts", params).fetchall()
+        return [PriceSnapshot(*row) for row in rows]
+
+    def latest(self, goods_ids: Iterable[int] = None) -> List[PriceSnapshot]:
+        """Gets the most recent snapshot of every item (or of ``goods_ids``).
+
+        Args:
+            goods_ids (Iterable[int], optional): Items to get. Defaults to every item.
+
+        Returns:
+            List[PriceSnapshot]: One snapshot per item, ordered by goods_id.
+        """
+        query = f"SELECT {', '.join(_COLUMNS)} FROM latest"
+        if goods_ids is None:
+            with self._lock:
+                rows = self._conn.execute(query + " ORDER BY goods_id").fetchall()
+            return [PriceSnapshot(*row) for row in rows]
+
+        ids = iter(goods_ids)
+        rows = []
+        while True:
+            chunk = list(islice(ids, _IDS_PER_QUERY))
+            if not chunk:
+                break
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._lock:
+                rows += self._conn.execute(
+                    f"{query} WHERE goods_id IN ({placeholders})", chunk
+                ).fetchall()
+        # goods_id is unique in latest and comes first
+        rows.sort()
+        return [PriceSnapshot(*row) for row in rows]
+
+    def between(self, start: float, end: float) -> List[PriceSnapshot]:
+        """Gets every snapshot taken in a time range, oldest first.
+
+        Args:
+            start (float): Earliest unix time, inclusive.
+            end (float): Latest unix time, exclusive.
+
+        Returns:
+            List[PriceSnapshot]: Snapshots in time order.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM snapshots "
+                "WHERE ts >= ? AND ts < ? ORDER BY ts",
+                (start, end),
+            ).fetchall()
+        return [PriceSnapshot(*row) for row in rows]
@@ -0,0 +1,114 @@
+import logging
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from buff163_unofficial_api.models import Item, MarketChange
+
+# Fields whose changes are reported by default
+WATCHED_FIELDS = (
+    "sell_min_price",
+    "buy_max_price",
+    "quick_price",
+    "sell_num",
+    "buy_num",
+)
+
+
+class MarketWatcher:
+    def __init__(
+        self,
+        fetch_rows: Callable[[], Iterable[dict]],
+        model: Callable[..., Item] = Item,
+        fields: Iterable[str] = WATCHED_FIELDS,
+        on_change: Callable[[MarketChange], None] = None,
+        logger: logging.Logger = None,
+    ) -> None:
+        """Change feed over repeated polls of the market.
+
+        Only one hash of the watched fields is kept per goods_id. Each poll
+        hashes the raw rows and compares them with the previous poll, so a
+        model is built only for new and changed rows. The first poll
+        reports every row as new.
+
+        Args:
+            fetch_rows (Callable[[], Iterable[dict]]): Fetches the raw /market/goods rows of one poll.
+            model (Callable[..., Item], optional): Model built for new and changed rows. Defaults to Item.
+            fields (Iterable[str], optional): Row fields that make up the fingerprint. Defaults to WATCHED_FIELDS.
+            on_change (Callable[[MarketChange], None], optional): Called with every change. Defaults to None.
+            logger (logging.Logger, optional): App logger. Defaults to None.
+        """
+        self._fetch_rows = fetch_rows
+        self._model = model
+        self._fields = tuple(fields)
+        self._on_change = on_change
+        self._logger = logger or logging.getLogger(__name__)
+        self._fingerprints: Dict[int, int] = {}
+        self.polls = 0
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def fingerprint(self, row: dict) -> int:
+        """Hashes the watched fields of a raw row."""
+        return hash(tuple([row.get(field) for field in self._fields]))
+
+    def poll(self) -> List[MarketChange]:
+        """Fetches the market once and diffs it against the previous poll.
+
+        If the fetch fails, the error propagates and the previous state is
+        kept, so no item is reported as removed.
+
+        Returns:
+            List[MarketChange]: New, changed and removed items.
+        """
+        previous = self._fingerprints
+        current = {}
+        changes = []
+        for row in self._fetch_rows():
+            goods_id = row["id"]
+            if goods_id in current:
+                # Listed again by another category or page
+                continue
+            fingerprint = self.fingerprint(row)
+            current[goods_id] = fingerprint
+            old = previous.get(goods_id)
+            if old == fingerprint:
+                continue
+            kind = MarketChange.NEW if old is None else MarketChange.CHANGED
+            changes.append(MarketChange(kind, goods_id, self._model(**row)))
+        for goods_id in previous.keys() - current.keys():
+            changes.append(MarketChange(MarketChange.REMOVED, goods_id))
+
+        self._fingerprints = current
+        self.polls += 1
+        if self._on_change is not None:
+            for change in changes:
+                self._on_change(change)
+        return changes
+
+    def watch(
+        self, interval: float = 30.0, max_polls: Optional[int] = None
+    ) -> Iterator[MarketChange]:
+        """Polls forever (or ``max_polls`` times), yielding changes as found.
+
+        A failed poll is logged and retried on the next interval.
+
+        Args:
+            interval (float, optional): Seconds between the start of two polls. Defaults to 30.0.
+            max_polls (Optional[int], optional): Stop after this many polls. Defaults to None.
+
+        Yields:
+            Iterator[MarketChange]: Changes, poll after poll.
+        """
+        polled = 0
+        while max_polls is None or polled < max_polls:
+            start = time.monotonic()
+            try:
+                changes = self.poll()
+            except Exception as e:
+                self._logger.warning(msg=f"market poll failed: {e}")
+                changes = []
+            yield from changes
+            polled += 1
+            if max_polls is not None and polled >= max_polls:
+                return
+            time.sleep(max(0.0, interval - (time.monotonic() - start)))
@@ -15,12 +15,14 @@ setup(
     url="https://github.com/markzhdan/buff163-unofficial-api",
     license="MIT",
     packages=find_packages(),
+    install_requires=["requests"],
+    extras_require={"async": ["aiohttp"], "frame": ["numpy"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     long_description=long_description,
     long_description_content_type="text/markdown",
 )
@@ -0,0 +1,172 @@
+import zlib
+
+
+def make_tag(category: str, internal_name: str, localized_name: str) -> dict:
+    return {
+        "category": category,
+        # Stable across processes, unlike hash() under PYTHONHASHSEED
+        "id": zlib.crc32(internal_name.encode()) % 100000,
+        "internal_name": internal_name,
+        "localized_name": localized_name,
+    }
+
+
+def make_item(goods_id: int = 1, sell_min_price: str = "100.5") -> dict:
+    """Market row shaped like an entry of /market/goods ``data.items``."""
+    return {
+        "appid": 730,
+        "bookmarked": False,
+        "buy_max_price": "99",
+        "buy_num": 3,
+        "can_bargain": True,
+        "can_search_by_tournament": False,
+        "description": None,
+        "game": "csgo",
+        "goods_info": {
+            "icon_url": f"https://g.fp.ps.netease.com/market/file/{goods_id}.png",
+            "info": {
+                "tags": {
+                    "exterior": make_tag("exterior", "wearcategory2", "Field-Tested"),
+                    "quality": make_tag("quality", "normal", "Normal"),
+                    "rarity": make_tag("rarity", "ancient_weapon", "Covert"),
+                    "type": make_tag("type", "csgo_type_rifle", "Rifle"),
+                    "weapon": make_tag("weapon", "weapon_ak47", "AK-47"),
+                }
+            },
+            "item_id": None,
+            "original_icon_url": f"https://g.fp.ps.netease.com/market/file/{goods_id}_o.png",
+            "steam_price": "15.5",
+            "steam_price_cny": "110.2",
+        },
+        "has_buff_price_history": True,
+        "id": goods_id,
+        "market_hash_name": f"AK-47 | Redline (Field-Tested) #{goods_id}",
+        "market_min_price": "0",
+        "name": f"AK-47 | Redline (Field-Tested) #{goods_id}",
+        "quick_price": "100.1",
+        "sell_min_price": sell_min_price,
+        "sell_num": 42,
+        "sell_reference_price": "100.5",
+        "short_name": "AK-47 | Redline",
+        "steam_market_url": f"https://steamcommunity.com/market/listings/730/{goods_id}",
+        "transacted_num": 7,
+    }
+
+
+def make_page(items: list, page_num: int = 1, total_page: int = 1) -> dict:
+    """Decoded /market/goods response body."""
+    return {
+        "code": "OK",
+        "data": {
+            "items": items,
+            "page_num": page_num,
+            "page_size": len(items),
+            "total_count": len(items) * total_page,
+            "total_page": total_page,
+        },
+        "msg": None,
+    }
+
+
+def make_specific_item(goods_id: int = 1) -> dict:
+    """Decoded /market/goods/info ``data`` payload."""
+    item = make_item(goods_id)
+    sort_by_fields = {
+        "list": [
+            {
+                "attribute": "sort_by",
+                "default_value": "default",
+                "list": [{"title": "Default", "value": "default"}],
+            }
+        ],
+        "title": "Sort",
+    }
+    return {
+        "allow_bundle_inventory": False,
+        "appid": 730,
+        "asset_tags": [],
+        "asset_tags_buy_order": [],
+        "asset_tags_history": [],
+        "bookmarked": False,
+        "buy_max_price": item["buy_max_price"],
+        "buy_num": item["buy_num"],
+        "can_buy": True,
+        "can_sort_by_heat": False,
+        "container_type": "",
+        "containers": [],
+        "description": None,
+        "fade_choices": [],
+        "game": "csgo",
+        "goods_info": dict(
+            item["goods_info"],
+            can_3_d_inspect=True,
+            can_display_inspect=True,
+            can_inspect=True,
+            can_preview=True,
+            can_preview_upload=False,
+            can_search_by_patch=False,
+            can_search_by_sticker=True,
+            can_search_by_tournament=True,
+            can_specific_buy=False,
+            can_specific_paintwear_buy=True,
+            normal_icon_url=item["goods_info"]["icon_url"],
+            specific=[],
+            specific_paintwear_buying_choices=[["0.15", "0.18"]],
+        ),
+        "has_buff_price_history": True,
+        "has_bundle_inventory_order": False,
+        "has_fade_name": False,
+        "has_paintwear_rank": True,
+        "has_related": True,
+        "has_rune": False,
+        "id": goods_id,
+        "is_container": False,
+        "item_id": None,
+        "market_hash_name": item["market_hash_name"],
+        "market_min_price": 0,
+        "name": item["name"],
+        "paintseed_filters": [
+            {"name": "Pattern", "placeholder": "", "search": True, "type": "input"}
+        ],
+        "paintseed_filters_buy_order": [],
+        "paintseed_filters_history": [],
+        "paintwear_choices": [["0.15", "0.18"]],
+        "paintwear_range": ["0.10", "0.70"],
+        "quick_price": item["quick_price"],
+        "rank_types": [],
+        "recent_sold_count": 12,
+        "relative_goods": [
+            {
+                "goods_id": goods_id + 1,
+                "goods_name": "Minimal Wear",
+                "is_change": False,
+                "sell_min_price": "150",
+                "sell_num": 9,
+                "tag": "wearcategory1",
+                "tag_name": "Minimal Wear",
+            }
+        ],
+        "sell_min_price": item["sell_min_price"],
+        "sell_num": item["sell_num"],
+        "sell_reference_price": item["sell_reference_price"],
+        "share_data": {
+            "content": "",
+            "thumbnail": item["goods_info"]["icon_url"],
+            "title": item["name"],
+            "url": f"https://buff.163.com/goods/{goods_id}",
+        },
+        "short_name": item["short_name"],
+        "show_game_cms_icon": False,
+        "sort_by_fields": sort_by_fields,
+        "steam_market_url": item["steam_market_url"],
+        "super_short_name": "Redline",
+        "support_name_tag": True,
+        "transacted_num": item["transacted_num"],
+        "user_show_count": 0,
+        "wiki_link": None,
+        "has_rent_order": False,
+        "rent_day_choices": [7, 14],
+        "rent_num": 0,
+        "rent_sort_by_fields": sort_by_fields,
+        "support_charm": False,
+    }
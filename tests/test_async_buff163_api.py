@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase, skipIf
+from unittest.mock import AsyncMock
+
+from buff163_unofficial_api import async_rest_adapter
+from buff163_unofficial_api.async_buff163_api import AsyncBuff163API
+from buff163_unofficial_api.async_rest_adapter import AsyncRestAdapter
+from buff163_unofficial_api.cs_enums import Gun
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.fake_server import FakeBuff163Server, FakeMarket
+from buff163_unofficial_api.models import Item, Result, SpecificItem
+from tests.payloads import make_item, make_page, make_specific_item
+
+
+@skipIf(async_rest_adapter.aiohttp is None, "aiohttp is not installed")
+class TestAsyncBuff163API(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.buff163api = AsyncBuff163API(page_size=2)
+        self.buff163api._rest_adapter = AsyncMock()
+
+    async def test_get_featured_market_returns_list_of_items(self):
+        self.buff163api._rest_adapter.get.return_value = Result(
+            200, data=make_page([make_item(1), make_item(2)])
+        )
+        item_list = await self.buff163api.get_featured_market()
+        self.assertEqual([item.id for item in item_list], [1, 2])
+        self.assertIsInstance(item_list[0], Item)
+
+    async def test_get_item_market_passes_category(self):
+        self.buff163api._rest_adapter.get.return_value = Result(
+            200, data=make_page([make_item(1)])
+        )
+        await self.buff163api.get_item_market(Gun.AK47)
+        endpoint = self.buff163api._rest_adapter.get.call_args.kwargs["endpoint"]
+        self.assertIn("category=weapon_ak47", endpoint)
+
+    async def test_get_item_market_rejects_non_enum(self):
+        with self.assertRaises(TypeError):
+            await self.buff163api.get_item_market("weapon_ak47")
+
+    async def test_get_item_returns_specific_item(self):
+        self.buff163api._rest_adapter.get.return_value = Result(
+            200, data={"code": "OK", "data": make_specific_item(900565)}
+        )
+        item = await self.buff163api.get_item(900565)
+        self.assertIsInstance(item, SpecificItem)
+        self.assertEqual(item.id, 900565)
+
+    async def test_get_featured_market_paged_stops_at_max_amt(self):
+        self.buff163api._rest_adapter.get.side_effect = [
+            Result(200, data=make_page([make_item(1), make_item(2)], 1, 3)),
+            Result(200, data=make_page([make_item(3), make_item(4)], 2, 3)),
+        ]
+        ids = [item.id async for item in self.buff163api.get_featured_market_paged(3)]
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual(self.buff163api._rest_adapter.get.call_count, 2)
+
+    async def test_get_featured_market_paged_stops_at_last_page(self):
+        self.buff163api._rest_adapter.get.side_effect = [
+            Result(200, data=make_page([make_item(1), make_item(2)], 1, 2)),
+            Result(200, data=make_page([make_item(3)], 2, 2)),
+        ]
+        ids = [item.id async for item in self.buff163api.get_featured_market_paged()]
+        self.assertEqual(ids, [1, 2, 3])
+
+    async def test_concurrent_get_item_calls(self):
+        self.buff163api._rest_adapter.get.side_effect = lambda endpoint: Result(
+            200,
+            data={"code": "OK", "data": make_specific_item(int(endpoint[-1]))},
+        )
+        items = await asyncio.gather(*(self.buff163api.get_item(i) for i in range(5)))
+        self.assertEqual([item.id for item in items], list(range(5)))
+
+
+@skipIf(async_rest_adapter.aiohttp is None, "aiohttp is not installed")
+class TestAsyncRestAdapter(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.market = FakeMarket(items_per_category=6, categories=[Gun.AK47.value])
+        self.server = FakeBuff163Server(self.market).start()
+        self.addCleanup(self.server.stop)
+
+    def adapter(self, **kwargs) -> AsyncRestAdapter:
+        return AsyncRestAdapter(hostname=self.server.hostname, **kwargs)
+
+    async def test_get_returns_result(self):
+        async with self.adapter() as rest_adapter:
+            result = await rest_adapter.get(
+                "/market/goods", ep_params={"category": Gun.AK47.value}
+            )
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(len(result.data["data"]["items"]), 6)
+
+    async def test_semaphore_bounds_requests_in_flight(self):
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def latency() -> float:
+            # Called by the handler thread of every request
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return 0.0
+
+        self.server.latency = latency
+        async with self.adapter(max_concurrency=2) as rest_adapter:
+            await asyncio.gather(*(rest_adapter.get("/market/goods") for _ in range(6)))
+        self.assertEqual(self.server.stats["requests"], 6)
+        self.assertEqual(peak[0], 2)
+
+    async def test_connection_errors_raise_buff163_exception(self):
+        self.server.drop_rate = 1.0
+        async with self.adapter() as rest_adapter:
+            with self.assertRaises(Buff163Exception):
+                await rest_adapter.get("/market/goods")
+        self.assertGreaterEqual(self.server.stats["dropped"], 1)
+
+        rest_adapter = AsyncRestAdapter(hostname="http://127.0.0.1:9/api")
+        with self.assertRaises(Buff163Exception):
+            await rest_adapter.get("/market/goods")
+        await rest_adapter.close()
+
+    async def test_bad_json_raises_buff163_exception(self):
+        async with self.adapter() as rest_adapter:
+            with self.assertRaisesRegex(Buff163Exception, "Bad JSON"):
+                await rest_adapter.get("/not/json")
+
+    async def test_login_required_raises_buff163_exception(self):
+        self.server.cookies = frozenset(["session=good"])
+        async with self.adapter(session_cookie="session=bad") as rest_adapter:
+            with self.assertRaisesRegex(Buff163Exception, "Login is required"):
+                await rest_adapter.get("/market/goods")
+        async with self.adapter(session_cookie="session=good") as rest_adapter:
+            await rest_adapter.get("/market/goods")
+        self.assertEqual(self.server.stats["login_required"], 1)
+
+    async def test_session_is_created_lazily_and_reopened_after_close(self):
+        rest_adapter = self.adapter()
+        self.assertIsNone(rest_adapter._session)
+        await rest_adapter.get("/market/goods")
+        session = rest_adapter._session
+        await rest_adapter.close()
+        self.assertTrue(session.closed)
+        await rest_adapter.get("/market/goods")
+        self.assertIsNot(rest_adapter._session, session)
+        await rest_adapter.close()
+        self.assertTrue(rest_adapter._session.closed)
+
+    async def test_fetch_data_returns_icon(self):
+        icon_url = self.market.rows[0]["goods_info"]["icon_url"]
+        async with self.adapter() as rest_adapter:
+            content = await rest_adapter.fetch_data(icon_url)
+        self.assertEqual(content, FakeMarket.icon(self.market.rows[0]["id"]))
+
+    async def test_api_pages_through_fake_server(self):
+        async with AsyncBuff163API(
+            hostname=self.server.hostname, page_size=4
+        ) as buff163api:
+            items = await buff163api.get_item_market(Gun.AK47)
+            item = await buff163api.get_item(items[0].id)
+        self.assertEqual([i.id for i in items], [row["id"] for row in self.market.rows])
+        self.assertIsInstance(item, SpecificItem)
+        self.assertEqual(item.id, items[0].id)
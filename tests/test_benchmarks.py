@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from benchmarks import suite
+from benchmarks.__main__ import RESULTS_DIR, main, package_version
+
+
+class TestBenchmarks(TestCase):
+    def test_fixtures_are_valid_responses(self):
+        for name in ("market_page", "goods_info"):
+            self.assertEqual(json.loads(suite.load_fixture(name))["code"], "OK")
+
+    def test_compare_flags_slower_timings(self):
+        baseline = {"a": {"value": 100.0, "unit": "us/call"}}
+        current = {"a": {"value": 120.0, "unit": "us/call"}}
+        self.assertEqual(len(suite.compare(baseline, current, 0.1)), 1)
+        self.assertEqual(suite.compare(baseline, current, 0.25), [])
+
+    def test_compare_flags_lower_throughput(self):
+        baseline = {"a": {"value": 100.0, "unit": "items/s"}}
+        self.assertEqual(
+            len(
+                suite.compare(baseline, {"a": {"value": 80.0, "unit": "items/s"}}, 0.1)
+            ),
+            1,
+        )
+        self.assertEqual(
+            suite.compare(baseline, {"a": {"value": 200.0, "unit": "items/s"}}, 0.1),
+            [],
+        )
+
+    def test_missing_lists_benchmarks_not_in_baseline(self):
+        baseline = {
+            "a": {"value": 1.0, "unit": "ms"},
+            "b": {"value": 1.0, "unit": "ms"},
+        }
+        current = {
+            "a": {"value": 1.0, "unit": "ms"},
+            "b": {"value": 1.0, "unit": "items/s"},
+            "c": {"value": 1.0, "unit": "ms"},
+        }
+        self.assertEqual(suite.missing(baseline, current), ["b", "c"])
+
+    def test_committed_baseline_covers_every_benchmark(self):
+        path = os.path.join(RESULTS_DIR, f"{package_version()}.json")
+        with open(path) as f:
+            baseline = json.load(f)["results"]
+        self.assertEqual(sorted(baseline), sorted(suite.BENCHMARKS))
+
+    def test_over_budget(self):
+        results = {
+            "import_time[package]": {"value": 1e6, "unit": "ms"},
+            "item_eager_1k": {"value": 1e6, "unit": "ms/1k"},
+        }
+        self.assertEqual(
+            [name for name, _, _ in suite.over_budget(results)],
+            ["import_time[package]"],
+        )
+
+    def test_main_writes_machine_readable_results(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            status = main(["--quick", "--only", "item_lazy_1k", "--output", output])
+            with open(output) as f:
+                report = json.load(f)
+        self.assertEqual(status, 0)
+        self.assertEqual(report["results"]["item_lazy_1k"]["unit"], "ms/1k")
+        self.assertIn("version", report)
@@ -1,7 +1,22 @@
+import threading
+import time
 from unittest import TestCase
 from unittest.mock import MagicMock
 from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cs_enums import Knife
 from buff163_unofficial_api.models import Item, Result
+from tests.payloads import make_item, make_page
+
+
+def paged_results(total_page: int, page_size: int):
+    """Side effect for a mocked RestAdapter.get serving ``total_page`` pages."""
+
+    def get(endpoint, ep_params):
+        page_num = ep_params["page_num"]
+        items = [make_item(page_num * 100 + i) for i in range(page_size)]
+        return Result(200, data=make_page(items, page_num, total_page))
+
+    return get
 
 
 class TestBuff163API(TestCase):
@@ -11,39 +26,25 @@ class TestBuff163API(TestCase):
 
     def test_get_featured_market_item_returns_one_item(self):
         self.buff163api._rest_adapter.get.return_value = Result(
-            200, headers={}, data=[{"id": 1, "url": "example.com"}]
+            200, data=make_page([make_item(1)])
         )
         item = self.buff163api.get_featured_market_item()
         self.assertIsInstance(item, Item)
 
     def test_get_featured_market_returns_list_of_items(self):
-        item_amt = 2
         self.buff163api._rest_adapter.get.return_value = Result(
             200,
-            headers={},
-            data=[
-                {"id": 1, "url": "example.com"},
-                {"id": 2, "url": "example.com"},
-                {"id": 3, "url": "example.com"},
-            ],
+            data=make_page([make_item(1), make_item(2), make_item(3)]),
         )
-        item_list = self.buff163api.get_featured_market(amt=item_amt)
+        item_list = self.buff163api.get_featured_market(pageNum=1)
         self.assertIsInstance(item_list, list)
-        self.assertTrue(len(item_list), item_amt)
+        self.assertEqual(len(item_list), 3)
         self.assertIsInstance(item_list[0], Item)
 
     def test_get_featured_market_paged_returns_iterator_of_item(self):
         self.buff163api._rest_adapter.get.side_effect = [
-            Result(
-                200,
-                headers={},
-                data=[
-                    {"id": 1, "url": "example.com"},
-                    {"id": 2, "url": "example.com"},
-                    {"id": 3, "url": "example.com"},
-                ],
-            ),
-            Result(200, headers={}, data=[]),
+            Result(200, data=make_page([make_item(1), make_item(2)], 1, 2)),
+            Result(200, data=make_page([make_item(3)], 2, 2)),
         ]
         item_iterator = self.buff163api.get_featured_market_paged()
         item1 = next(item_iterator)
@@ -52,3 +53,69 @@ class TestBuff163API(TestCase):
         self.assertIsInstance(item3, Item)
         with self.assertRaises(StopIteration):
             item4 = next(item_iterator)
+
+    def test_paged_yields_in_page_order(self):
+        self.buff163api._rest_adapter.get.side_effect = paged_results(6, 10)
+        ids = [item.id for item in self.buff163api.get_featured_market_paged(60)]
+        expected = [page * 100 + i for page in range(1, 7) for i in range(10)]
+        self.assertEqual(ids, expected)
+
+    def test_paged_only_fetches_pages_needed_for_max_amt(self):
+        self.buff163api._rest_adapter.get.side_effect = paged_results(50, 10)
+        items = list(self.buff163api.get_featured_market_paged(25))
+        self.assertEqual(len(items), 25)
+        self.assertEqual(self.buff163api._rest_adapter.get.call_count, 3)
+
+    def test_paged_fetches_pages_concurrently(self):
+        in_flight = [0]
+        peak = [0]
+        lock = threading.Lock()
+        serve = paged_results(5, 10)
+
+        def slow_get(endpoint, ep_params):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return serve(endpoint, ep_params)
+
+        self.buff163api._rest_adapter.get.side_effect = slow_get
+        items = list(self.buff163api.get_featured_market_paged(50))
+        self.assertEqual(len(items), 50)
+        self.assertGreater(peak[0], 1)
+
+    def test_paged_sequential_when_read_ahead_disabled(self):
+        buff163api = Buff163API(page_size=10, read_ahead=0)
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.side_effect = paged_results(3, 10)
+        ids = [item.id for item in buff163api.get_featured_market_paged(30)]
+        self.assertEqual(ids[::10], [100, 200, 300])
+
+    def test_paged_reads_ahead_with_a_single_worker(self):
+        buff163api = Buff163API(page_size=10, max_workers=1, read_ahead=2)
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.side_effect = paged_results(5, 10)
+        item_iterator = buff163api.get_featured_market_paged(50)
+        # Step into page 2, page 3 is then fetched before the consumer asks
+        ids = [next(item_iterator).id for _ in range(11)]
+        self.assertEqual(ids[-1], 200)
+        time.sleep(0.05)
+        self.assertEqual(buff163api._rest_adapter.get.call_count, 3)
+        self.assertEqual(len(list(item_iterator)), 39)
+
+    def test_paged_stops_fetching_when_consumer_stops(self):
+        self.buff163api._rest_adapter.get.side_effect = paged_results(100, 10)
+        item_iterator = self.buff163api.get_featured_market_paged(1000)
+        next(item_iterator)
+        item_iterator.close()
+        time.sleep(0.05)
+        # Page 1 plus at most the read-ahead window
+        self.assertLessEqual(self.buff163api._rest_adapter.get.call_count, 1 + 4)
+
+    def test_get_item_market_paged_passes_category(self):
+        self.buff163api._rest_adapter.get.side_effect = paged_results(1, 10)
+        list(self.buff163api.get_item_market_paged(Knife.KARAMBIT))
+        ep_params = self.buff163api._rest_adapter.get.call_args.kwargs["ep_params"]
+        self.assertEqual(ep_params["category"], "weapon_knife_karambit")
@@ -0,0 +1,99 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.bulk import ItemBatch
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.models import ItemResult, Result, SpecificItem
+from tests.payloads import make_specific_item
+
+
+def item_results(fail_ids=(), delays=None):
+    """Side effect for a mocked RestAdapter.get serving /market/goods/info."""
+
+    def get(endpoint):
+        goods_id = int(endpoint.rsplit("=", 1)[1])
+        time.sleep((delays or {}).get(goods_id, 0))
+        if goods_id in fail_ids:
+            raise Buff163Exception("500: Internal Server Error")
+        return Result(200, data={"code": "OK", "data": make_specific_item(goods_id)})
+
+    return get
+
+
+class TestItemBatch(TestCase):
+    def setUp(self) -> None:
+        self.buff163api = Buff163API()
+        self.buff163api._rest_adapter = MagicMock()
+
+    def test_get_items_returns_every_id(self):
+        self.buff163api._rest_adapter.get.side_effect = item_results()
+        results = list(self.buff163api.get_items(range(1, 21)))
+        self.assertEqual(
+            sorted(result.goods_id for result in results), list(range(1, 21))
+        )
+        self.assertTrue(all(isinstance(result, ItemResult) for result in results))
+        self.assertTrue(
+            all(isinstance(result.item, SpecificItem) for result in results)
+        )
+
+    def test_failed_id_yields_error_entry(self):
+        self.buff163api._rest_adapter.get.side_effect = item_results(fail_ids={3})
+        batch = self.buff163api.get_items([1, 2, 3, 4], ordered=True)
+        results = list(batch)
+        self.assertEqual([result.ok for result in results], [True, True, False, True])
+        self.assertIsInstance(results[2].error, Buff163Exception)
+        self.assertIsNone(results[2].item)
+        self.assertEqual(batch.succeeded, 3)
+        self.assertEqual(batch.failed, 1)
+
+    def test_ordered_yields_in_input_order(self):
+        self.buff163api._rest_adapter.get.side_effect = item_results(delays={1: 0.05})
+        results = self.buff163api.get_items([1, 2, 3], ordered=True)
+        self.assertEqual([result.goods_id for result in results], [1, 2, 3])
+
+    def test_unordered_yields_as_completed(self):
+        self.buff163api._rest_adapter.get.side_effect = item_results(delays={1: 0.1})
+        results = self.buff163api.get_items([1, 2, 3])
+        self.assertEqual([result.goods_id for result in results][-1], 1)
+
+    def test_fetches_concurrently(self):
+        in_flight = peak = 0
+        lock = threading.Lock()
+
+        def fetch(goods_id):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+        list(ItemBatch(fetch, range(16), max_workers=4))
+        self.assertEqual(peak, 4)
+
+    def test_stats_report_timing(self):
+        self.buff163api._rest_adapter.get.side_effect = item_results(fail_ids={2})
+        batch = self.buff163api.get_items([1, 2, 3])
+        list(batch)
+        stats = batch.stats()
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["succeeded"], 2)
+        self.assertEqual(stats["failed"], 1)
+        self.assertGreater(stats["elapsed"], 0)
+        self.assertGreater(stats["items_per_second"], 0)
+
+    def test_close_cancels_pending_requests(self):
+        calls = []
+
+        def fetch(goods_id):
+            calls.append(goods_id)
+            time.sleep(0.01)
+
+        batch = ItemBatch(fetch, range(100), max_workers=2, ordered=True)
+        next(batch)
+        batch.close()
+        time.sleep(0.05)
+        self.assertLess(len(calls), 100)
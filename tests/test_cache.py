@@ -0,0 +1,126 @@
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
+
+import requests
+
+from buff163_unofficial_api.cache import (
+    CacheEntry,
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+)
+from buff163_unofficial_api.models import Result
+from buff163_unofficial_api.rest_adapter import RestAdapter
+
+
+def ok_response(body: bytes = b'{"code": "OK", "data": 1}'):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+class TestMemoryCache(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", CacheEntry(Result(200), 0))
+        cache.set("b", CacheEntry(Result(200), 0))
+        cache.get("a")
+        cache.set("c", CacheEntry(Result(200), 0))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+
+class TestSQLiteCache(TestCase):
+    def test_entries_survive_reopen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            cache = SQLiteCache(path)
+            cache.set("k", CacheEntry(Result(200, "OK", {"code": "OK"}), 123.0))
+            cache.close()
+
+            reopened = SQLiteCache(path)
+            entry = reopened.get("k")
+            reopened.close()
+        self.assertEqual(entry.result.data, {"code": "OK"})
+        self.assertEqual(entry.result.message, "OK")
+        self.assertEqual(entry.expires_at, 123.0)
+
+
+class TestResponseCache(TestCase):
+    def test_ttl_uses_longest_prefix(self):
+        cache = ResponseCache()
+        self.assertEqual(cache.ttl_for("/market/goods/info?goods_id=1"), 3600)
+        self.assertEqual(cache.ttl_for("/market/goods?page_num=1"), 30)
+        self.assertEqual(cache.ttl_for("/account"), 0)
+
+    def test_key_ignores_param_order(self):
+        self.assertEqual(
+            ResponseCache.key("GET", "/e", {"a": 1, "b": 2}),
+            ResponseCache.key("GET", "/e", {"b": 2, "a": 1}),
+        )
+
+    def test_expired_entry_is_a_miss(self):
+        cache = ResponseCache(ttls={"/e": 0.01})
+        cache.set("k", "/e", Result(200))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.stats(), {"hits": 0, "stale_hits": 0, "misses": 1})
+
+    def test_stale_entry_is_served_within_window(self):
+        cache = ResponseCache(ttls={"/e": 0.01}, stale_while_revalidate=60)
+        cache.set("k", "/e", Result(200))
+        time.sleep(0.02)
+        result, is_fresh = cache.get("k")
+        self.assertFalse(is_fresh)
+        self.assertEqual(cache.stale_hits, 1)
+
+
+class TestRestAdapterCache(TestCase):
+    def test_get_is_served_from_cache(self):
+        cache = ResponseCache()
+        rest_adapter = RestAdapter(cache=cache)
+        with mock.patch(
+            "requests.Session.request", return_value=ok_response()
+        ) as request:
+            first = rest_adapter.get("/market/goods/info?goods_id=1")
+            second = rest_adapter.get("/market/goods/info?goods_id=1")
+            rest_adapter.get("/market/goods/info?goods_id=2")
+        self.assertIs(first, second)
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(cache.stats(), {"hits": 1, "stale_hits": 0, "misses": 2})
+
+    def test_uncached_endpoints_bypass_cache(self):
+        cache = ResponseCache()
+        rest_adapter = RestAdapter(cache=cache)
+        with mock.patch(
+            "requests.Session.request", return_value=ok_response()
+        ) as request:
+            rest_adapter.get("/account")
+            rest_adapter.get("/account")
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(cache.misses, 0)
+
+    def test_stale_entry_is_revalidated_in_background(self):
+        cache = ResponseCache(ttls={"/market/goods": 0.01}, stale_while_revalidate=60)
+        rest_adapter = RestAdapter(cache=cache)
+        with mock.patch(
+            "requests.Session.request",
+            side_effect=[
+                ok_response(b'{"code": "OK", "data": 1}'),
+                ok_response(b'{"code": "OK", "data": 2}'),
+            ],
+        ) as request:
+            rest_adapter.get("/market/goods")
+            time.sleep(0.02)
+            stale = rest_adapter.get("/market/goods")
+            for _ in range(100):
+                if request.call_count == 2 and not cache._revalidating:
+                    break
+                time.sleep(0.01)
+            fresh = rest_adapter.get("/market/goods")
+        self.assertEqual(stale.data["data"], 1)
+        self.assertEqual(fresh.data["data"], 2)
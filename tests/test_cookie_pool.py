@@ -0,0 +1,140 @@
+import time
+import requests
+from unittest import TestCase, mock
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cookie_pool import LEAST_THROTTLED, CookiePool
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.fake_server import FakeBuff163Server, FakeMarket
+from buff163_unofficial_api.rest_adapter import RestAdapter
+
+
+class TestCookiePool(TestCase):
+    def test_round_robin(self):
+        pool = CookiePool(["a", "b", "c"])
+        self.assertEqual(
+            [pool.acquire().cookie for _ in range(6)], ["a", "b", "c", "a", "b", "c"]
+        )
+        self.assertEqual(pool.stats()["cookie-0"]["requests"], 2)
+
+    def test_least_throttled_prefers_never_throttled(self):
+        pool = CookiePool(["a", "b"], strategy=LEAST_THROTTLED, max_failures=10)
+        pool.on_throttle(pool.cookies[0])
+        self.assertEqual({pool.acquire().cookie for _ in range(4)}, {"b"})
+        pool.on_throttle(pool.cookies[1])
+        self.assertEqual(pool.acquire().cookie, "a")
+
+    def test_repeated_failures_quarantine(self):
+        pool = CookiePool(["a", "b"], max_failures=2, quarantine=60)
+        a = pool.cookies[0]
+        pool.on_login_error(a)
+        pool.on_success(a)
+        pool.on_login_error(a)
+        self.assertFalse(a.is_quarantined())
+        pool.on_throttle(a)
+        self.assertTrue(a.is_quarantined())
+        self.assertEqual([c.cookie for c in pool.healthy()], ["b"])
+        self.assertEqual({pool.acquire().cookie for _ in range(4)}, {"b"})
+        pool.release(a)
+        self.assertEqual(len(pool.healthy()), 2)
+
+    def test_all_quarantined_raises(self):
+        pool = CookiePool(["a"], max_failures=1)
+        pool.on_login_error(pool.cookies[0])
+        with self.assertRaises(Buff163Exception):
+            pool.acquire()
+
+    def test_per_cookie_rate_spreads_load(self):
+        pool = CookiePool(["a", "b"], rate=1, burst=1)
+        start = time.monotonic()
+        # One token each: the second request takes the other cookie without waiting
+        self.assertEqual({pool.acquire().cookie for _ in range(2)}, {"a", "b"})
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CookiePool([])
+        with self.assertRaises(ValueError):
+            CookiePool(["a"], strategy="random")
+
+    def test_labels_hide_cookies(self):
+        pool = CookiePool(["session=secret"])
+        self.assertNotIn("secret", repr(pool.cookies[0]))
+        self.assertNotIn("secret", str(pool.stats()))
+
+
+class TestCookiePoolAdapter(TestCase):
+    def serve(self, **kwargs) -> FakeBuff163Server:
+        server = FakeBuff163Server(FakeMarket(5, categories=["c"]), **kwargs).start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_login_required_fails_over(self):
+        server = self.serve(cookies=["good"])
+        adapter = RestAdapter(
+            server.hostname, session_cookies=CookiePool(["bad", "good"]), max_retries=0
+        )
+        for page_num in range(1, 4):
+            result = adapter.get("/market/goods", ep_params={"page_num": page_num})
+            self.assertEqual(result.data["code"], "OK")
+        stats = adapter.cookie_pool.stats()
+        self.assertEqual(stats["cookie-0"]["login_errors"], 3)
+        self.assertTrue(stats["cookie-0"]["quarantined"])
+        self.assertEqual(stats["cookie-1"]["requests"], 3)
+
+    def test_failing_cookie_is_quarantined(self):
+        server = self.serve(cookies=["good"])
+        pool = CookiePool(["bad", "good"], max_failures=2)
+        adapter = RestAdapter(server.hostname, session_cookies=pool, coalesce=False)
+        for _ in range(6):
+            adapter.get("/market/goods")
+        self.assertTrue(pool.stats()["cookie-0"]["quarantined"])
+        self.assertEqual(server.stats["login_required"], 2)
+
+    def test_every_cookie_rejected_raises(self):
+        server = self.serve(cookies=["good"])
+        adapter = RestAdapter(server.hostname, session_cookies=["x", "y"])
+        with self.assertRaises(Buff163Exception):
+            adapter.get("/market/goods")
+        self.assertEqual(server.stats["login_required"], 2)
+
+    def test_throttled_cookie_fails_over_without_backoff(self):
+        server = self.serve(max_rps_per_cookie=1)
+        adapter = RestAdapter(
+            server.hostname,
+            session_cookies=CookiePool(["a", "b"], max_failures=10),
+            backoff_factor=10,
+            coalesce=False,
+        )
+        # Spend the server-side token of "a"
+        requests.get(f"{server.hostname}/market/goods", headers={"Cookie": "a"})
+        start = time.monotonic()
+        adapter.get("/market/goods")
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(server.stats["throttled"], 1)
+        self.assertEqual(adapter.cookie_pool.stats()["cookie-0"]["throttles"], 1)
+
+    def test_error_status_keeps_failure_streak(self):
+        pool = CookiePool(["a"], max_failures=2)
+        pool.on_login_error(pool.cookies[0])
+        adapter = RestAdapter(session_cookies=pool, max_retries=0, coalesce=False)
+        response = requests.Response()
+        response.status_code = 404
+        response._content = b'{"code": "OK"}'
+        with mock.patch("requests.Session.request", return_value=response):
+            with self.assertRaises(Buff163Exception):
+                adapter.get("/market/goods")
+        self.assertEqual(pool.cookies[0].failures, 1)
+        response.status_code = 200
+        with mock.patch("requests.Session.request", return_value=response):
+            adapter.get("/market/goods")
+        self.assertEqual(pool.cookies[0].failures, 0)
+
+    def test_api_accepts_cookie_list(self):
+        server = self.serve(cookies=["a", "b"])
+        with Buff163API(hostname=server.hostname, session_cookies=["a", "b"]) as api:
+            self.assertEqual(len(api.get_featured_market()), 5)
+            self.assertEqual(len(api.get_featured_market(2)), 0)
+        self.assertEqual(
+            [s["requests"] for s in api._rest_adapter.cookie_pool.stats().values()],
+            [1, 1],
+        )
@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.crawler import Crawler, all_categories
+from buff163_unofficial_api.cs_enums import Glove, Knife
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.models import Result
+from tests.payloads import make_item, make_page
+
+
+def market(pages: dict, fail=(), shared_ids=()):
+    """fetch_page serving ``pages[category]`` pages of 2 rows each.
+
+    Goods ids are unique per (category, page) except ``shared_ids``, which
+    appear on page 1 of every category.
+    """
+    calls = []
+
+    def fetch_page(category, page):
+        calls.append((category, page))
+        if (category, page) in fail:
+            raise Buff163Exception("500: Internal Server Error")
+        base = (sorted(pages).index(category) + 1) * 1000 + page * 10
+        items = [make_item(base + i) for i in range(2)]
+        if page == 1:
+            items += [make_item(goods_id) for goods_id in shared_ids]
+        return make_page(items, page, pages[category])["data"]
+
+    fetch_page.calls = calls
+    return fetch_page
+
+
+class TestCrawler(TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.tmp.name, "crawl.jsonl")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_all_categories_covers_every_enum(self):
+        categories = all_categories()
+        self.assertIn(Knife.KARAMBIT.value, categories)
+        self.assertIn(Glove.SPORT.value, categories)
+
+    def test_crawl_fetches_every_page_of_every_category(self):
+        fetch_page = market({"a": 3, "b": 2})
+        crawler = Crawler(fetch_page, self.checkpoint, categories=["a", "b"])
+        rows = list(crawler)
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(
+            sorted(fetch_page.calls), [("a", 1), ("a", 2), ("a", 3), ("b", 1), ("b", 2)]
+        )
+
+    def test_goods_in_several_categories_are_yielded_once(self):
+        fetch_page = market({"a": 1, "b": 1}, shared_ids=(7,))
+        crawler = Crawler(fetch_page, self.checkpoint, categories=["a", "b"])
+        ids = [row["id"] for row in crawler]
+        self.assertEqual(ids.count(7), 1)
+        self.assertEqual(crawler.duplicates, 1)
+
+    def test_restart_resumes_after_failed_unit(self):
+        fetch_page = market({"a": 4}, fail={("a", 3)})
+        crawler = Crawler(fetch_page, self.checkpoint, categories=["a"])
+        first = [row["id"] for row in crawler]
+        self.assertEqual(crawler.failed, [("a", 3)])
+        self.assertEqual(crawler.plan(), [("a", 3)])
+
+        fetch_page = market({"a": 4})
+        second = [row["id"] for row in Crawler(fetch_page, self.checkpoint, ["a"])]
+        self.assertEqual(fetch_page.calls, [("a", 3)])
+        self.assertEqual(sorted(first + second), sorted(set(first + second)))
+        self.assertEqual(len(first + second), 8)
+
+    def test_torn_checkpoint_line_is_ignored(self):
+        list(Crawler(market({"a": 2}), self.checkpoint, categories=["a"]))
+        with open(self.checkpoint, "a") as f:
+            f.write('{"category": "a", "pa')
+        self.assertEqual(Crawler(market({"a": 2}), self.checkpoint, ["a"]).plan(), [])
+
+    def test_checkpoint_records_finished_units(self):
+        list(Crawler(market({"a": 2}), self.checkpoint, categories=["a"]))
+        with open(self.checkpoint) as f:
+            units = [json.loads(line) for line in f]
+        self.assertEqual(sorted(unit["page"] for unit in units), [1, 2])
+        self.assertEqual(units[0]["total_page"], 2)
+
+    def test_runs_units_concurrently(self):
+        in_flight = peak = 0
+        lock = threading.Lock()
+        fetch = market({c: 1 for c in "abcdefgh"})
+
+        def slow_fetch(category, page):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return fetch(category, page)
+
+        list(Crawler(slow_fetch, self.checkpoint, list("abcdefgh"), concurrency=3))
+        self.assertEqual(peak, 3)
+
+    def test_stats_report_throughput(self):
+        crawler = Crawler(market({"a": 2}), self.checkpoint, categories=["a"])
+        list(crawler)
+        stats = crawler.stats()
+        self.assertEqual(stats["pages"], 2)
+        self.assertEqual(stats["items"], 4)
+        self.assertGreater(stats["pages_per_second"], 0)
+        self.assertGreater(stats["items_per_second"], 0)
+
+    def test_buff163api_crawl_passes_category(self):
+        buff163api = Buff163API(page_size=2)
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.return_value = Result(
+            200, data=make_page([make_item(1)])
+        )
+        rows = list(buff163api.crawl(self.checkpoint, categories=[Knife.KARAMBIT]))
+        self.assertEqual(len(rows), 1)
+        params = buff163api._rest_adapter.get.call_args.kwargs["ep_params"]
+        self.assertEqual(params["category"], Knife.KARAMBIT.value)
+        self.assertEqual(params["page_size"], 2)
@@ -0,0 +1,112 @@
+import tempfile
+from unittest import TestCase
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cs_enums import Knife
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.fake_server import FakeBuff163Server, FakeMarket, constant
+from buff163_unofficial_api.models import Item, SpecificItem
+from buff163_unofficial_api.rest_adapter import RestAdapter
+from tests.payloads import make_item
+
+
+class TestFakeBuff163Server(TestCase):
+    def setUp(self) -> None:
+        market = FakeMarket(
+            items_per_category=25,
+            categories=[Knife.KARAMBIT.value, Knife.GUT.value],
+        )
+        self.server = FakeBuff163Server(market).start()
+        self.api = Buff163API(hostname=self.server.hostname, page_size=10)
+
+    def tearDown(self) -> None:
+        self.api.close()
+        self.server.stop()
+
+    def test_hostname_with_scheme_is_kept(self):
+        self.assertEqual(
+            RestAdapter("http://localhost:1/api").url, "http://localhost:1/api"
+        )
+        self.assertEqual(RestAdapter().url, "https://buff.163.com/api")
+
+    def test_paging_through_a_category(self):
+        items = list(self.api.get_item_market_paged(Knife.GUT, max_amt=100))
+        self.assertEqual(len(items), 25)
+        self.assertIsInstance(items[0], Item)
+        self.assertEqual(
+            items[0].goods_info.info.tags.weapon.internal_name, Knife.GUT.value
+        )
+
+    def test_featured_market_spans_every_category(self):
+        self.assertEqual(len(list(self.api.get_featured_market_paged(1000))), 50)
+
+    def test_item_details_and_icons(self):
+        item = self.api.get_item(3)
+        self.assertIsInstance(item, SpecificItem)
+        self.assertEqual(item.id, 3)
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = self.api.fetch_images(self.api.get_featured_market(), tmp)
+        self.assertEqual(stats["downloaded"], 20)
+
+    def test_crawl_against_fake_server(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            crawler = self.api.crawl(
+                f"{tmp}/crawl.jsonl", categories=[Knife.KARAMBIT, Knife.GUT]
+            )
+            self.assertEqual(len(list(crawler)), 50)
+        self.assertEqual(crawler.stats()["pages"], 6)
+
+
+class TestFakeServerFaults(TestCase):
+    def serve(self, **faults) -> FakeBuff163Server:
+        server = FakeBuff163Server(FakeMarket(5, categories=["c"]), **faults).start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_errors_are_retried_then_raised(self):
+        server = self.serve(error_rate=1.0)
+        adapter = RestAdapter(server.hostname, max_retries=2, backoff_factor=0)
+        with self.assertRaises(Buff163Exception):
+            adapter.get("/market/goods")
+        self.assertEqual(server.stats["errors"], 3)
+
+    def test_throttled_requests_send_retry_after(self):
+        server = self.serve(throttle_rate=1.0, retry_after=0)
+        adapter = RestAdapter(server.hostname, max_retries=1)
+        with self.assertRaises(Buff163Exception) as raised:
+            adapter.get("/market/goods")
+        self.assertIn("429", str(raised.exception))
+        self.assertEqual(server.stats["throttled"], 2)
+
+    def test_max_rps_throttles_bursts(self):
+        server = self.serve(max_rps=2)
+        adapter = RestAdapter(server.hostname, max_retries=0, coalesce=False)
+        for page_num in range(1, 5):
+            try:
+                adapter.get("/market/goods", ep_params={"page_num": page_num})
+            except Buff163Exception:
+                pass
+        self.assertGreaterEqual(server.stats["throttled"], 1)
+
+    def test_dropped_connections_raise(self):
+        server = self.serve(drop_rate=1.0)
+        adapter = RestAdapter(server.hostname, max_retries=1, backoff_factor=0)
+        with self.assertRaises(Buff163Exception):
+            adapter.get("/market/goods")
+        self.assertEqual(server.stats["dropped"], 2)
+
+    def test_latency_is_applied(self):
+        server = self.serve(latency=constant(0.05))
+        adapter = RestAdapter(server.hostname)
+        result = adapter.get("/market/goods")
+        self.assertEqual(len(result.data["data"]["items"]), 5)
+
+    def test_recorded_rows_are_not_modified(self):
+        row = make_item(1)
+        row["goods_info"]["icon_url"] = "/icons/1.png"
+        server = FakeBuff163Server(FakeMarket.from_rows([row])).start()
+        self.addCleanup(server.stop)
+        self.assertEqual(row["goods_info"]["icon_url"], "/icons/1.png")
+        self.assertEqual(
+            server.market.rows[0]["goods_info"]["icon_url"],
+            f"{server.base_url}/icons/1.png",
+        )
@@ -0,0 +1,101 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.icon_store import IconStore
+from buff163_unofficial_api.models import Item
+from tests.payloads import make_item
+
+
+def make_item_with_icon(goods_id: int, icon_url: str) -> Item:
+    raw = make_item(goods_id)
+    raw["goods_info"]["icon_url"] = icon_url
+    return Item(**raw)
+
+
+class TestIconStore(TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = IconStore(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_put_writes_chunks_to_content_addressed_path(self):
+        path = self.store.put("https://cdn/a.png", [b"ab", b"cd"])
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"abcd")
+        self.assertTrue(path.endswith(".png"))
+        self.assertEqual(self.store.path_for("https://cdn/a.png"), path)
+
+    def test_same_content_is_stored_once(self):
+        first = self.store.put("https://cdn/a.png", [b"same"])
+        second = self.store.put("https://cdn/b.png", [b"same"])
+        self.assertEqual(first, second)
+        self.assertEqual(self.store.stats()["deduplicated"], 1)
+        self.assertEqual(self.store.stats()["bytes_written"], 4)
+
+    def test_unknown_url_has_no_path(self):
+        self.assertIsNone(self.store.path_for("https://cdn/missing.png"))
+
+    def test_failed_stream_leaves_no_files(self):
+        def chunks():
+            yield b"partial"
+            raise Buff163Exception("connection dropped")
+
+        with self.assertRaises(Buff163Exception):
+            self.store.put("https://cdn/a.png", chunks())
+        self.assertIsNone(self.store.path_for("https://cdn/a.png"))
+        self.assertEqual(os.listdir(os.path.join(self.tmp.name, "tmp")), [])
+
+
+class TestFetchImages(TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.buff163api = Buff163API()
+        self.buff163api._rest_adapter = MagicMock()
+        self.buff163api._rest_adapter.stream_data.side_effect = lambda url: iter(
+            [url.encode()]
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_fetch_images_sets_icon_path_not_data(self):
+        items = [make_item_with_icon(1, "https://cdn/1.png")]
+        stats = self.buff163api.fetch_images(items, self.tmp.name)
+        self.assertEqual(stats, {"downloaded": 1, "cached": 0, "failed": 0})
+        self.assertEqual(items[0].data, b"")
+        with open(items[0].icon_path, "rb") as f:
+            self.assertEqual(f.read(), b"https://cdn/1.png")
+
+    def test_shared_url_downloaded_once(self):
+        items = [make_item_with_icon(i, "https://cdn/shared.png") for i in range(5)]
+        self.buff163api.fetch_images(items, self.tmp.name)
+        self.assertEqual(self.buff163api._rest_adapter.stream_data.call_count, 1)
+        self.assertEqual(len({item.icon_path for item in items}), 1)
+
+    def test_icons_already_on_disk_are_skipped(self):
+        items = [make_item_with_icon(1, "https://cdn/1.png")]
+        self.buff163api.fetch_images(items, self.tmp.name)
+        stats = self.buff163api.fetch_images(items, self.tmp.name)
+        self.assertEqual(stats, {"downloaded": 0, "cached": 1, "failed": 0})
+        self.assertEqual(self.buff163api._rest_adapter.stream_data.call_count, 1)
+
+    def test_failed_download_is_counted(self):
+        self.buff163api._rest_adapter.stream_data.side_effect = Buff163Exception(
+            "Not Found"
+        )
+        items = [make_item_with_icon(1, "https://cdn/1.png")]
+        stats = self.buff163api.fetch_images(items, self.tmp.name)
+        self.assertEqual(stats["failed"], 1)
+        self.assertIsNone(items[0].icon_path)
+
+    def test_save_icon_to_copies_from_icon_path(self):
+        items = [make_item_with_icon(1, "https://cdn/1.png")]
+        self.buff163api.fetch_images(items, self.tmp.name)
+        items[0].save_icon_to(self.tmp.name, "copy.png")
+        with open(os.path.join(self.tmp.name, "copy.png"), "rb") as f:
+            self.assertEqual(f.read(), b"https://cdn/1.png")
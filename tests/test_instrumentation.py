@@ -0,0 +1,182 @@
+import logging
+from unittest import TestCase, mock
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cs_enums import Knife
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.fake_server import FakeBuff163Server, FakeMarket
+from buff163_unofficial_api.instrumentation import Histogram, Metrics, RequestEvent
+from buff163_unofficial_api.models import Result
+from buff163_unofficial_api.rest_adapter import RestAdapter
+
+
+class TestRequestEvents(TestCase):
+    def setUp(self) -> None:
+        market = FakeMarket(items_per_category=10, categories=[Knife.GUT.value])
+        self.server = FakeBuff163Server(market).start()
+        self.addCleanup(self.server.stop)
+        self.events = []
+
+    def test_event_per_request(self):
+        with RestAdapter(self.server.hostname, hooks=[self.events.append]) as adapter:
+            adapter.get("/market/goods", ep_params={"page_num": 1})
+            adapter.get("/market/goods", ep_params={"page_num": 2})
+        self.assertEqual(len(self.events), 2)
+        first, second = self.events
+        self.assertEqual(first.method, "GET")
+        self.assertEqual(first.endpoint, "/market/goods")
+        self.assertEqual(first.params, {"page_num": 1})
+        self.assertEqual(first.status_code, 200)
+        self.assertIsNone(first.error)
+        self.assertEqual(first.retries, 0)
+        self.assertGreater(first.bytes, 0)
+        self.assertGreater(first.total, 0)
+        self.assertGreater(first.ttfb, 0)
+        self.assertIsNotNone(first.decode)
+        self.assertIsNone(first.build)
+        # The second request reuses the pooled connection
+        self.assertIsNotNone(first.connect)
+        self.assertIsNone(second.connect)
+
+    def test_query_string_is_moved_to_params(self):
+        event = RequestEvent("GET", "/market/goods/info?game=csgo&goods_id=3")
+        self.assertEqual(event.endpoint, "/market/goods/info")
+        self.assertEqual(event.params, {"game": "csgo", "goods_id": "3"})
+
+    def test_failed_request_event(self):
+        server = FakeBuff163Server(FakeMarket(5, categories=["c"]), error_rate=1.0)
+        server.start()
+        self.addCleanup(server.stop)
+        adapter = RestAdapter(
+            server.hostname,
+            max_retries=2,
+            backoff_factor=0,
+            hooks=[self.events.append],
+        )
+        with self.assertRaises(Buff163Exception):
+            adapter.get("/market/goods")
+        (event,) = self.events
+        self.assertEqual(event.retries, 2)
+        self.assertEqual(event.status_code, 500)
+        self.assertIsInstance(event.error, Buff163Exception)
+
+    def test_api_times_model_build(self):
+        with Buff163API(
+            hostname=self.server.hostname, page_size=5, hooks=[self.events.append]
+        ) as api:
+            api.get_item_market(Knife.GUT)
+            api.get_item(1)
+            self.assertEqual(len(list(api.get_item_market_paged(Knife.GUT, 10))), 10)
+        self.assertEqual(len(self.events), 4)
+        self.assertTrue(all(event.build is not None for event in self.events))
+        self.assertEqual(self.events[1].endpoint, "/market/goods/info")
+        self.assertEqual(self.events[1].params["goods_id"], "1")
+
+    def test_failing_hook_does_not_break_requests(self):
+        def broken(event):
+            raise RuntimeError("hook failed")
+
+        adapter = RestAdapter(self.server.hostname, hooks=[broken, self.events.append])
+        with self.assertLogs("buff163_unofficial_api.rest_adapter", logging.ERROR):
+            adapter.get("/market/goods")
+        self.assertEqual(len(self.events), 1)
+
+
+class TestDo(TestCase):
+    def setUp(self) -> None:
+        self.response = mock.Mock(
+            status_code=404, reason="Not Found", content=b'{"code": "OK"}'
+        )
+
+    def test_no_event_without_hooks(self):
+        adapter = RestAdapter(max_retries=0)
+        self.response.status_code = 200
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with mock.patch(
+                "buff163_unofficial_api.rest_adapter.RequestEvent"
+            ) as event:
+                self.assertIsInstance(adapter._do("GET", "/market/goods"), Result)
+        event.assert_not_called()
+
+    def test_error_status_logs_the_request(self):
+        adapter = RestAdapter(max_retries=0)
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertLogs(adapter._logger, logging.ERROR) as logs:
+                with self.assertRaises(Buff163Exception):
+                    adapter._do("GET", "/market/goods", {"name": "{braces}"})
+        self.assertIn("status_code=404", logs.output[0])
+        self.assertIn("{braces}", logs.output[0])
+
+    def test_success_logs_only_at_debug(self):
+        adapter = RestAdapter(max_retries=0)
+        self.response.status_code = 200
+        self.response.reason = "OK"
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertLogs(adapter._logger, logging.DEBUG) as logs:
+                adapter._do("GET", "/market/goods")
+        self.assertIn("success=True, status_code=200", logs.output[-1])
+
+
+class TestMetrics(TestCase):
+    def event(self, status_code=200, total=0.03, retries=0) -> RequestEvent:
+        event = RequestEvent("GET", "/market/goods?page_num=1")
+        event.status_code = status_code
+        event.total = total
+        event.retries = retries
+        event.bytes = 100
+        return event
+
+    def test_histogram_is_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), {"0.1": 2, "1.0": 3, "+Inf": 4})
+        self.assertEqual(histogram.count, 4)
+
+    def test_as_dict(self):
+        metrics = Metrics()
+        metrics(self.event())
+        metrics(self.event(status_code=500, retries=3))
+        series = metrics.as_dict()
+        self.assertEqual(
+            sorted(s["labels"]["status"] for s in series["buff163_requests_total"]),
+            ["200", "500"],
+        )
+        self.assertEqual(series["buff163_request_retries_total"][0]["value"], 3)
+        self.assertEqual(series["buff163_response_bytes_total"][0]["value"], 200)
+        duration = series["buff163_request_duration_seconds"][0]
+        self.assertEqual(duration["count"], 2)
+        self.assertEqual(duration["labels"], {"endpoint": "/market/goods"})
+        self.assertEqual(series["buff163_request_connect_seconds"], [])
+        metrics.reset()
+        self.assertEqual(metrics.as_dict()["buff163_requests_total"], [])
+
+    def test_to_prometheus(self):
+        metrics = Metrics(buckets=(0.01, 0.1))
+        metrics(self.event())
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE buff163_requests_total counter", text)
+        self.assertIn(
+            'buff163_requests_total{endpoint="/market/goods",method="GET",status="200"} 1',
+            text,
+        )
+        self.assertIn("# TYPE buff163_request_duration_seconds histogram", text)
+        self.assertIn(
+            'buff163_request_duration_seconds_bucket{endpoint="/market/goods",le="0.01"} 0',
+            text,
+        )
+        self.assertIn(
+            'buff163_request_duration_seconds_bucket{endpoint="/market/goods",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn(
+            'buff163_request_duration_seconds_count{endpoint="/market/goods"} 1', text
+        )
+        self.assertTrue(text.endswith("\n"))
+
+    def test_metrics_as_adapter_hook(self):
+        metrics = Metrics()
+        with FakeBuff163Server(FakeMarket(5, categories=["c"])) as server:
+            with RestAdapter(server.hostname, hooks=[metrics]) as adapter:
+                adapter.get("/market/goods")
+        (requests_total,) = metrics.as_dict()["buff163_requests_total"]
+        self.assertEqual(requests_total["value"], 1)
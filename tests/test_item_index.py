@@ -0,0 +1,99 @@
+from unittest import TestCase
+from buff163_unofficial_api import schema
+from buff163_unofficial_api.item_index import ItemIndex
+from buff163_unofficial_api.models import Item, MarketChange, SpecificItem
+from tests.payloads import make_item, make_specific_item, make_tag
+
+
+def make_indexed_item(goods_id, price, weapon="weapon_ak47", exterior="wearcategory0"):
+    raw = make_item(goods_id, sell_min_price=price)
+    raw["market_hash_name"] = f"item {goods_id}"
+    tags = raw["goods_info"]["info"]["tags"]
+    tags["weapon"] = make_tag("weapon", weapon, weapon.upper())
+    tags["exterior"] = make_tag("exterior", exterior, exterior.upper())
+    return Item(**raw)
+
+
+class TestItemIndex(TestCase):
+    def setUp(self) -> None:
+        self.items = [
+            make_indexed_item(1, "150", exterior="wearcategory0"),
+            make_indexed_item(2, "250", exterior="wearcategory0"),
+            make_indexed_item(3, "120", exterior="wearcategory1"),
+            make_indexed_item(4, "90", weapon="weapon_awp"),
+            make_indexed_item(5, ""),
+        ]
+        self.index = ItemIndex(self.items)
+
+    def ids(self, items):
+        return [item.id for item in items]
+
+    def test_hash_lookups(self):
+        self.assertIs(self.index.get(3), self.items[2])
+        self.assertIs(self.index.by_name("item 2"), self.items[1])
+        self.assertIsNone(self.index.by_name("missing"))
+        self.assertEqual(len(self.index), 5)
+
+    def test_find_by_tag_intersection(self):
+        found = self.index.find(weapon="weapon_ak47", exterior="wearcategory0")
+        self.assertEqual(self.ids(found), [1, 2, 5])
+
+    def test_find_by_price_range_is_cheapest_first(self):
+        self.assertEqual(
+            self.ids(self.index.find(min_price=100, max_price=200)), [3, 1]
+        )
+        self.assertEqual(self.ids(self.index.find(max_price="150")), [4, 3, 1])
+
+    def test_find_combines_tags_and_price(self):
+        found = self.index.find(
+            weapon="weapon_ak47", exterior="wearcategory0", max_price=200
+        )
+        self.assertEqual(self.ids(found), [1])
+        # Large price slice, small tag set
+        found = self.index.find(weapon="weapon_awp", min_price=0, max_price=10**6)
+        self.assertEqual(self.ids(found), [4])
+
+    def test_find_accepts_tag_objects_and_localized_names(self):
+        tag = self.items[0].goods_info.info.tags.weapon
+        self.assertEqual(len(self.index.find(weapon=tag)), 4)
+        self.assertEqual(len(self.index.find(weapon=tag.localized_name)), 4)
+
+    def test_tag_names_resolve_to_the_indexed_set(self):
+        tag = self.items[0].goods_info.info.tags.weapon
+        ids = self.index._tags["weapon"][tag]
+        self.assertIs(self.index._tag_ids("weapon", "weapon_ak47"), ids)
+        self.assertIs(self.index._tag_ids("weapon", tag.localized_name), ids)
+        self.assertFalse(self.index._tag_ids("weapon", "weapon_missing"))
+        self.index.remove(4)
+        self.assertNotIn("weapon_awp", self.index._tag_names["weapon"])
+
+    def test_find_does_not_change_tag_sets(self):
+        self.index.find(weapon="weapon_ak47", exterior="wearcategory1")
+        self.assertEqual(len(self.index.find(weapon="weapon_ak47")), 4)
+
+    def test_find_unknown_field_raises(self):
+        with self.assertRaises(ValueError):
+            self.index.find(colour="red")
+
+    def test_upsert_replaces_old_entries(self):
+        self.index.upsert(make_indexed_item(1, "10", weapon="weapon_awp"))
+        self.assertEqual(self.ids(self.index.find(weapon="weapon_awp")), [1, 4])
+        self.assertEqual(self.ids(self.index.find(max_price=100)), [1, 4])
+        self.assertEqual(len(self.index), 5)
+
+    def test_remove_drops_from_every_index(self):
+        self.index.remove(4)
+        self.assertIsNone(self.index.get(4))
+        self.assertEqual(self.index.find(weapon="weapon_awp"), [])
+        self.assertEqual(self.index.find(max_price=100), [])
+
+    def test_apply_watcher_changes(self):
+        self.index.apply(MarketChange(MarketChange.REMOVED, 2))
+        self.index.apply(MarketChange(MarketChange.NEW, 6, make_indexed_item(6, "1")))
+        self.assertNotIn(2, self.index)
+        self.assertEqual(self.ids(self.index.find(limit=1, max_price=1000)), [6])
+
+    def test_indexes_specific_items(self):
+        item = schema.decode(SpecificItem, make_specific_item(9))
+        index = ItemIndex([item])
+        self.assertIs(index.find(max_price=10**6)[0], item)
@@ -0,0 +1,60 @@
+from unittest import TestCase, mock
+
+import requests
+
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.json_decoder import available_backends, get_decoder
+from buff163_unofficial_api.rest_adapter import RestAdapter
+
+
+class TestJsonDecoder(TestCase):
+    def test_stdlib_is_always_available(self):
+        self.assertIn("json", available_backends())
+
+    def test_default_is_fastest_installed_backend(self):
+        fastest = next(iter(available_backends().values()))
+        self.assertIs(get_decoder(), fastest)
+
+    def test_every_backend_decodes_bytes(self):
+        for name, decoder in available_backends().items():
+            with self.subTest(backend=name):
+                self.assertEqual(decoder(b'{"code": "OK", "n": [1, 2]}')["n"], [1, 2])
+
+    def test_every_backend_raises_value_error(self):
+        for name, decoder in available_backends().items():
+            with self.subTest(backend=name):
+                with self.assertRaises(ValueError):
+                    decoder(b'{"invalid JSON": ')
+
+    def test_callable_is_used_as_is(self):
+        def decoder(content):
+            return {"code": "OK"}
+
+        self.assertIs(get_decoder(decoder), decoder)
+
+    def test_unknown_backend_raises(self):
+        with self.assertRaises(ValueError):
+            get_decoder("yaml")
+
+
+class TestRestAdapterJsonDecoder(TestCase):
+    def setUp(self):
+        self.response = requests.Response()
+        self.response.status_code = 200
+
+    def test_decoder_receives_raw_content(self):
+        decoder = mock.Mock(return_value={"code": "OK"})
+        self.response._content = b'{"code": "OK"}'
+        rest_adapter = RestAdapter(json_decoder=decoder)
+        with mock.patch("requests.Session.request", return_value=self.response):
+            rest_adapter.get("")
+        decoder.assert_called_once_with(b'{"code": "OK"}')
+
+    def test_bad_json_raises_for_every_backend(self):
+        self.response._content = b'{"invalid JSON": '
+        for name in available_backends():
+            with self.subTest(backend=name):
+                rest_adapter = RestAdapter(json_decoder=name)
+                with mock.patch("requests.Session.request", return_value=self.response):
+                    with self.assertRaisesRegex(Buff163Exception, "Bad JSON"):
+                        rest_adapter.get("")
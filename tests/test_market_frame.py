@@ -0,0 +1,103 @@
+from unittest import TestCase, skipIf
+from unittest.mock import MagicMock
+
+from buff163_unofficial_api import market_frame
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cs_enums import Knife
+from buff163_unofficial_api.market_frame import MarketFrame
+from buff163_unofficial_api.models import Item, Result
+from tests.payloads import make_item, make_page, make_tag
+
+
+def make_rows() -> list:
+    rows = [
+        make_item(i, sell_min_price=str(price))
+        for i, price in enumerate((5, 250.5, 80, 1200))
+    ]
+    rows[1]["goods_info"]["info"]["tags"]["exterior"] = make_tag(
+        "exterior", "wearcategory0", "Factory New"
+    )
+    del rows[3]["goods_info"]["info"]["tags"]["weapon"]
+    rows[2]["buy_max_price"] = ""
+    return rows
+
+
+@skipIf(market_frame.np is None, "numpy is not installed")
+class TestMarketFrame(TestCase):
+    def setUp(self):
+        self.frame = MarketFrame.from_rows(make_rows())
+
+    def test_prices_are_integer_cents(self):
+        self.assertEqual(
+            self.frame["sell_min_price"].tolist(), [500, 25050, 8000, 120000]
+        )
+        self.assertIs(self.frame["buy_max_price"][2], market_frame.np.ma.masked)
+        self.assertIsNone(self.frame.row(2)["buy_max_price"])
+        self.assertEqual(self.frame["steam_price_cny"][0], 11020)
+
+    def test_tags_are_dictionary_encoded(self):
+        self.assertEqual(self.frame["exterior"].tolist(), [0, 1, 0, 0])
+        self.assertEqual(
+            self.frame.tag_values["exterior"][1].localized_name, "Factory New"
+        )
+        self.assertEqual(self.frame["weapon"][3], -1)
+        self.assertIsNone(self.frame.row(3)["weapon"])
+
+    def test_filter_combines_masks(self):
+        mask = (self.frame["sell_min_price"] < 100000) & self.frame.tag_mask(
+            "exterior", "Field-Tested"
+        )
+        self.assertEqual(self.frame.filter(mask)["goods_id"].tolist(), [0, 2])
+
+    def test_sort_and_top_k(self):
+        self.assertEqual(
+            self.frame.sort("sell_min_price", descending=True)["goods_id"].tolist(),
+            [3, 1, 2, 0],
+        )
+        self.assertEqual(
+            self.frame.top_k("sell_min_price", 2)["goods_id"].tolist(), [3, 1]
+        )
+        cheapest = self.frame.top_k("sell_min_price", 2, largest=False)
+        self.assertEqual(
+            list(cheapest.names),
+            [make_rows()[0]["market_hash_name"], make_rows()[2]["market_hash_name"]],
+        )
+
+    def test_missing_prices_are_left_out(self):
+        rows = make_rows()
+        rows[0]["sell_min_price"] = ""
+        frame = MarketFrame.from_rows(rows)
+        self.assertEqual(
+            frame.valid("sell_min_price").tolist(), [False, True, True, True]
+        )
+        self.assertEqual(
+            frame.filter(frame["sell_min_price"] < 20000)["goods_id"].tolist(), [2]
+        )
+        self.assertEqual(
+            frame.sort("sell_min_price")["goods_id"].tolist(), [2, 1, 3, 0]
+        )
+        self.assertEqual(
+            frame.sort("sell_min_price", descending=True)["goods_id"].tolist(),
+            [3, 1, 2, 0],
+        )
+        cheapest = frame.top_k("sell_min_price", 4, largest=False)
+        self.assertEqual(cheapest["goods_id"].tolist(), [2, 1, 3])
+
+    def test_from_items_matches_from_rows(self):
+        rows = [make_item(i) for i in range(3)]
+        from_items = MarketFrame.from_items(Item(**row) for row in rows)
+        from_rows = MarketFrame.from_rows(rows)
+        for column in from_rows.columns:
+            self.assertEqual(from_items[column].tolist(), from_rows[column].tolist())
+
+    def test_api_get_market_frame(self):
+        buff163api = Buff163API(page_size=2, read_ahead=0)
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.side_effect = [
+            Result(200, data=make_page(make_rows()[:2], 1, 2)),
+            Result(200, data=make_page(make_rows()[2:], 2, 2)),
+        ]
+        frame = buff163api.get_market_frame(Knife.KARAMBIT, max_amt=4)
+        self.assertEqual(len(frame), 4)
+        ep_params = buff163api._rest_adapter.get.call_args.kwargs["ep_params"]
+        self.assertEqual(ep_params["category"], "weapon_knife_karambit")
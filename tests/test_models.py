@@ -0,0 +1,141 @@
+import copy
+import pickle
+from unittest import TestCase
+from unittest import mock
+from unittest.mock import MagicMock
+
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api import models
+from buff163_unofficial_api.models import (
+    Exterior,
+    GoodsInfo,
+    Item,
+    Result,
+    SpecificItem,
+    Tags,
+)
+from tests.payloads import make_item, make_page, make_specific_item
+
+
+class TestLazyItem(TestCase):
+    def test_eager_item_builds_nested_models(self):
+        item = Item(**make_item(1))
+        self.assertIsInstance(item._goods_info, GoodsInfo)
+        self.assertIsInstance(item.goods_info.info.tags._weapon, Exterior)
+
+    def test_lazy_item_keeps_raw_dict_until_accessed(self):
+        item = Item(**make_item(1), lazy=True)
+        self.assertIsInstance(item._goods_info, dict)
+        self.assertEqual(item.sell_min_price, "100.5")
+        goods_info = item.goods_info
+        self.assertIsInstance(goods_info, GoodsInfo)
+        self.assertIs(item.goods_info, goods_info)
+        self.assertIsInstance(goods_info._info, dict)
+
+    def test_lazy_and_eager_items_read_the_same(self):
+        eager = Item(**make_item(7))
+        lazy = Item(**make_item(7), lazy=True)
+        for item in (eager, lazy):
+            tags = item.goods_info.info.tags
+            self.assertIsInstance(tags, Tags)
+            self.assertEqual(tags.weapon.internal_name, "weapon_ak47")
+            self.assertEqual(tags.exterior.localized_name, "Field-Tested")
+            self.assertEqual(item.goods_info.steam_price_cny, "110.2")
+            self.assertEqual(item.appid, 730)
+
+    def test_nested_fields_can_be_assigned(self):
+        item = Item(**make_item(1), lazy=True)
+        item.goods_info = None
+        self.assertIsNone(item.goods_info)
+
+    def test_api_lazy_models_mode(self):
+        buff163api = Buff163API(lazy_models=True)
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.return_value = Result(
+            200, data=make_page([make_item(1)])
+        )
+        item = buff163api.get_featured_market()[0]
+        self.assertIsInstance(item._goods_info, dict)
+        self.assertEqual(item.goods_info.info.tags.rarity.localized_name, "Covert")
+
+
+class TestSlottedModels(TestCase):
+    def test_models_have_no_instance_dict(self):
+        item = Item(**make_item(1))
+        for obj in (item, item.goods_info, item.goods_info.info.tags):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_unknown_fields_go_to_extra(self):
+        item = Item(**make_item(1), new_api_field="x")
+        self.assertEqual(item.new_api_field, "x")
+        self.assertEqual(item._extra, {"new_api_field": "x"})
+        self.assertEqual(item.appid, 730)
+
+    def test_missing_attribute_raises_attribute_error(self):
+        item = Item(**make_item(1))
+        with self.assertRaises(AttributeError):
+            item.not_a_field
+        self.assertFalse(hasattr(Exterior("a", 1, "b", "c"), "not_a_field"))
+
+    def test_pickle_round_trip(self):
+        for lazy in (False, True):
+            item = Item(**make_item(3), lazy=lazy, new_api_field=[1])
+            restored = pickle.loads(pickle.dumps(item))
+            self.assertEqual(restored.id, 3)
+            self.assertEqual(restored.new_api_field, [1])
+            self.assertEqual(
+                restored.goods_info.info.tags.quality.internal_name, "normal"
+            )
+
+    def test_pickle_specific_item(self):
+        item = SpecificItem(**make_specific_item(5))
+        restored = pickle.loads(pickle.dumps(item, protocol=2))
+        self.assertEqual(restored.market_hash_name, item.market_hash_name)
+
+    def test_copy(self):
+        item = Item(**make_item(4))
+        clone = copy.copy(item)
+        self.assertEqual(clone.sell_min_price, item.sell_min_price)
+        self.assertIs(clone.goods_info, item.goods_info)
+
+
+class TestInternedTags(TestCase):
+    def test_identical_tags_share_one_instance(self):
+        first = Item(**make_item(1))
+        second = Item(**make_item(2), lazy=True)
+        self.assertIs(
+            first.goods_info.info.tags.weapon, second.goods_info.info.tags.weapon
+        )
+
+    def test_tags_compare_and_hash_by_value(self):
+        raw = {"category": "c", "id": 1, "internal_name": "i", "localized_name": "l"}
+        tag = Exterior(**raw)
+        self.assertEqual(tag, Exterior.intern(raw))
+        self.assertEqual(len({tag, Exterior(**raw)}), 1)
+        self.assertNotEqual(tag, Exterior("c", 2, "i", "l"))
+
+    def test_tags_are_immutable(self):
+        tag = Exterior("c", 1, "i", "l")
+        with self.assertRaises(AttributeError):
+            tag.localized_name = "other"
+
+    def test_unpickled_tags_are_interned(self):
+        raw = {"category": "c", "id": 9, "internal_name": "i", "localized_name": "l"}
+        tag = Exterior.intern(raw)
+        self.assertIs(pickle.loads(pickle.dumps(tag)), tag)
+
+    def test_intern_table_is_bounded(self):
+        saved = dict(models._INTERNED_TAGS)
+        self.addCleanup(models._INTERNED_TAGS.update, saved)
+        models._INTERNED_TAGS.clear()
+        with mock.patch.object(models, "MAX_INTERNED_TAGS", 2):
+            for i in range(5):
+                Exterior.intern(
+                    {
+                        "category": "c",
+                        "id": i,
+                        "internal_name": "",
+                        "localized_name": "",
+                    }
+                )
+            self.assertEqual(len(models._INTERNED_TAGS), 2)
@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+import buff163_unofficial_api
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code: str) -> set:
+    """Modules in sys.modules after running ``code`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT_DIR,
+    )
+    return set(completed.stdout.split())
+
+
+class TestLazyImport(TestCase):
+    def test_package_import_loads_no_dependency(self):
+        modules = loaded_modules("import buff163_unofficial_api")
+        for heavy in (
+            "requests",
+            "urllib3",
+            "aiohttp",
+            "numpy",
+            "buff163_unofficial_api.models",
+            "buff163_unofficial_api.cs_enums",
+        ):
+            self.assertNotIn(heavy, modules)
+
+    def test_client_import_skips_optional_extras(self):
+        modules = loaded_modules("from buff163_unofficial_api import Buff163API")
+        self.assertIn("requests", modules)
+        for optional in (
+            "numpy",
+            "aiohttp",
+            "sqlite3",
+            "buff163_unofficial_api.bulk",
+            "buff163_unofficial_api.cookie_pool",
+            "buff163_unofficial_api.crawler",
+            "buff163_unofficial_api.icon_store",
+            "buff163_unofficial_api.rate_limiter",
+            "buff163_unofficial_api.watcher",
+        ):
+            self.assertNotIn(optional, modules)
+
+    def test_public_names_resolve(self):
+        from buff163_unofficial_api import AsyncBuff163API, Buff163API
+        from buff163_unofficial_api.async_buff163_api import (
+            AsyncBuff163API as async_defined,
+        )
+        from buff163_unofficial_api.buff163_unofficial_api import (
+            Buff163API as defined,
+        )
+
+        self.assertIs(Buff163API, defined)
+        self.assertIs(AsyncBuff163API, async_defined)
+        self.assertIn("Buff163API", dir(buff163_unofficial_api))
+        self.assertEqual(
+            sorted(buff163_unofficial_api.__all__), ["AsyncBuff163API", "Buff163API"]
+        )
+
+    def test_submodules_resolve_as_attributes(self):
+        # A fresh interpreter, so no test has imported the submodules yet
+        modules = loaded_modules(
+            "import buff163_unofficial_api\n"
+            "assert buff163_unofficial_api.cs_enums.Gun.AK47.value == 'weapon_ak47'\n"
+            "assert buff163_unofficial_api.models.Item.__name__ == 'Item'"
+        )
+        self.assertIn("buff163_unofficial_api.cs_enums", modules)
+        self.assertNotIn("requests", modules)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            buff163_unofficial_api.NotAThing
@@ -0,0 +1,76 @@
+import time
+from unittest import TestCase, mock
+
+from buff163_unofficial_api.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket(TestCase):
+    def test_burst_is_free_then_waits(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_tokens_refill_over_time(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        bucket.reserve()
+        time.sleep(0.02)
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_try_acquire_never_goes_into_debt(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+        self.assertLess(bucket.reserve(), 1.0)
+
+    def test_acquire_sleeps_for_reservation(self):
+        bucket = TokenBucket(rate=4, capacity=1)
+        bucket.reserve()
+        with mock.patch("buff163_unofficial_api.rate_limiter.time.sleep") as sleep:
+            bucket.acquire()
+        self.assertAlmostEqual(sleep.call_args.args[0], 0.25, places=2)
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter(TestCase):
+    def setUp(self):
+        self.rate_limiter = RateLimiter(
+            default_rate=1, limits={"/market/goods": 5, "/market/goods/info": 2}
+        )
+
+    def test_longest_prefix_wins(self):
+        goods = self.rate_limiter.bucket_for("/market/goods?page_num=2")
+        info = self.rate_limiter.bucket_for("/market/goods/info?goods_id=1")
+        other = self.rate_limiter.bucket_for("/account/steam_bot")
+        self.assertEqual(goods.rate, 5)
+        self.assertEqual(info.rate, 2)
+        self.assertEqual(other.rate, 1)
+
+    def test_unlimited_without_default_rate(self):
+        rate_limiter = RateLimiter(limits={"/market/goods": 1})
+        self.assertIsNone(rate_limiter.bucket_for("/other"))
+        self.assertEqual(rate_limiter.reserve("/other"), 0)
+
+    def test_aimd_increases_additively_and_decreases_multiplicatively(self):
+        rate_limiter = RateLimiter(
+            default_rate=10, adaptive=True, increase=1, decrease=0.5, max_rate=12
+        )
+        bucket = rate_limiter.bucket_for("/market/goods")
+        rate_limiter.on_success("/market/goods")
+        self.assertEqual(bucket.rate, 11)
+        rate_limiter.on_success("/market/goods")
+        rate_limiter.on_success("/market/goods")
+        self.assertEqual(bucket.rate, 12)
+        rate_limiter.on_throttle("/market/goods")
+        self.assertEqual(bucket.rate, 6)
+
+    def test_rate_is_fixed_when_not_adaptive(self):
+        bucket = self.rate_limiter.bucket_for("/market/goods")
+        self.rate_limiter.on_success("/market/goods")
+        self.rate_limiter.on_throttle("/market/goods")
+        self.assertEqual(bucket.rate, 5)
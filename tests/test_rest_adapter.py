@@ -1,9 +1,12 @@
+import io
 import requests
+import urllib3
 from requests.exceptions import RequestException
 from unittest import TestCase, mock
 
 from buff163_unofficial_api.exceptions import Buff163Exception
 from buff163_unofficial_api.models import Result
+from buff163_unofficial_api.rate_limiter import RateLimiter
 from buff163_unofficial_api.rest_adapter import RestAdapter
 
 
@@ -11,65 +14,232 @@ class TestRestAdapter(TestCase):
     def setUp(self):
         self.rest_adapter = RestAdapter()
         self.response = requests.Response()
+        sleep_patcher = mock.patch("buff163_unofficial_api.rest_adapter.time.sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def make_response(self, status_code: int, content: bytes = b'{"code": "OK"}'):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        return response
 
     # _do
     def test__do_good_request_returns_result(self):
         # Arrange
         self.response.status_code = 200
-        self.response._content = "{}".encode()
+        self.response._content = '{"code": "OK"}'.encode()
         # Act
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
             result = self.rest_adapter._do("GET", "")
             # Assert
             self.assertIsInstance(result, Result)
 
     def test__do_bad_request_raises_buff163_exception(self):
-        with mock.patch("requests.request", side_effect=RequestException):
+        with mock.patch("requests.Session.request", side_effect=RequestException):
             with self.assertRaises(Buff163Exception):
                 self.rest_adapter._do("GET", "")
 
     def test__do_bad_json_raises_buff163_exception(self):
         bad_json = '{"invalid JSON": '
-        self.response._content = bad_json
-        with mock.patch("requests.request", return_value=self.response):
+        self.response._content = bad_json.encode()
+        with mock.patch("requests.Session.request", return_value=self.response):
             with self.assertRaises(Buff163Exception):
                 self.rest_adapter._do("GET", "")
 
     def test__do_300_or_higher_raises_buff163_exception(self):
         self.response.status_code = 300
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
             with self.assertRaises(Buff163Exception):
                 self.rest_adapter._do("GET", "")
 
     def test__do_199_or_lower_raises_buff163_exception(self):
         self.response.status_code = 199
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertRaises(Buff163Exception):
+                self.rest_adapter._do("GET", "")
+
+    # retries
+    def test__do_retries_429_then_succeeds(self):
+        responses = [self.make_response(429), self.make_response(200)]
+        with mock.patch("requests.Session.request", side_effect=responses) as request:
+            result = self.rest_adapter._do("GET", "")
+            self.assertEqual(result.status_code, 200)
+            self.assertEqual(request.call_count, 2)
+        self.sleep.assert_called_once()
+
+    def test__do_retries_connection_errors(self):
+        side_effect = [RequestException(), RequestException(), self.make_response(200)]
+        with mock.patch("requests.Session.request", side_effect=side_effect) as request:
+            self.rest_adapter._do("GET", "")
+            self.assertEqual(request.call_count, 3)
+
+    def test__do_gives_up_after_max_retries(self):
+        rest_adapter = RestAdapter(max_retries=2)
+        with mock.patch(
+            "requests.Session.request", return_value=self.make_response(503)
+        ) as request:
+            with self.assertRaises(Buff163Exception):
+                rest_adapter._do("GET", "")
+            self.assertEqual(request.call_count, 3)
+
+    def test__do_does_not_retry_client_errors(self):
+        with mock.patch(
+            "requests.Session.request",
+            return_value=self.make_response(404, b"Not Found"),
+        ) as request:
             with self.assertRaises(Buff163Exception):
                 self.rest_adapter._do("GET", "")
+            self.assertEqual(request.call_count, 1)
+
+    def test__do_honours_retry_after(self):
+        throttled = self.make_response(429)
+        throttled.headers["Retry-After"] = "7"
+        with mock.patch(
+            "requests.Session.request",
+            side_effect=[throttled, self.make_response(200)],
+        ):
+            self.rest_adapter._do("GET", "")
+        self.sleep.assert_called_once_with(7.0)
+
+    def test__do_does_not_retry_post_server_errors(self):
+        side_effects = (
+            [self.make_response(503)],
+            [self.make_response(429)],
+            [requests.exceptions.ReadTimeout()],
+        )
+        for side_effect in side_effects:
+            with mock.patch(
+                "requests.Session.request", side_effect=side_effect
+            ) as request:
+                with self.assertRaises(Buff163Exception):
+                    self.rest_adapter._do("POST", "")
+                self.assertEqual(request.call_count, 1)
+
+    def test__do_retries_post_when_never_sent(self):
+        refused = requests.exceptions.ConnectionError(
+            urllib3.exceptions.MaxRetryError(
+                None, "/", urllib3.exceptions.NewConnectionError(None, "refused")
+            )
+        )
+        throttled = self.make_response(429)
+        throttled.headers["Retry-After"] = "1"
+        side_effect = [refused, throttled, self.make_response(200)]
+        with mock.patch("requests.Session.request", side_effect=side_effect) as request:
+            self.rest_adapter._do("POST", "")
+            self.assertEqual(request.call_count, 3)
+
+    def test_retry_methods_are_configurable(self):
+        rest_adapter = RestAdapter(retry_methods=["GET", "post"])
+        side_effect = [self.make_response(503), self.make_response(200)]
+        with mock.patch("requests.Session.request", side_effect=side_effect) as request:
+            rest_adapter._do("POST", "")
+            self.assertEqual(request.call_count, 2)
+
+    def test_backoff_grows_exponentially_with_cap(self):
+        rest_adapter = RestAdapter(backoff_factor=1, backoff_max=5)
+        with mock.patch("random.uniform", side_effect=lambda low, high: high):
+            delays = [rest_adapter._backoff(attempt) for attempt in range(1, 6)]
+        self.assertEqual(delays, [1, 2, 4, 5, 5])
+
+    def test__do_reports_throttling_to_rate_limiter(self):
+        rate_limiter = mock.Mock(spec=RateLimiter)
+        rest_adapter = RestAdapter(rate_limiter=rate_limiter)
+        responses = [self.make_response(429), self.make_response(200)]
+        with mock.patch("requests.Session.request", side_effect=responses):
+            rest_adapter._do("GET", "/market/goods")
+        self.assertEqual(rate_limiter.acquire.call_count, 2)
+        rate_limiter.on_throttle.assert_called_once_with("/market/goods")
+        rate_limiter.on_success.assert_called_once_with("/market/goods")
 
     # get
     def test_get_method_passes_in_get(self):
         self.response.status_code = 200
-        self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response) as request:
+        self.response._content = '{"code": "OK"}'.encode()
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
             self.rest_adapter.get("")
             self.assertTrue(request.method, "GET")
 
     # post
     def test_post_method_passes_in_post(self):
         self.response.status_code = 200
-        self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response) as request:
+        self.response._content = '{"code": "OK"}'.encode()
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
             self.rest_adapter.post("")
             self.assertTrue(request.method, "POST")
 
     # delete
     def test_delete_method_passes_in_delete(self):
         self.response.status_code = 200
-        self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response) as request:
+        self.response._content = '{"code": "OK"}'.encode()
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
             self.rest_adapter.delete("")
             self.assertTrue(request.method, "DELETE")
 
-    # def test_fetch_data(self):
-    #     self.fail()
+    # session
+    def test_session_is_reused_between_requests(self):
+        self.response.status_code = 200
+        self.response._content = '{"code": "OK"}'.encode()
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
+            self.rest_adapter.get("")
+            self.rest_adapter.get("")
+            self.assertEqual(request.call_count, 2)
+
+    def test_default_headers_include_cookie(self):
+        rest_adapter = RestAdapter(
+            session_cookie="session=abc", headers={"X-Test": "1"}
+        )
+        self.assertEqual(rest_adapter._session.headers["Cookie"], "session=abc")
+        self.assertEqual(rest_adapter._session.headers["X-Test"], "1")
+
+    def test_pool_size_is_configurable(self):
+        rest_adapter = RestAdapter(pool_connections=3, pool_maxsize=7)
+        http_adapter = rest_adapter._session.get_adapter("https://buff.163.com")
+        self.assertEqual(http_adapter._pool_connections, 3)
+        self.assertEqual(http_adapter._pool_maxsize, 7)
+
+    def test_context_manager_closes_session(self):
+        with mock.patch("requests.Session.close") as close:
+            with RestAdapter() as rest_adapter:
+                self.assertIsInstance(rest_adapter, RestAdapter)
+            close.assert_called_once()
+
+    # stream_data
+    def test_stream_data_yields_chunks_without_cookie(self):
+        self.response.status_code = 200
+        self.response.raw = io.BytesIO(b"abcdef")
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
+            chunks = list(self.rest_adapter.stream_data("https://cdn/i.png", 4))
+        self.assertEqual(chunks, [b"abcd", b"ef"])
+        self.assertTrue(request.call_args.kwargs["stream"])
+        self.assertIsNone(request.call_args.kwargs["headers"]["Cookie"])
+
+    def test_stream_data_bad_status_raises_buff163_exception(self):
+        self.response.status_code = 404
+        self.response.reason = "Not Found"
+        self.response.raw = io.BytesIO(b"")
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertRaises(Buff163Exception):
+                list(self.rest_adapter.stream_data("https://cdn/i.png"))
+
+    # fetch_data
+    def test_fetch_data_returns_bytes_without_cookie(self):
+        self.response.status_code = 200
+        self.response._content = b"image"
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
+            self.assertEqual(
+                self.rest_adapter.fetch_data("https://cdn/icon.png"), b"image"
+            )
+            self.assertIsNone(request.call_args.kwargs["headers"]["Cookie"])
@@ -0,0 +1,90 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from buff163_unofficial_api import schema
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.models import (
+    Exterior,
+    GoodsInfoItem,
+    Item,
+    PaintseedFilter,
+    RelativeGood,
+    Result,
+    ShareData,
+    SortByFields,
+    SpecificItem,
+)
+from tests.payloads import make_item, make_specific_item
+
+
+class TestSchemaDecode(TestCase):
+    def test_specific_item_is_fully_typed(self):
+        item = schema.decode(SpecificItem, make_specific_item(900565))
+        self.assertIsInstance(item.goods_info, GoodsInfoItem)
+        self.assertIsInstance(item.goods_info.info.tags.weapon, Exterior)
+        self.assertIsInstance(item.relative_goods[0], RelativeGood)
+        self.assertIsInstance(item.paintseed_filters[0], PaintseedFilter)
+        self.assertIsInstance(item.share_data, ShareData)
+        self.assertIsInstance(item.sort_by_fields, SortByFields)
+        self.assertEqual(item.sort_by_fields.list[0].list[0].title, "Default")
+        self.assertIsInstance(item.rent_sort_by_fields, SortByFields)
+
+    def test_prices_become_decimals(self):
+        item = schema.decode(SpecificItem, make_specific_item(1))
+        self.assertEqual(item.sell_min_price, Decimal("100.5"))
+        self.assertEqual(item.goods_info.steam_price_cny, Decimal("110.2"))
+        self.assertEqual(item.relative_goods[0].sell_min_price, Decimal("150"))
+        self.assertIsNone(schema.price(""))
+
+    def test_cents_are_exact(self):
+        self.assertEqual(schema.cents("0.29"), 29)
+        self.assertEqual(schema.cents(Decimal("100.5")), 10050)
+        self.assertIsNone(schema.cents(None))
+
+    def test_rent_fields_are_kept(self):
+        item = schema.decode(SpecificItem, make_specific_item(1))
+        self.assertEqual(item.rent_day_choices, [7, 14])
+        self.assertFalse(item.has_rent_order)
+
+    def test_unknown_fields_are_tolerated_and_kept(self):
+        data = make_specific_item(1)
+        data["brand_new_field"] = {"x": 1}
+        data["goods_info"]["another_one"] = True
+        item = schema.decode(SpecificItem, data)
+        self.assertEqual(item.brand_new_field, {"x": 1})
+        self.assertTrue(item.goods_info.another_one)
+
+    def test_missing_fields_get_defaults(self):
+        data = make_specific_item(1)
+        del data["wiki_link"], data["support_charm"]
+        item = schema.decode(SpecificItem, data)
+        self.assertIsNone(item.buy_min_price_limit)
+        self.assertIsNone(item.wiki_link)
+        self.assertIsNone(item.support_charm)
+
+    def test_init_tolerates_unknown_fields(self):
+        data = make_specific_item(1)
+        data["brand_new_field"] = 1
+        self.assertEqual(SpecificItem(**data).brand_new_field, 1)
+
+    def test_item_decode_matches_init(self):
+        row = make_item(3)
+        decoded = schema.decode(Item, row)
+        built = Item(**row)
+        self.assertEqual(decoded.id, built.id)
+        self.assertEqual(decoded.data, b"")
+        self.assertEqual(decoded.sell_min_price, Decimal(built.sell_min_price))
+        self.assertIs(
+            decoded.goods_info.info.tags.rarity, built.goods_info.info.tags.rarity
+        )
+
+    def test_api_get_item_uses_schema(self):
+        buff163api = Buff163API()
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.return_value = Result(
+            200, data={"code": "OK", "data": make_specific_item(900565)}
+        )
+        item = buff163api.get_item(900565)
+        self.assertIsInstance(item.goods_info, GoodsInfoItem)
+        self.assertEqual(item.quick_price, Decimal("100.1"))
@@ -0,0 +1,149 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+from buff163_unofficial_api.cs_enums import Gun, Knife
+from buff163_unofficial_api.fake_server import FakeMarket, synthetic_row
+from buff163_unofficial_api.models import Item, MarketChange
+from buff163_unofficial_api.search_index import SearchIndex, ngrams, normalize
+
+
+def named_row(goods_id: int, category: str, name: str, chinese: str = None) -> dict:
+    row = synthetic_row(goods_id, category)
+    row["market_hash_name"] = name
+    row["name"] = chinese or name
+    return row
+
+
+ROWS = [
+    named_row(
+        1, Gun.AK47.value, "AK-47 | Redline (Field-Tested)", "AK-47 | 红线 (久经沙场)"
+    ),
+    named_row(2, Gun.AK47.value, "AK-47 | Redline (Minimal Wear)"),
+    named_row(3, Gun.AK47.value, "AK-47 | Vulcan (Factory New)"),
+    named_row(4, Gun.M4A1.value, "M4A1-S | Hyper Beast (Field-Tested)"),
+    named_row(5, Knife.KARAMBIT.value, "★ Karambit | Doppler (Factory New)"),
+]
+
+
+class TestNormalize(TestCase):
+    def test_normalize(self):
+        self.assertEqual(
+            normalize("AK-47 | Redline (Field-Tested)"), "ak 47 redline field tested"
+        )
+        self.assertEqual(normalize("★ Karambit"), "karambit")
+
+    def test_ngrams_are_padded(self):
+        self.assertEqual(ngrams("ak"), {" ak", "ak "})
+
+
+class TestSearchIndex(TestCase):
+    def setUp(self) -> None:
+        self.index = SearchIndex(ROWS)
+
+    def test_lookup_ignores_case_and_punctuation(self):
+        self.assertEqual(self.index.lookup("ak-47 | redline (field-tested)"), 1)
+        self.assertEqual(self.index.lookup("AK 47 Redline Field Tested"), 1)
+        self.assertEqual(self.index.lookup("AK-47 | 红线 (久经沙场)"), 1)
+        self.assertIsNone(self.index.lookup("AK-47 | Redline"))
+
+    def test_lookup_in_category(self):
+        name = "M4A1-S | Hyper Beast (Field-Tested)"
+        self.assertEqual(self.index.lookup(name, category=Gun.M4A1), 4)
+        self.assertIsNone(self.index.lookup(name, category=Gun.AK47))
+
+    def test_prefix(self):
+        hits = self.index.prefix("ak-47 | red")
+        self.assertEqual([hit.goods_id for hit in hits], [1, 2])
+        self.assertEqual(hits[0].field, "market_hash_name")
+        self.assertEqual(len(self.index.prefix("ak", limit=2)), 2)
+        self.assertEqual([hit.goods_id for hit in self.index.prefix("ak 47 红")], [1])
+        self.assertEqual(self.index.prefix("zzz"), [])
+
+    def test_search_tolerates_typos_and_word_order(self):
+        hits = self.index.search("redlin ak47 feild tested")
+        self.assertEqual([hit.goods_id for hit in hits], [1])
+        hits = self.index.search("redlin ak47 feild tested", min_score=0.1)
+        self.assertEqual(hits[0].goods_id, 1)
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual(self.index.search("karambit dopler")[0].goods_id, 5)
+
+    def test_search_in_categories(self):
+        hits = self.index.search("field tested", category=[Gun.M4A1, Knife.GUT])
+        self.assertEqual([hit.goods_id for hit in hits], [4])
+        self.assertEqual(self.index.search("field tested", category="nothing"), [])
+
+    def test_replace_and_remove(self):
+        self.index.add(
+            named_row(1, Gun.AK47.value, "AK-47 | Bloodsport (Field-Tested)")
+        )
+        self.assertEqual(len(self.index), 5)
+        self.assertIsNone(self.index.lookup("AK-47 | Redline (Field-Tested)"))
+        self.assertEqual(self.index.lookup("AK-47 | Bloodsport (Field-Tested)"), 1)
+
+        self.assertTrue(self.index.remove(3))
+        self.assertFalse(self.index.remove(3))
+        self.assertNotIn(3, self.index)
+        self.assertEqual(self.index.prefix("ak-47 | vulcan"), [])
+
+    def test_unchanged_re_add_keeps_one_entry(self):
+        for _ in range(100):
+            self.index.add(ROWS[0])
+        self.assertEqual(len(self.index._ids), len(ROWS))
+        self.assertEqual(len(self.index._keys), 3 * len(ROWS))
+
+    def test_dead_entries_are_compacted(self):
+        row = dict(ROWS[0])
+        for i in range(1000):
+            row["short_name"] = f"AK-47 | Redline #{i}"
+            self.index.add(row)
+        self.assertEqual(len(self.index), len(ROWS))
+        self.assertLessEqual(len(self.index._ids), 2 * len(ROWS))
+        self.assertLessEqual(len(self.index._keys), 6 * len(ROWS))
+        self.assertEqual(self.index.lookup("ak 47 redline 999"), 1)
+        self.assertEqual(
+            [hit.goods_id for hit in self.index.prefix("ak-47 | red")], [1, 2]
+        )
+
+    def test_apply_watcher_changes(self):
+        row = named_row(6, Gun.AWP.value, "AWP | Asiimov (Field-Tested)")
+        self.index.apply(MarketChange(MarketChange.NEW, 6, Item(**row)))
+        self.assertEqual(self.index.lookup("awp asiimov field tested", Gun.AWP), 6)
+        changed = dict(row, sell_min_price="1")
+        self.index.apply(MarketChange(MarketChange.CHANGED, 6, Item(**changed)))
+        self.assertEqual(len(self.index._ids), len(ROWS) + 1)
+        self.index.apply(MarketChange(MarketChange.REMOVED, 6))
+        self.assertNotIn(6, self.index)
+
+    def test_save_and_load(self):
+        self.index.remove(2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.json")
+            self.index.save(path)
+            loaded = SearchIndex.load(path)
+        self.assertEqual(len(loaded), 4)
+        self.assertEqual(loaded.lookup("AK-47 | 红线 (久经沙场)"), 1)
+        self.assertEqual([hit.goods_id for hit in loaded.prefix("ak 47")], [1, 3])
+        self.assertEqual(
+            [hit.goods_id for hit in loaded.search("hyper beast")],
+            [hit.goods_id for hit in self.index.search("hyper beast")],
+        )
+
+    def test_load_rejects_other_formats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.json")
+            with open(path, "w") as f:
+                f.write('{"format": 0}')
+            with self.assertRaises(ValueError):
+                SearchIndex.load(path)
+
+    def test_lookup_is_sub_millisecond(self):
+        index = SearchIndex(FakeMarket(items_per_category=20).rows)
+        index.prefix("warm up")
+        names = [row["market_hash_name"] for row in FakeMarket(20).rows[:500]]
+        start = time.perf_counter()
+        for name in names:
+            index.lookup(name)
+            index.prefix(name[:8], limit=5)
+        elapsed = (time.perf_counter() - start) / len(names)
+        self.assertLess(elapsed, 1e-3)
@@ -0,0 +1,136 @@
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase
+from buff163_unofficial_api.cs_enums import Knife
+from buff163_unofficial_api.fake_server import FakeBuff163Server, FakeMarket
+from buff163_unofficial_api.sharded_crawl import (
+    CLAIMED,
+    DONE,
+    FAILED,
+    PENDING,
+    ShardedCrawl,
+    WorkQueue,
+)
+
+
+def fake_pages(total_page: int, per_page: int = 2, fail=()):
+    """fetch_page over ``total_page`` pages per category, ids unique per (category, page)."""
+
+    def fetch_page(category: str, page: int) -> dict:
+        if (category, page) in fail:
+            raise RuntimeError("boom")
+        base = (hash(category) % 1000) * 1000 + page * per_page
+        return {
+            "page_num": page,
+            "total_page": total_page,
+            "items": [{"id": base + i} for i in range(per_page)],
+        }
+
+    return fetch_page
+
+
+class TestWorkQueue(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.queue = WorkQueue(os.path.join(tmp.name, "queue.sqlite3"), lease=60)
+        self.addCleanup(self.queue.close)
+
+    def test_seed_is_idempotent(self):
+        self.assertEqual(self.queue.seed(["a", Knife.GUT]), 2)
+        self.assertEqual(self.queue.seed(["a", "b"]), 1)
+        self.assertEqual(self.queue.counts()[PENDING], 3)
+
+    def test_claims_do_not_overlap(self):
+        self.queue.seed(["a", "b", "c"])
+        first = self.queue.claim("w1", limit=2)
+        second = self.queue.claim("w2", limit=2)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse(set(first) & set(second))
+        self.assertEqual(self.queue.claim("w3"), [])
+        self.assertEqual(self.queue.counts()[CLAIMED], 3)
+
+    def test_first_page_queues_the_rest(self):
+        self.queue.seed(["a"])
+        self.queue.claim("w1")
+        self.queue.complete("a", 1, total_page=3)
+        self.assertEqual(
+            self.queue.counts(), {PENDING: 2, CLAIMED: 0, DONE: 1, FAILED: 0}
+        )
+        self.assertEqual(self.queue.claim("w1", limit=5), [("a", 2), ("a", 3)])
+
+    def test_expired_lease_is_reclaimed(self):
+        self.queue.lease = 0.05
+        self.queue.seed(["a"])
+        self.assertEqual(self.queue.claim("dead"), [("a", 1)])
+        self.assertEqual(self.queue.claim("alive"), [])
+        time.sleep(0.1)
+        self.assertEqual(self.queue.claim("alive"), [("a", 1)])
+
+    def test_failures_retry_then_give_up(self):
+        self.queue.max_attempts = 2
+        self.queue.seed(["a"])
+        self.queue.claim("w1")
+        self.queue.fail("a", 1, "boom")
+        self.assertEqual(self.queue.counts()[PENDING], 1)
+        self.queue.claim("w1")
+        self.queue.fail("a", 1, "boom")
+        self.assertEqual(self.queue.failed(), [("a", 1, "boom")])
+        self.assertTrue(self.queue.is_finished())
+
+
+class TestShardedCrawl(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+        self.crawl = ShardedCrawl(self.directory, poll_interval=0.01)
+
+    def test_work_writes_shard_and_finishes(self):
+        self.crawl.seed(["a", "b"])
+        stats = self.crawl.work(fake_pages(3), worker_id="w1")
+        self.assertEqual((stats["pages"], stats["items"]), (6, 12))
+        self.assertEqual(self.crawl.stats()[DONE], 6)
+        self.assertEqual(
+            self.crawl.shard_paths(), [os.path.join(self.directory, "shard-w1.jsonl")]
+        )
+
+    def test_abandoned_unit_is_redone_and_merged_once(self):
+        self.crawl.lease = 0.05
+        self.crawl.seed(["a"])
+        # A worker wrote page 1 and died before completing it
+        with self.crawl.queue() as queue:
+            queue.claim("dead")
+        with open(os.path.join(self.directory, "shard-dead.jsonl"), "w") as f:
+            for row in fake_pages(2)("a", 1)["items"]:
+                f.write(json.dumps(row) + "\n")
+            f.write('{"id": ')
+
+        stats = self.crawl.work(fake_pages(2), worker_id="alive")
+        self.assertEqual(stats["pages"], 2)
+        output = os.path.join(self.directory, "catalog.jsonl")
+        self.assertEqual(self.crawl.merge(output), 4)
+        with open(output) as f:
+            ids = [json.loads(line)["id"] for line in f]
+        self.assertEqual(len(set(ids)), 4)
+
+    def test_failed_units_are_reported(self):
+        crawl = ShardedCrawl(self.directory, max_attempts=2, poll_interval=0.01)
+        crawl.seed(["a"])
+        stats = crawl.work(fake_pages(2, fail={("a", 2)}), worker_id="w1")
+        self.assertEqual(stats["failed"], 2)
+        with crawl.queue() as queue:
+            self.assertEqual(queue.failed(), [("a", 2, "boom")])
+
+    def test_processes_against_fake_server(self):
+        categories = [Knife.KARAMBIT.value, Knife.GUT.value]
+        market = FakeMarket(items_per_category=30, categories=categories)
+        with FakeBuff163Server(market) as server:
+            self.crawl.seed(categories)
+            stats = self.crawl.run(2, hostname=server.hostname, page_size=5)
+        self.assertEqual(sum(s["pages"] for s in stats), 12)
+        self.assertEqual(self.crawl.stats()[DONE], 12)
+        self.assertEqual(self.crawl.merge(), 60)
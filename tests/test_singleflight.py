@@ -0,0 +1,88 @@
+import threading
+import time
+from unittest import TestCase, mock
+
+import requests
+
+from buff163_unofficial_api.rest_adapter import RestAdapter
+from buff163_unofficial_api.singleflight import SingleFlight
+
+
+def run_concurrently(fn, n: int) -> list:
+    results = [None] * n
+    barrier = threading.Barrier(n)
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(TestCase):
+    def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = run_concurrently(lambda: single_flight.do("k", slow), 8)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(single_flight.saved, 7)
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        results = run_concurrently(lambda: single_flight.do("k", fail), 4)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_sequential_calls_run_again(self):
+        single_flight = SingleFlight()
+        self.assertEqual(single_flight.do("k", lambda: 1), 1)
+        self.assertEqual(single_flight.do("k", lambda: 2), 2)
+        self.assertEqual(single_flight.saved, 0)
+
+
+class TestRestAdapterCoalescing(TestCase):
+    def slow_response(self, *args, **kwargs):
+        time.sleep(0.05)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"code": "OK"}'
+        return response
+
+    def test_identical_gets_are_coalesced(self):
+        rest_adapter = RestAdapter()
+        with mock.patch(
+            "requests.Session.request", side_effect=self.slow_response
+        ) as request:
+            run_concurrently(
+                lambda: rest_adapter.get("/market/goods/info", {"goods_id": 1}), 6
+            )
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(rest_adapter.coalesced_requests, 5)
+
+    def test_coalescing_can_be_disabled(self):
+        rest_adapter = RestAdapter(coalesce=False)
+        with mock.patch(
+            "requests.Session.request", side_effect=self.slow_response
+        ) as request:
+            run_concurrently(lambda: rest_adapter.get("/market/goods/info"), 3)
+        self.assertEqual(request.call_count, 3)
+        self.assertEqual(rest_adapter.coalesced_requests, 0)
@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+from buff163_unofficial_api.models import Item, PriceSnapshot
+from buff163_unofficial_api.snapshot_store import SnapshotStore
+from tests.payloads import make_item
+
+
+class TestSnapshotStore(TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(os.path.join(self.tmp.name, "s.sqlite3"))
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_record_items_and_raw_rows(self):
+        written = self.store.record([Item(**make_item(1)), make_item(2)], ts=100.0)
+        self.assertEqual(written, 2)
+        self.assertEqual(len(self.store), 2)
+
+    def test_prices_are_stored_in_cents(self):
+        self.store.record([make_item(1, sell_min_price="12.34")], ts=100.0)
+        snapshot = self.store.history(1)[0]
+        self.assertIsInstance(snapshot, PriceSnapshot)
+        self.assertEqual(snapshot.sell_min_price, 1234)
+
+    def test_history_is_time_ordered_and_bounded(self):
+        for ts in (300.0, 100.0, 200.0):
+            self.store.record([make_item(1), make_item(2)], ts=ts)
+        self.assertEqual([s.ts for s in self.store.history(1)], [100.0, 200.0, 300.0])
+        self.assertEqual(
+            [s.ts for s in self.store.history(1, start=150.0, end=300.0)], [200.0]
+        )
+
+    def test_latest_keeps_newest_snapshot_per_item(self):
+        self.store.record([make_item(1, sell_min_price="2")], ts=200.0)
+        self.store.record([make_item(1, sell_min_price="1"), make_item(2)], ts=100.0)
+        latest = self.store.latest()
+        self.assertEqual([s.goods_id for s in latest], [1, 2])
+        self.assertEqual(latest[0].ts, 200.0)
+        self.assertEqual(latest[0].sell_min_price, 200)
+        self.assertEqual([s.goods_id for s in self.store.latest([2])], [2])
+
+    def test_between_returns_every_item_in_range(self):
+        self.store.record([make_item(1), make_item(2)], ts=100.0)
+        self.store.record([make_item(1)], ts=200.0)
+        self.assertEqual(len(self.store.between(50.0, 150.0)), 2)
+
+    def test_record_batches_large_inputs(self):
+        self.store.batch_size = 7
+        written = self.store.record((make_item(i) for i in range(50)), ts=1.0)
+        self.assertEqual(written, 50)
+        self.assertEqual(len(self.store.latest()), 50)
+
+    def test_latest_of_many_ids_stays_under_variable_limit(self):
+        if hasattr(self.store._conn, "setlimit"):
+            self.store._conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        self.store.record((make_item(i) for i in range(1200)), ts=1.0)
+        latest = self.store.latest(range(2400))
+        self.assertEqual([s.goods_id for s in latest], list(range(1200)))
+
+    def test_history_query_uses_primary_key(self):
+        plan = self.store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM snapshots WHERE goods_id = ? "
+            "AND ts >= ? ORDER BY ts",
+            (1, 0.0),
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        self.assertIn("PRIMARY KEY", detail)
+        self.assertNotIn("TEMP B-TREE", detail)
@@ -0,0 +1,91 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from buff163_unofficial_api.buff163_unofficial_api import Buff163API
+from buff163_unofficial_api.cs_enums import Knife
+from buff163_unofficial_api.exceptions import Buff163Exception
+from buff163_unofficial_api.models import Item, MarketChange, Result
+from buff163_unofficial_api.watcher import MarketWatcher
+from tests.payloads import make_item, make_page
+
+
+class TestMarketWatcher(TestCase):
+    def setUp(self) -> None:
+        self.rows = [make_item(1), make_item(2), make_item(3)]
+        self.model = MagicMock(side_effect=lambda **row: Item(**row))
+        self.watcher = MarketWatcher(lambda: self.rows, model=self.model)
+
+    def kinds(self, changes):
+        return sorted((change.kind, change.goods_id) for change in changes)
+
+    def test_first_poll_reports_every_row_as_new(self):
+        changes = self.watcher.poll()
+        self.assertEqual(self.kinds(changes), [("new", 1), ("new", 2), ("new", 3)])
+        self.assertIsInstance(changes[0].item, Item)
+
+    def test_unchanged_rows_build_no_models(self):
+        self.watcher.poll()
+        self.model.reset_mock()
+        self.assertEqual(self.watcher.poll(), [])
+        self.model.assert_not_called()
+
+    def test_price_change_is_reported(self):
+        self.watcher.poll()
+        self.rows[1] = make_item(2, sell_min_price="99")
+        changes = self.watcher.poll()
+        self.assertEqual(self.kinds(changes), [("changed", 2)])
+        self.assertEqual(changes[0].item.sell_min_price, "99")
+        self.assertEqual(self.model.call_count, 4)
+
+    def test_unwatched_field_change_is_ignored(self):
+        self.watcher.poll()
+        self.rows[0] = dict(self.rows[0], name="renamed")
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_new_and_removed_items(self):
+        self.watcher.poll()
+        self.rows = [make_item(1), make_item(2), make_item(4)]
+        changes = self.watcher.poll()
+        self.assertEqual(self.kinds(changes), [("new", 4), ("removed", 3)])
+        removed = [c for c in changes if c.kind == MarketChange.REMOVED][0]
+        self.assertIsNone(removed.item)
+
+    def test_failed_poll_keeps_previous_state(self):
+        self.watcher.poll()
+
+        def failing():
+            yield make_item(1)
+            raise Buff163Exception("503: Service Unavailable")
+
+        self.watcher._fetch_rows = failing
+        with self.assertRaises(Buff163Exception):
+            self.watcher.poll()
+        self.assertEqual(len(self.watcher), 3)
+
+    def test_on_change_callback(self):
+        seen = []
+        watcher = MarketWatcher(lambda: self.rows, on_change=seen.append)
+        watcher.poll()
+        self.assertEqual(len(seen), 3)
+
+    def test_watch_yields_changes_across_polls(self):
+        polls = iter([[make_item(1)], [make_item(1, sell_min_price="5")]])
+        watcher = MarketWatcher(lambda: next(polls))
+        with patch("time.sleep") as sleep:
+            changes = list(watcher.watch(interval=10, max_polls=2))
+        self.assertEqual(self.kinds(changes), [("changed", 1), ("new", 1)])
+        sleep.assert_called_once()
+
+    def test_buff163api_watch_market_polls_categories(self):
+        buff163api = Buff163API()
+        buff163api._rest_adapter = MagicMock()
+        buff163api._rest_adapter.get.return_value = Result(
+            200, data=make_page([make_item(1)])
+        )
+        watcher = buff163api.watch_market(categories=[Knife.KARAMBIT, Knife.GUT])
+        changes = watcher.poll()
+        self.assertEqual(self.kinds(changes), [("new", 1)])
+        categories = [
+            call.kwargs["ep_params"]["category"]
+            for call in buff163api._rest_adapter.get.call_args_list
+        ]
+        self.assertEqual(categories, [Knife.KARAMBIT.value, Knife.GUT.value])